@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for SmartBudget.
+
+Not part of the installed package. Run modules from the repository root,
+e.g. ``python -m benchmarks.bench_record_construction``.
+"""
@@ -0,0 +1,84 @@
+"""
+Benchmark: durability cost per append, journal vs snapshot format.
+
+For a ledger of --rows records, times --appends single-record appends with:
+    journal             append_to_json(): one fsynced line in records.jsonl
+    snapshot (atomic)   full rewrite through save_to_json(): temp file,
+                        fsync, write-ahead marker, os.replace
+    snapshot (unsafe)   the pre-atomic behaviour: truncate records.json
+                        and json.dump without fsync, for reference
+
+Usage (from the repository root):
+    python -m benchmarks.bench_durability --rows 10000 --appends 50
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from smartbudget.file_io_module_3 import json_io, journal_io
+from smartbudget.file_io_module_3.file_utils import FILES_DIR
+from benchmarks.bench_record_construction import make_rows
+
+
+def per_append(label, appends, fn):
+    start = time.perf_counter()
+    for i in range(appends):
+        fn(i)
+    elapsed = (time.perf_counter() - start) / appends
+    print(f"{label:<24} {elapsed * 1000:10.3f} ms/append")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--appends", type=int, default=50)
+    args = parser.parse_args()
+
+    base = [json_io._record_from_dict(r, validate=False) for r in make_rows(args.rows)]
+    extra = [json_io._record_from_dict(r, validate=False) for r in make_rows(args.appends)]
+    print(f"rows: {args.rows:,}   appends: {args.appends}")
+
+    workdir = tempfile.mkdtemp(prefix="smartbudget-bench-")
+    old_cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+
+        # Never compact during the journal run: measure the append path only
+        journal_io.COMPACT_MIN_BYTES = float("inf")
+        json_io.save_to_json(base)
+        journal = per_append("journal", args.appends,
+                             lambda i: json_io.append_to_json([extra[i]]))
+
+        json_io.save_to_json(base)
+        ledger = list(base)
+
+        def rewrite_atomic(i):
+            ledger.append(extra[i])
+            json_io.save_to_json(ledger)
+
+        atomic = per_append("snapshot (atomic)", args.appends, rewrite_atomic)
+
+        ledger = list(base)
+        path = os.path.join(FILES_DIR, json_io.DEFAULT_FILENAME)
+
+        def rewrite_unsafe(i):
+            ledger.append(extra[i])
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([r.to_dict() for r in ledger], f, indent=4)
+
+        unsafe = per_append("snapshot (unsafe)", args.appends, rewrite_unsafe)
+
+        print(f"{'atomic vs unsafe rewrite':<24} {atomic / unsafe:10.1f} x")
+        print(f"{'atomic rewrite vs journal':<24} {atomic / journal:10.1f} x")
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: validated vs trusted record construction.
+
+Builds the same rows through the full validation chain (Income/Expense
+constructors) and through from_trusted_dict(), both for in-memory rows and
+for a full load_from_json() of a generated ledger.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_record_construction --rows 1000000
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from smartbudget.file_io_module_3 import json_io
+
+
+def make_rows(n):
+    """Deterministic mix of incomes and expenses as stored by to_dict()."""
+    rows = []
+    for i in range(n):
+        if i % 4 == 0:
+            rows.append({"type": "Income", "name": f"pay{i % 1000}",
+                         "amount": 1000.0 + i % 500, "source": "job"})
+        else:
+            rows.append({"type": "Expense", "name": f"item{i % 1000}",
+                         "amount": 5.0 + i % 200, "category": ("food", "rent", "travel")[i % 3]})
+    return rows
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:8.3f} s")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"rows: {args.rows:,}")
+
+    # GC is paused as in load_from_json so only construction cost is measured
+    with json_io._gc_paused():
+        slow, _ = timed("construct (validated)",
+                        lambda: [json_io._record_from_dict(r) for r in rows])
+        fast, _ = timed("construct (trusted)",
+                        lambda: [json_io._record_from_dict(r, validate=False) for r in rows])
+    print(f"{'construction speedup':<32} {slow / fast:8.1f} x")
+
+    # Full load through files/ inside a scratch working directory
+    workdir = tempfile.mkdtemp(prefix="smartbudget-bench-")
+    old_cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        json_io.save_to_json([json_io._record_from_dict(r, validate=False) for r in rows])
+        slow, _ = timed("load_from_json (validated)", lambda: json_io.load_from_json())
+        fast, _ = timed("load_from_json (validate=False)",
+                        lambda: json_io.load_from_json(validate=False))
+        print(f"{'load speedup':<32} {slow / fast:8.1f} x")
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
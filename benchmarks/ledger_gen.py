@@ -0,0 +1,147 @@
+"""
+Deterministic synthetic ledgers for benchmarks.
+
+Rows look like the ones to_dict() writes and follow rough household
+distributions: most records are small everyday expenses (food, transport,
+shopping), a few are large (rent, travel), and roughly one in ten is an
+income, mostly salary. Amounts are log-normal around a per-label median
+and timestamps advance through the covered period in order, so rollups
+and date ranges see realistic monthly data.
+
+The same (n, seed) always yields the same rows, so results from different
+runs and releases are comparable.
+
+Files are replaced atomically, never truncated in place, so hard-linked
+backups of an earlier file with the same name keep their contents. The
+command line refuses the app's own files (files/records.json and its
+companions, backup chains) and writes files/synthetic.json by default.
+
+Usage (from the repository root):
+    python -m benchmarks.ledger_gen --rows 1000000 --output big.json
+"""
+
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, atomic_write, ensure_files_dir
+from smartbudget.file_io_module_3.journal_io import journal_path
+
+DEFAULT_SEED = 533
+DEFAULT_OUTPUT = "synthetic.json"
+DEFAULT_START = datetime(2022, 1, 1)
+DEFAULT_DAYS = 3 * 365
+
+# (label, weight, names, median amount)
+EXPENSE_PROFILE = (
+    ("food", 30, ("Groceries", "Coffee", "Lunch", "Dinner out", "Bakery", "Takeaway"), 18.0),
+    ("transport", 15, ("Bus pass", "Fuel", "Taxi", "Parking", "Train ticket"), 12.0),
+    ("shopping", 12, ("Clothes", "Electronics", "Books", "Household items"), 45.0),
+    ("entertainment", 10, ("Cinema", "Streaming", "Concert", "Games"), 20.0),
+    ("utilities", 6, ("Electricity", "Water", "Internet", "Phone"), 70.0),
+    ("health", 5, ("Pharmacy", "Dentist", "Gym membership"), 40.0),
+    ("housing", 4, ("Rent", "Repairs", "Insurance"), 1100.0),
+    ("travel", 3, ("Flight", "Hotel", "Car rental"), 350.0),
+    ("education", 2, ("Tuition", "Course", "Stationery"), 150.0),
+)
+INCOME_PROFILE = (
+    ("job", 70, ("Salary", "Bonus", "Overtime"), 2800.0),
+    ("freelance", 15, ("Consulting", "Design work", "Tutoring"), 400.0),
+    ("investments", 8, ("Dividends", "Interest"), 60.0),
+    ("gift", 4, ("Birthday gift", "Family support"), 100.0),
+    ("refund", 3, ("Tax refund", "Store refund"), 80.0),
+)
+
+# Spread of the log-normal amounts (sigma of the underlying normal)
+AMOUNT_SIGMA = 0.6
+
+
+def _pick(rng: random.Random, profile, weights):
+    return rng.choices(profile, weights=weights)[0]
+
+
+def iter_rows(n: int, seed: int = DEFAULT_SEED, start: datetime = DEFAULT_START,
+              days: int = DEFAULT_DAYS, income_share: float = 0.1,
+              undated_share: float = 0.0) -> Iterator[dict]:
+    """
+    Yield n stored-format rows. Timestamps increase from `start` over
+    `days`; `undated_share` of the rows carry no timestamp.
+    """
+    rng = random.Random(seed)
+    expense_weights = [p[1] for p in EXPENSE_PROFILE]
+    income_weights = [p[1] for p in INCOME_PROFILE]
+    step = timedelta(days=days) / max(n, 1)
+
+    for i in range(n):
+        if rng.random() < income_share:
+            label, _, names, median = _pick(rng, INCOME_PROFILE, income_weights)
+            row = {"type": "Income", "name": rng.choice(names), "amount": 0.0, "source": label}
+        else:
+            label, _, names, median = _pick(rng, EXPENSE_PROFILE, expense_weights)
+            row = {"type": "Expense", "name": rng.choice(names), "amount": 0.0, "category": label}
+
+        row["amount"] = max(0.01, round(median * rng.lognormvariate(0.0, AMOUNT_SIGMA), 2))
+        if rng.random() >= undated_share:
+            row["timestamp"] = (start + step * i).replace(microsecond=0).isoformat()
+        yield row
+
+
+def generate_rows(n: int, seed: int = DEFAULT_SEED, **kwargs) -> list:
+    """iter_rows() as a list."""
+    return list(iter_rows(n, seed, **kwargs))
+
+
+def write_ledger(n: int, filename: str = DEFAULT_OUTPUT, seed: int = DEFAULT_SEED,
+                 journal_rows: int = 0, **kwargs) -> str:
+    """
+    Write a synthetic ledger of n rows to files/filename, streaming so that
+    10M-row ledgers never sit in memory. The last `journal_rows` rows go to
+    the append-only journal instead of the snapshot. Returns the snapshot path.
+    Both files are written through atomic_write(), so an existing file is
+    replaced, not overwritten (hard links to it keep the old contents).
+    """
+    ensure_files_dir()
+    path = os.path.join(FILES_DIR, filename)
+    snapshot_rows = n - journal_rows
+    rows = iter_rows(n, seed, **kwargs)
+
+    with atomic_write(path) as f:
+        f.write("[")
+        for i in range(snapshot_rows):
+            f.write(",\n    " if i else "\n    ")
+            f.write(json.dumps(next(rows), ensure_ascii=False))
+        f.write("\n]" if snapshot_rows else "]")
+
+    journal = journal_path(filename)
+    if journal_rows:
+        with atomic_write(journal) as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    elif os.path.exists(journal):
+        os.remove(journal)
+
+    return path
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--journal-rows", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="file name inside files/")
+    args = parser.parse_args(argv)
+
+    from smartbudget.core_module_2.file_io_data_controller import is_system_file
+
+    if is_system_file(args.output):
+        parser.error(f"refusing to overwrite {args.output}, a file the app manages")
+
+    path = write_ledger(args.rows, args.output, args.seed, args.journal_rows)
+    print(f"Wrote {args.rows:,} rows to {path} ({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
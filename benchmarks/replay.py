@@ -0,0 +1,317 @@
+"""
+Replay a scripted menu session and measure each menu action.
+
+A script is the sequence of answers a user types into the interactive menu
+(app_menu_controller.run()), grouped by menu action:
+
+    {"name": "...", "steps": [
+        {"action": "add_income", "inputs": ["1", "Salary", "3000", "job"]},
+        {"action": "summary", "inputs": ["3"]},
+        {"action": "exit", "inputs": ["0"]}]}
+
+The session runs against a synthetic ledger (benchmarks.ledger_gen) in a
+scratch directory with input() fed from the script and the menu's output
+captured. An action is measured from the menu choice until the menu asks
+for the next choice, so it covers exactly what the user waits for:
+
+    seconds        wall-clock latency
+    read_bytes     bytes read through read() calls (/proc/self/io rchar)
+    write_bytes    bytes written through write() calls (wchar)
+    peak_bytes     peak Python allocation during the action, above what
+                   was allocated when it started (tracemalloc)
+
+tracemalloc slows the interpreter down, so memory is measured in a second
+replay of the same script and never inflates the latency figures. The I/O
+counters need Linux procfs and are reported as null elsewhere.
+
+--record captures a live session into a new script instead.
+
+Usage (from the repository root):
+    python -m benchmarks.replay --rows 100000 --output replay.json
+    python -m benchmarks.replay --script my-session.json --repeat 5
+    python -m benchmarks.replay --record my-session.json
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+from benchmarks.ledger_gen import DEFAULT_SEED, write_ledger
+
+DEFAULT_SCRIPT = os.path.join(os.path.dirname(__file__), "scripts", "session.json")
+DEFAULT_ROWS = 10_000
+DEFAULT_REPEAT = 3
+
+# The prompt run() shows before every menu choice
+MENU_PROMPT = "Enter your choice"
+
+_PROC_IO = "/proc/self/io"
+
+
+class ReplayError(BaseException):
+    """
+    The app and the script disagree (missing or unused answers).
+    A BaseException so the menu's `except Exception` handlers let it through.
+    """
+
+
+# --------------------------------------------------------
+# Scripts
+# --------------------------------------------------------
+def load_script(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        script = json.load(f)
+    for step in script["steps"]:
+        if not step.get("inputs"):
+            raise ValueError(f"Step {step.get('action')!r} in {path} has no inputs")
+    return script
+
+
+def record_session(path: str) -> dict:
+    """Run the real menu interactively and save every answer as a script."""
+    from smartbudget.core_module_2 import app_menu_controller
+
+    steps: List[dict] = []
+    real_input = builtins.input
+
+    def recording_input(prompt=""):
+        answer = real_input(prompt)
+        if prompt.startswith(MENU_PROMPT) or not steps:
+            action = app_menu_controller.MENU_ACTIONS.get(answer.strip(), "invalid")
+            steps.append({"action": action, "inputs": []})
+        steps[-1]["inputs"].append(answer)
+        return answer
+
+    with patch("builtins.input", recording_input):
+        app_menu_controller.run()
+
+    script = {"name": os.path.splitext(os.path.basename(path))[0], "steps": steps}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(script, f, indent=4)
+    return script
+
+
+# --------------------------------------------------------
+# Measurement
+# --------------------------------------------------------
+def _io_counters() -> Optional[Dict[str, int]]:
+    try:
+        with open(_PROC_IO, "r", encoding="ascii") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None
+    return {"read": int(fields["rchar"]), "write": int(fields["wchar"])}
+
+
+class _Meter:
+    """Measures one step at a time; the stopwatch runs between start() and stop()."""
+
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.results: List[dict] = []
+        self._step = None
+
+    def start(self, index: int, action: str):
+        self._step = {"index": index, "action": action}
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+        self._io = _io_counters()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        if self._step is None:
+            return
+        elapsed = time.perf_counter() - self._start
+        io_end = _io_counters()
+        step, self._step = self._step, None
+
+        if self.trace_memory:
+            step["peak_bytes"] = tracemalloc.get_traced_memory()[1] - self._baseline
+        else:
+            step["seconds"] = elapsed
+            has_io = self._io is not None and io_end is not None
+            step["read_bytes"] = io_end["read"] - self._io["read"] if has_io else None
+            step["write_bytes"] = io_end["write"] - self._io["write"] if has_io else None
+        self.results.append(step)
+
+
+def _close_figures():
+    # The chart action leaves its figure open under a non-interactive backend
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close("all")
+
+
+def replay_once(script: dict, trace_memory: bool = False) -> List[dict]:
+    """
+    Feed the script to app_menu_controller.run() in the current directory.
+    Returns one measurement dict per step.
+    """
+    from smartbudget.core_module_2 import app_menu_controller
+
+    steps = script["steps"]
+    meter = _Meter(trace_memory)
+    state = {"step": -1, "pending": []}
+
+    def scripted_input(prompt=""):
+        if prompt.startswith(MENU_PROMPT):
+            meter.stop()
+            _close_figures()
+            if state["pending"]:
+                raise ReplayError(
+                    f"Step {state['step']} ({steps[state['step']]['action']}) left "
+                    f"{len(state['pending'])} answer(s) unused"
+                )
+            state["step"] += 1
+            if state["step"] >= len(steps):
+                raise ReplayError("Script ended before the session exited (add a final '0')")
+            state["pending"] = list(steps[state["step"]]["inputs"])
+            answer = state["pending"].pop(0)
+            meter.start(state["step"], steps[state["step"]]["action"])
+            return answer
+
+        if not state["pending"]:
+            raise ReplayError(f"Step {state['step']} has no answer for prompt {prompt!r}")
+        return state["pending"].pop(0)
+
+    captured = io.StringIO()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with patch("builtins.input", scripted_input), contextlib.redirect_stdout(captured):
+            app_menu_controller.run()
+        meter.stop()
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        _close_figures()
+
+    if state["step"] != len(steps) - 1 or state["pending"]:
+        raise ReplayError(f"Session exited at step {state['step']} of {len(steps)}")
+    return meter.results
+
+
+@contextlib.contextmanager
+def scratch_ledger(rows: int, seed: int = DEFAULT_SEED):
+    """Temporary working directory holding files/records.json with `rows` records."""
+    from smartbudget.file_io_module_3.json_io import clear_record_cache
+
+    workdir = tempfile.mkdtemp(prefix="smartbudget-replay-")
+    old_cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        clear_record_cache()
+        write_ledger(rows, "records.json", seed)
+        yield workdir
+    finally:
+        clear_record_cache()
+        os.chdir(old_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def replay(script: dict, rows: int = DEFAULT_ROWS, repeat: int = DEFAULT_REPEAT,
+           seed: int = DEFAULT_SEED, memory: bool = True) -> List[dict]:
+    """
+    Replay the script `repeat` times (each on a fresh ledger) and return one
+    row per step: the fastest run's latency and I/O, plus the peak memory
+    of a separate traced run.
+    """
+    runs = []
+    for _ in range(repeat):
+        with scratch_ledger(rows, seed):
+            runs.append(replay_once(script))
+
+    steps = [dict(min(candidates, key=lambda s: s["seconds"])) for candidates in zip(*runs)]
+    for step, candidates in zip(steps, zip(*runs)):
+        step["mean_seconds"] = sum(s["seconds"] for s in candidates) / len(candidates)
+
+    if memory:
+        with scratch_ledger(rows, seed):
+            for step, traced in zip(steps, replay_once(script, trace_memory=True)):
+                step["peak_bytes"] = traced["peak_bytes"]
+    return steps
+
+
+def summarize(steps: List[dict]) -> Dict[str, dict]:
+    """Per action: number of steps and the worst latency, I/O and memory among them."""
+    summary: Dict[str, dict] = {}
+    for step in steps:
+        entry = summary.setdefault(step["action"], {"steps": 0})
+        entry["steps"] += 1
+        for key in ("seconds", "read_bytes", "write_bytes", "peak_bytes"):
+            value = step.get(key)
+            if value is not None:
+                entry[key] = max(entry.get(key, value), value)
+    return summary
+
+
+def _fmt_bytes(value) -> str:
+    if value is None:
+        return "n/a"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024 or unit == "GiB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+def print_report(steps: List[dict]):
+    print(f"{'#':>3}  {'action':<20}{'latency':>12}{'read':>12}{'written':>12}{'peak mem':>12}")
+    for step in steps:
+        print(f"{step['index']:>3}  {step['action']:<20}{step['seconds'] * 1000:>9.2f} ms"
+              f"{_fmt_bytes(step.get('read_bytes')):>12}{_fmt_bytes(step.get('write_bytes')):>12}"
+              f"{_fmt_bytes(step.get('peak_bytes')):>12}")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--script", default=DEFAULT_SCRIPT)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="records in the generated ledger")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced memory replay")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--record", metavar="PATH", help="record a live session into a script")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        script = record_session(args.record)
+        print(f"Recorded {len(script['steps'])} steps to {args.record}")
+        return 0
+
+    # Charts are drawn off-screen during a replay
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    script = load_script(args.script)
+    steps = replay(script, args.rows, args.repeat, args.seed, memory=not args.no_memory)
+
+    print(f"script: {script.get('name', args.script)}   rows: {args.rows:,}   repeat: {args.repeat}\n")
+    print_report(steps)
+
+    if args.output:
+        report = {
+            "script": script.get("name", args.script),
+            "rows": args.rows,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "steps": steps,
+            "actions": summarize(steps),
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+Benchmark suite: SmartBudget operations at several ledger sizes.
+
+For every size a synthetic ledger (benchmarks.ledger_gen) is written to a
+scratch files/ directory and each case is timed --repeat times:
+
+    load_from_json            full validated load (record cache cleared)
+    load_from_json_trusted    validate=False load
+    load_split                insights._load_split(), the analysis entry point
+    budget_balance            summary.budget_balance() over the whole ledger
+    load_totals               running totals answered from the totals store
+    totals_rebuild            full serial recompute of the totals (iter_raw_records)
+    load_parallel             parallel_io.load_parallel() on --workers processes
+    totals_parallel           parallel_io.totals_parallel() on --workers processes
+    expense_details           insights.expense_details()
+    income_details            insights.income_details()
+    plot_aggregation          category totals behind the expense chart (no rendering)
+    backup                    copy-on-write backup (backup_io.backup_ledger)
+    backup_incremental        delta backup after one appended record
+    append                    append_to_json() of a single record
+
+The parallel cases are worth comparing with load_from_json and
+totals_rebuild only on a machine with several CPUs; --workers defaults to
+the CPU count.
+
+Results are printed as a table and, with --output, written as JSON
+({"meta": ..., "results": [{"case", "size", "best", "mean", "runs"}]},
+seconds per operation). --compare flags cases slower than a previous
+results file by more than --threshold (ignoring cases under a millisecond,
+which are mostly noise) and exits with status 1.
+
+Usage (from the repository root):
+    python -m benchmarks.suite --sizes 10000,100000 --output bench.json
+    python -m benchmarks.suite --sizes 1000000,10000000 --repeat 1
+    python -m benchmarks.suite --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from smartbudget.analysis_module_1 import insights, summary
+from smartbudget.entity.expense import Expense
+from smartbudget.file_io_module_3 import aggregate_store, backup_chain, backup_io, json_io, parallel_io
+from benchmarks.ledger_gen import DEFAULT_SEED, write_ledger
+
+DEFAULT_SIZES = (10_000, 100_000)
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 1.25
+# Cases faster than this are too noisy to flag as regressions
+DEFAULT_NOISE_FLOOR = 0.001
+APPENDS_PER_RUN = 20
+RESULTS_VERSION = 1
+
+
+class Case:
+    """One timed operation; setup() runs untimed before every run."""
+
+    def __init__(self, name: str, run: Callable[[], object],
+                 setup: Optional[Callable[[], None]] = None, ops: int = 1):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.ops = ops
+
+    def measure(self, repeat: int) -> List[float]:
+        runs = []
+        for _ in range(repeat):
+            if self.setup is not None:
+                self.setup()
+            start = time.perf_counter()
+            self.run()
+            runs.append((time.perf_counter() - start) / self.ops)
+        return runs
+
+
+def _cold():
+    json_io.clear_record_cache()
+
+
+def _append_records(count: int):
+    for i in range(count):
+        json_io.append_to_json([Expense(f"bench{i}", 9.99, "food", datetime.now())])
+
+
+def build_cases(workers: Optional[int] = None) -> List[Case]:
+    """Cases in run order; the ones that grow the ledger come last."""
+    workers = workers or parallel_io.default_workers()
+    expenses: list = []
+
+    def split_expenses():
+        _cold()
+        expenses[:] = insights._load_split()[1]
+
+    def prepare_incremental():
+        _append_records(1)
+
+    return [
+        Case("load_from_json", json_io.load_from_json, _cold),
+        Case("load_from_json_trusted", lambda: json_io.load_from_json(validate=False), _cold),
+        Case("load_split", insights._load_split, _cold),
+        Case("budget_balance", summary.budget_balance, _cold),
+        Case("load_totals", json_io.load_totals, lambda: json_io.load_totals()),
+        Case("totals_rebuild", lambda: aggregate_store.aggregate_rows(json_io.iter_raw_records())),
+        Case("load_parallel", lambda: parallel_io.load_parallel(workers=workers), _cold),
+        Case("totals_parallel", lambda: parallel_io.totals_parallel(workers=workers)),
+        Case("expense_details", insights.expense_details, _cold),
+        Case("income_details", insights.income_details, _cold),
+        Case("plot_aggregation", lambda: insights._group_totals(expenses, "category"), split_expenses),
+        Case("backup", lambda: backup_io.backup_ledger(json_io.DEFAULT_FILENAME, "bench-backup.json")),
+        Case("backup_incremental", backup_chain.backup_incremental, prepare_incremental),
+        Case("append", lambda: _append_records(APPENDS_PER_RUN), ops=APPENDS_PER_RUN),
+    ]
+
+
+def run_size(size: int, repeat: int, seed: int, cases: Optional[List[str]] = None,
+             workers: Optional[int] = None) -> List[dict]:
+    """Time every case against a fresh ledger of `size` rows."""
+    results = []
+    workdir = tempfile.mkdtemp(prefix="smartbudget-bench-")
+    old_cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        _cold()
+        write_ledger(size, json_io.DEFAULT_FILENAME, seed)
+        backup_chain.backup_incremental()  # the incremental case measures deltas
+
+        for case in build_cases(workers):
+            if cases and case.name not in cases:
+                continue
+            runs = case.measure(repeat)
+            results.append({
+                "case": case.name,
+                "size": size,
+                "best": min(runs),
+                "mean": sum(runs) / len(runs),
+                "runs": runs,
+            })
+            print(f"{case.name:<26}{size:>12,}{min(runs) * 1000:>14.3f} ms")
+    finally:
+        _cold()
+        os.chdir(old_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def metadata(sizes, repeat: int, seed: int) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "sizes": list(sizes),
+        "repeat": repeat,
+        "seed": seed,
+    }
+
+
+def compare(results: List[dict], baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+            noise_floor: float = DEFAULT_NOISE_FLOOR) -> List[dict]:
+    """Cases whose best time exceeds the baseline's by more than `threshold` x."""
+    previous: Dict[tuple, dict] = {(r["case"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+
+    print(f"\n{'case':<26}{'size':>12}{'ratio':>10}")
+    for result in results:
+        old = previous.get((result["case"], result["size"]))
+        if old is None or old["best"] <= 0:
+            continue
+        ratio = result["best"] / old["best"]
+        regressed = ratio > threshold and result["best"] >= noise_floor
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{result['case']:<26}{result['size']:>12,}{ratio:>9.2f}x{flag}")
+        if regressed:
+            regressions.append({**result, "baseline": old["best"], "ratio": ratio})
+    return regressions
+
+
+def _sizes(text: str) -> List[int]:
+    return [int(s.replace("_", "")) for s in text.split(",") if s.strip()]
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=_sizes, default=list(DEFAULT_SIZES),
+                        help="comma-separated ledger sizes, e.g. 10000,1000000")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--cases", type=lambda s: [c.strip() for c in s.split(",") if c.strip()],
+                        help="only run these cases (comma-separated)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes for the parallel cases (default: CPU count)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<26}{'size':>12}{'best':>17}")
+    results = []
+    for size in args.sizes:
+        results.extend(run_size(size, args.repeat, args.seed, args.cases, args.workers))
+
+    report = {"meta": metadata(args.sizes, args.repeat, args.seed), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
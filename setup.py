@@ -7,7 +7,7 @@ setup(
     description="SmartBudget: A simple budgeting tool for MDS 533 Step 3 project",
     author="Chongwen Sun, Yifu Zhao,Chuying Chen",
     author_email="chongwen.sun1992@gmail.com",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
     install_requires=[],
     python_requires=">=3.8",
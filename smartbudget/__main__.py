@@ -0,0 +1,97 @@
+"""
+Command-line entry point: ``python -m smartbudget``.
+
+Without arguments the interactive menu starts (same as main.py).
+
+Subcommands:
+    import PATH     bulk-load records from a .csv or .jsonl file
+    report [FILE..] combined totals across backup ledgers in files/
+
+--stats prints a timing report of the session's hot paths on exit
+(--stats-file also writes it as JSON); see smartbudget.stats.
+--profile DIR writes a Chrome trace of every menu action (--cprofile adds
+one .pstats file per action); see smartbudget.profiling.
+"""
+
+import argparse
+import sys
+
+from smartbudget import profiling, stats
+
+from smartbudget.core_module_2.app_menu_controller import run
+from smartbudget.core_module_2.file_io_data_controller import FileIoDataStorageController
+from smartbudget.core_module_2.batch_import_controller import (
+    BatchImportController,
+    DEFAULT_BATCH_SIZE,
+)
+from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.file_io_module_3.storage import open_storage
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m smartbudget",
+                                     description="SmartBudget household budgeting tool.")
+    parser.add_argument("--stats", action="store_true",
+                        help="print timing stats on exit (or set $SMARTBUDGET_STATS)")
+    parser.add_argument("--stats-file", metavar="PATH", default=None,
+                        help="also write the stats report as JSON to PATH")
+    parser.add_argument("--profile", metavar="DIR", default=None,
+                        help="write a Chrome trace of each menu action to DIR "
+                             "(or set $SMARTBUDGET_PROFILE)")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="with --profile, also save a cProfile .pstats file per action")
+    commands = parser.add_subparsers(dest="command")
+
+    imp = commands.add_parser("import", help="bulk-import records from CSV or JSON Lines")
+    imp.add_argument("path", help="input file (.csv with type,name,amount,category,source "
+                                  "columns, or .jsonl)")
+    imp.add_argument("--into", default=None,
+                     help="ledger file inside files/ (default: the backend's records file)")
+    imp.add_argument("--storage", choices=("json", "sqlite"), default=None,
+                     help="ledger backend (default: $SMARTBUDGET_STORAGE or json)")
+    imp.add_argument("--batch-size", type=int, default=None,
+                     help="rows validated between progress messages")
+    imp.add_argument("--dry-run", action="store_true",
+                     help="validate and report without writing anything")
+
+    rep = commands.add_parser("report", help="combined totals across ledger files")
+    rep.add_argument("files", nargs="*",
+                     help="ledger files inside files/ (default: every backup)")
+    rep.add_argument("--workers", type=int, default=None,
+                     help="worker processes (default: one per file, up to the CPU count)")
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.stats or args.stats_file:
+        stats.enable(args.stats_file)
+    if args.profile:
+        profiling.start(args.profile, args.cprofile)
+
+    if args.command == "import":
+        try:
+            storage = open_storage(args.storage, args.into)
+        except SmartBudgetError as e:
+            print(f"❌ Import failed: {e}")
+            return 1
+        try:
+            report = BatchImportController().run_import(
+                args.path, storage.filename, args.batch_size or DEFAULT_BATCH_SIZE,
+                args.dry_run, storage=storage,
+            )
+        finally:
+            storage.close()
+        return 0 if report is not None and not report.errors else 1
+
+    if args.command == "report":
+        ok = FileIoDataStorageController().show_ledger_report(args.files or None, args.workers)
+        return 0 if ok else 1
+
+    return 0 if run() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
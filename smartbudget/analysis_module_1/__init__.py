@@ -11,6 +11,11 @@ from .insights import (
     plot_expense_by_category
 )
 
+from .session import AnalysisSession
+from .date_index import DateIndex
+from .trends import monthly_totals, category_trend, source_trend
+from .multi_ledger import aggregate_ledgers
+
 
 
 
@@ -26,5 +31,19 @@ __all__ = [
 
     # optional plotting functions (if present)
     "plot_expense_by_category",
+
+    # single-load analysis
+    "AnalysisSession",
+
+    # timestamp range queries
+    "DateIndex",
+
+    # monthly rollups
+    "monthly_totals",
+    "category_trend",
+    "source_trend",
+
+    # map-reduce across ledger files
+    "aggregate_ledgers",
 ]
 
@@ -0,0 +1,124 @@
+"""
+Date index for SmartBudget records.
+
+A DateIndex keeps the dated records sorted by timestamp together with
+running (prefix) sums of income and expenses. Range questions such as
+"expenses in March" or "balance as of 2025-03-31" are answered with two
+binary searches instead of a scan over the whole ledger. Undated records
+(stored before timestamps existed) are kept aside in `undated`.
+
+Ranges are half-open: between(start, end) covers start <= t < end.
+"""
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from operator import attrgetter
+from typing import Iterable, List, Optional, Tuple
+from smartbudget.entity.base_record import parse_timestamp
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+logger = logging.getLogger(__name__)
+
+
+def _is_day(value) -> bool:
+    """True for a bare date (date object or "YYYY-MM-DD"), i.e. a whole day."""
+    if isinstance(value, str):
+        return len(value.strip()) == 10
+    return isinstance(value, date) and not isinstance(value, datetime)
+
+
+def month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """[first instant of the month, first instant of the next month)."""
+    start = datetime(year, month, 1)
+    end = datetime(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+class DateIndex:
+    """Sorted, binary-searchable view of records by timestamp."""
+
+    def __init__(self, records: Iterable[object]):
+        dated, self.undated = [], []
+        for r in records:
+            (dated if getattr(r, "timestamp", None) is not None else self.undated).append(r)
+
+        dated.sort(key=attrgetter("timestamp"))
+        self._records: List[object] = dated
+        self._keys: List[datetime] = [r.timestamp for r in dated]
+
+        # _income_sums[i] = income of the first i dated records (same for expenses)
+        self._income_sums = list(accumulate(
+            (r.amount if isinstance(r, Income) else 0.0 for r in dated), initial=0.0))
+        self._expense_sums = list(accumulate(
+            (r.amount if isinstance(r, Expense) else 0.0 for r in dated), initial=0.0))
+
+        logger.info(f"[date_index] Indexed {len(dated)} dated records "
+                    f"({len(self.undated)} undated)")
+
+    def __len__(self):
+        return len(self._records)
+
+    # --------------------------------------------------------
+    # Positions
+    # --------------------------------------------------------
+    def _position(self, when, inclusive: bool) -> int:
+        """Index of the first record after `when` (or at it, if not inclusive)."""
+        stamp = parse_timestamp(when)
+        if inclusive and _is_day(when):
+            # a bare date covers the whole day
+            return bisect_left(self._keys, stamp + timedelta(days=1))
+        if inclusive:
+            return bisect_right(self._keys, stamp)
+        return bisect_left(self._keys, stamp)
+
+    def _bounds(self, start, end) -> Tuple[int, int]:
+        lo = 0 if start is None else self._position(start, inclusive=False)
+        hi = len(self._keys) if end is None else self._position(end, inclusive=False)
+        return lo, max(lo, hi)
+
+    # --------------------------------------------------------
+    # Range queries
+    # --------------------------------------------------------
+    def between(self, start=None, end=None) -> List[object]:
+        """Records with start <= timestamp < end, oldest first."""
+        lo, hi = self._bounds(start, end)
+        return self._records[lo:hi]
+
+    def incomes_between(self, start=None, end=None) -> List[Income]:
+        return [r for r in self.between(start, end) if isinstance(r, Income)]
+
+    def expenses_between(self, start=None, end=None) -> List[Expense]:
+        return [r for r in self.between(start, end) if isinstance(r, Expense)]
+
+    def month(self, year: int, month: int) -> List[object]:
+        """Records dated in the given calendar month."""
+        return self.between(*month_bounds(year, month))
+
+    # --------------------------------------------------------
+    # Aggregates (prefix sums, no scan)
+    # --------------------------------------------------------
+    def totals_between(self, start=None, end=None) -> Tuple[float, float]:
+        """(income, expenses) of the records in [start, end)."""
+        lo, hi = self._bounds(start, end)
+        return (
+            self._income_sums[hi] - self._income_sums[lo],
+            self._expense_sums[hi] - self._expense_sums[lo],
+        )
+
+    def balance_as_of(self, when) -> float:
+        """
+        Income minus expenses of every dated record up to and including
+        `when`. A bare date includes the whole of that day.
+        """
+        pos = self._position(when, inclusive=True)
+        balance = self._income_sums[pos] - self._expense_sums[pos]
+        logger.info(f"[date_index] Balance as of {when}: {balance}")
+        return balance
+
+    def first_date(self) -> Optional[datetime]:
+        return self._keys[0] if self._keys else None
+
+    def last_date(self) -> Optional[datetime]:
+        return self._keys[-1] if self._keys else None
@@ -0,0 +1,92 @@
+"""
+Batched validation diagnostics for SmartBudget analysis.
+
+Validation passes do not log each bad record. They add it to a
+ValidationReport, which keeps a count per problem kind and the first few
+offending records, and the report is logged once, as a single line, when
+the pass is over:
+
+    [analysis_module_1] 1203 invalid record(s) in records.json:
+    unsupported_type=1200, invalid_amount=3; sample: RecordBase(...), ...
+
+The line is only formatted if a handler actually emits it, so a corrupted
+ledger costs a counter increment per bad record, not a log call.
+"""
+import logging
+from typing import Dict, List, Tuple
+from smartbudget import stats
+
+# Problem kinds
+UNSUPPORTED_TYPE = "unsupported_type"
+MISSING_AMOUNT = "missing_amount"
+INVALID_AMOUNT = "invalid_amount"
+UNREADABLE_AMOUNT = "unreadable_amount"
+
+# Offending records kept for the report, across all kinds
+SAMPLE_SIZE = 5
+# Longest repr shown for one sampled record
+_SAMPLE_WIDTH = 80
+
+_MISSING = object()
+
+
+class ValidationReport:
+    """Problem counts and a capped sample of offending records for one pass."""
+
+    __slots__ = ("source", "sample_size", "counts", "samples")
+
+    def __init__(self, source: str = "records", sample_size: int = SAMPLE_SIZE):
+        self.source = source
+        self.sample_size = sample_size
+        self.counts: Dict[str, int] = {}
+        self.samples: List[Tuple[str, object]] = []
+
+    def add(self, kind: str, record: object) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        if len(self.samples) < self.sample_size:
+            self.samples.append((kind, record))
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.counts)
+
+    def __str__(self) -> str:
+        counts = ", ".join(f"{kind}={n}" for kind, n in self.counts.items())
+        sample = ", ".join(_short_repr(record) for _, record in self.samples)
+        return f"{self.total} invalid record(s) in {self.source}: {counts}; sample: {sample}"
+
+    def emit(self, logger: logging.Logger, prefix: str, level: str = "warning") -> bool:
+        """
+        Log the report as one line at `level` (a logger method name) and add
+        the counts to smartbudget.stats. Does nothing for a clean pass.
+        """
+        if not self.counts:
+            return False
+        for kind, n in self.counts.items():
+            stats.count(f"validate.{kind}", n)
+        # self is formatted lazily, only if the record is handled
+        getattr(logger, level)("%s %s", prefix, self)
+        return True
+
+
+def _short_repr(record: object) -> str:
+    try:
+        text = repr(record)
+    except Exception:
+        text = f"<{type(record).__name__}>"
+    return text if len(text) <= _SAMPLE_WIDTH else text[:_SAMPLE_WIDTH - 3] + "..."
+
+
+def check_amount(record: object, report: ValidationReport) -> bool:
+    """True if record.amount exists and is numeric; otherwise note it in report."""
+    amount = getattr(record, "amount", _MISSING)
+    if amount is _MISSING:
+        report.add(MISSING_AMOUNT, record)
+        return False
+    if not isinstance(amount, (int, float)):
+        report.add(INVALID_AMOUNT, record)
+        return False
+    return True
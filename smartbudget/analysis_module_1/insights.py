@@ -8,94 +8,71 @@ Additional notes:
 - Added short comments to document intermediate steps where previously implicit.
 """
 import logging
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import  Expense
-from smartbudget.file_io_module_3.json_io import load_from_json
-import matplotlib.pyplot as plt
+from smartbudget.entity.labels import CATEGORIES, SOURCES
+from smartbudget.file_io_module_3.json_io import load_from_json, DEFAULT_FILENAME
+from smartbudget.analysis_module_1.diagnostics import (
+    UNSUPPORTED_TYPE,
+    ValidationReport,
+    check_amount,
+)
+from smartbudget import stats
 
 logger = logging.getLogger(__name__)
+
+# Shared registries behind each groupable record attribute
+_LABEL_REGISTRIES = {"category": CATEGORIES, "source": SOURCES}
 # ======================================
 # Internal helpers
 # ======================================
 
 
 
-def plot_expense_by_category():
+def plot_expense_by_category(records: Optional[Iterable[object]] = None):
     """
     Generate a bar plot summarizing total expenses by category.
+    `records` defaults to the stored ledger (records.json).
 
     Notes:
     - Uses aggregation over Expense records.
     - Handles both single-category and multi-category cases.
+    - matplotlib is imported here, on first use, via the plotting module,
+      so importing smartbudget (and starting the CLI) does not load it.
     """
-    _, expenses = _load_split()
-
+    if records is None:
+        _, expenses = _load_split()
+    else:
+        expenses = [r for r in records if isinstance(r, Expense)]
 
-    category_totals = {}
-    for e in expenses:
-        value = abs(e.amount)
-        category_totals[e.category] = category_totals.get(e.category, 0) + value
+    category_totals = _group_totals(expenses, "category")
 
     if not category_totals:
         print("\n(No expenses available for plotting)")
         return
 
-    cats = list(category_totals.keys())
-    vals = list(category_totals.values())
-
-    plt.figure(figsize=(8, 5))
-
-    if len(cats) == 1:
-        bar_width = 0.2
-        x = [0]
-        bars = plt.bar(x, vals, width=bar_width, color="#4a90e2")
-        plt.xticks(x, cats)
-    else:
-        bars = plt.bar(cats, vals, color="#4a90e2")
-
+    from smartbudget.analysis_module_1.plotting import plot_category_totals
+    plot_category_totals(category_totals)
 
-    plt.title("Expenses by Category", fontsize=14)
-    plt.xlabel("Category", fontsize=12)
-    plt.ylabel("Amount ($)", fontsize=12)
-    plt.xticks(rotation=30)
 
-
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            height + height * 0.02,
-            f"{height:.0f}",
-            ha='center',
-            va='bottom',
-            fontsize=10
-        )
-
-    plt.tight_layout()
-    plt.show()
-
-def _validate_record_types(records: List[object]) -> None:
+@stats.timed("validate.split")
+def _split_records(
+    records: Iterable[object], report: Optional[ValidationReport] = None
+) -> Tuple[List[Income], List[Expense]]:
     """
-    Validate that the records loaded from file belong to supported classes.
-    Log warnings for invalid entries instead of failing silently.
-    This improves robustness when handling user-modified or corrupted data.
-    """
-    for r in records:
-        if not isinstance(r, (Income, Expense)):
-            logger.warning(
-                f"[analysis_module_1] Ignored unsupported record type: {type(r).__name__} — {r}"
-            )
-
-
-def _split_records(records: List[object]) -> Tuple[List[Income], List[Expense]]:
-    """
-    Split raw record list into Income and Expense lists with internal validation.
+    Split raw records into Income and Expense lists with internal validation.
+    Accepts any iterable (e.g. iter_records()) and consumes it once.
     Raw ordering is preserved.
-    Unrecognized entries are safely skipped and logged at debug level.
+
+    This is the single validation pass: unsupported entries are skipped and
+    records without a numeric amount are noted (but kept). Problems go into
+    `report` for the caller to emit; without one they are summarised in a
+    single debug line.
     """
     incomes: List[Income] = []
     expenses: List[Expense] = []
+    issues = ValidationReport() if report is None else report
 
     for r in records:
         if isinstance(r, Income):
@@ -103,28 +80,33 @@ def _split_records(records: List[object]) -> Tuple[List[Income], List[Expense]]:
         elif isinstance(r, Expense):
             expenses.append(r)
         else:
-            logger.debug(f"[analysis_module_1] Skipping unrecognized record: {r}")
+            issues.add(UNSUPPORTED_TYPE, r)
+            continue
+        check_amount(r, issues)
 
+    if report is None:
+        issues.emit(logger, "[analysis_module_1]", "debug")
     return incomes, expenses
 
 
-def _load_split() -> Tuple[List[Income], List[Expense]]:
+@stats.timed("analysis.load_split")
+def _load_split(filename: str = DEFAULT_FILENAME) -> Tuple[List[Income], List[Expense]]:
     """
     Load records from storage and split them into income/expense groups.
-    Performs logging, validation, and safe handling for corrupt data.
+    Validation happens during the split; its problems are logged as one
+    warning per load.
     """
     try:
-        records = load_from_json()
+        records = load_from_json(filename)
         logger.info(f"[analysis_module_1] Loaded {len(records)} records from JSON file.")
     except Exception as exc:
         logger.error(f"[analysis_module_1] Failed to load JSON data: {exc}")
         return [], []
 
-    # Validation step
-    _validate_record_types(records)
-
-    # Split step
-    incomes, expenses = _split_records(records)
+    # Validation and split in one pass
+    report = ValidationReport(filename)
+    incomes, expenses = _split_records(records, report)
+    report.emit(logger, "[analysis_module_1]")
 
     logger.info(
         f"[analysis_module_1] Parsed {len(incomes)} incomes and {len(expenses)} expenses."
@@ -133,54 +115,78 @@ def _load_split() -> Tuple[List[Income], List[Expense]]:
     return incomes, expenses
 
 
-# ======================================
-# Expense detail extraction
-# ======================================
-
-def expense_details() -> List[str]:
+@stats.timed("analysis.describe")
+def _describe_records(records: Iterable[object], label: str) -> List[str]:
     """
-    Return formatted descriptions for all expense entries.
-    Includes robust error handling and logs invalid descriptions.
+    Return describe() output for each record, skipping entries that fail.
+    Shared by the module-level detail functions and AnalysisSession.
     """
-    _, expenses = _load_split()
     formatted = []
 
-    for e in expenses:
+    for r in records:
         try:
-            desc = e.describe()
-            formatted.append(desc)
+            formatted.append(r.describe())
         except Exception as exc:
             logger.error(
-                f"[analysis_module_1] Failed to generate description for expense {e}: {exc}"
+                f"[analysis_module_1] Failed to generate description for {label} {r}: {exc}"
             )
 
     return formatted
 
 
+@stats.timed("aggregate.group_totals")
+def _group_totals(records: Iterable[object], attr: str) -> Dict[str, float]:
+    """
+    Sum absolute amounts per value of `attr` ("category" or "source").
+    Groups by the records' integer label ids and resolves label text once per
+    group. Insertion order follows the first appearance of each label.
+    """
+    registry = _LABEL_REGISTRIES[attr]
+    id_attr = f"{attr}_id"
+    totals: Dict[int, float] = {}
+
+    for r in records:
+        key = getattr(r, id_attr)
+        totals[key] = totals.get(key, 0) + abs(r.amount)
+
+    return {registry.label(key): value for key, value in totals.items()}
+
+
+# ======================================
+# Expense detail extraction
+# ======================================
+
+def expense_details(records: Optional[Iterable[object]] = None) -> List[str]:
+    """
+    Return formatted descriptions for all expense entries.
+    An iterable of records (e.g. iter_records()) may be passed instead of
+    loading records.json; it is filtered lazily.
+    Includes robust error handling and logs invalid descriptions.
+    """
+    if records is not None:
+        expenses = (r for r in records if isinstance(r, Expense))
+    else:
+        _, expenses = _load_split()
+    return _describe_records(expenses, "expense")
+
+
 # ======================================
 # Income detail extraction
 # ======================================
 
-def income_details() -> List[str]:
+def income_details(records: Optional[Iterable[object]] = None) -> List[str]:
     """
     Return formatted descriptions for all income entries.
+    Accepts an optional iterable of records, like expense_details().
     Performs per-item error handling to avoid breaking the whole function.
     
     Notes:
     - Follows same defensive pattern as expense_details().
     - Ensures consistent behavior across both record types.
     """
-    incomes, _ = _load_split()
-    output = []
-
-    for inc in incomes:
-        try:
-            desc = inc.describe()
-            output.append(desc)
-        except Exception as exc:
-            logger.error(
-                f"[analysis_module_1] Failed to generate description for income {inc}: {exc}"
-            )
-
-    return output
+    if records is not None:
+        incomes = (r for r in records if isinstance(r, Income))
+    else:
+        incomes, _ = _load_split()
+    return _describe_records(incomes, "income")
 
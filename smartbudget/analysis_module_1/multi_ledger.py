@@ -0,0 +1,88 @@
+"""
+Map-reduce reports across several ledger files.
+
+Each ledger in files/ (e.g. one backup per household or department) is
+mapped to its totals in its own worker process; the per-file totals are then
+reduced with merge_totals() into one combined report. Workers stream their
+file (or reuse its fresh totals store), so no ledger is ever materialized as
+a list and only the small totals dicts cross process boundaries.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Dict, Iterable, List, Optional
+from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, list_files
+from smartbudget.file_io_module_3.json_io import iter_raw_records
+from smartbudget.file_io_module_3.aggregate_store import (
+    TOTALS_SUFFIX,
+    aggregate_rows,
+    empty_totals,
+    merge_totals,
+    read_totals,
+)
+from smartbudget.file_io_module_3.backup_chain import is_chain_file
+
+logger = logging.getLogger(__name__)
+
+
+def ledger_files(include_primary: bool = False) -> List[str]:
+    """
+    JSON ledgers in files/, skipping totals stores and backup chain
+    manifests (and records.json unless asked).
+    """
+    names = [
+        f for f in list_files()
+        if f.endswith(".json") and not f.endswith(f"{TOTALS_SUFFIX}.json")
+        and not is_chain_file(f)
+    ]
+    if not include_primary:
+        names = [f for f in names if f != "records.json"]
+    return sorted(names)
+
+
+def ledger_totals(filename: str) -> dict:
+    """
+    Map step: totals of one ledger. Uses its totals store when current,
+    otherwise streams the file once. The totals store is not updated, but
+    streaming goes through iter_raw_records(), which first finishes a
+    snapshot replace interrupted by a crash (journal_io.recover_ledger):
+    that may rename the ledger's .tmp snapshot into place and delete its
+    journal and write-ahead marker.
+    """
+    totals = read_totals(filename)
+    if totals is None:
+        totals = aggregate_rows(iter_raw_records(filename))
+    return totals
+
+
+def aggregate_ledgers(filenames: Optional[Iterable[str]] = None,
+                      workers: Optional[int] = None) -> Dict[str, object]:
+    """
+    Totals across many ledgers, one worker per file.
+
+    Returns {"ledgers": {filename: totals}, "combined": totals}, where each
+    totals dict has the shape of load_totals(). `filenames` defaults to every
+    backup ledger in files/.
+    """
+    filenames = ledger_files() if filenames is None else list(filenames)
+    missing = [f for f in filenames if not os.path.isfile(os.path.join(FILES_DIR, f))]
+    if missing:
+        raise SmartBudgetError(f"Ledger file(s) not found: {', '.join(missing)}")
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(filenames)))
+    if workers <= 1:
+        per_file = [ledger_totals(f) for f in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            per_file = list(pool.map(ledger_totals, filenames))
+
+    combined = reduce(merge_totals, per_file, empty_totals())
+    logger.info(f"[multi_ledger] Aggregated {len(filenames)} ledgers on {workers} workers")
+
+    return {"ledgers": dict(zip(filenames, per_file)), "combined": combined}
+
+
+def balance(totals: dict) -> float:
+    return totals["income"] - totals["expenses"]
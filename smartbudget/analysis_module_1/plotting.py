@@ -0,0 +1,46 @@
+"""
+Plotting helpers for SmartBudget.
+
+This is the only module that imports matplotlib. It is loaded lazily by
+insights.plot_expense_by_category(), so the package and the CLI start
+without paying the matplotlib import cost until a chart is requested.
+"""
+from typing import Dict
+import matplotlib.pyplot as plt
+
+
+def plot_category_totals(category_totals: Dict[str, float]):
+    """Draw and show a bar chart of expense totals per category."""
+    cats = list(category_totals.keys())
+    vals = list(category_totals.values())
+
+    plt.figure(figsize=(8, 5))
+
+    if len(cats) == 1:
+        bar_width = 0.2
+        x = [0]
+        bars = plt.bar(x, vals, width=bar_width, color="#4a90e2")
+        plt.xticks(x, cats)
+    else:
+        bars = plt.bar(cats, vals, color="#4a90e2")
+
+
+    plt.title("Expenses by Category", fontsize=14)
+    plt.xlabel("Category", fontsize=12)
+    plt.ylabel("Amount ($)", fontsize=12)
+    plt.xticks(rotation=30)
+
+
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(
+            bar.get_x() + bar.get_width()/2,
+            height + height * 0.02,
+            f"{height:.0f}",
+            ha='center',
+            va='bottom',
+            fontsize=10
+        )
+
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,99 @@
+"""
+Analysis session for SmartBudget.
+
+An AnalysisSession loads and splits the stored records once and then answers
+totals, balance, details and category aggregates from that in-memory
+snapshot. Screens that show several figures (e.g. the budget summary) should
+use one session instead of calling the module-level functions repeatedly,
+since each of those re-reads records.json.
+"""
+import logging
+from typing import Dict, Iterable, List
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.file_io_module_3.json_io import DEFAULT_FILENAME
+from smartbudget.analysis_module_1.insights import (
+    _load_split,
+    _split_records,
+    _describe_records,
+    _group_totals,
+)
+from smartbudget.analysis_module_1.summary import _sum_amounts
+from smartbudget.analysis_module_1.diagnostics import ValidationReport
+from smartbudget.analysis_module_1.date_index import DateIndex
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisSession:
+    """
+    Read-only snapshot of incomes and expenses.
+
+    Figures are computed lazily and memoized, so asking for the balance
+    after the totals does not walk the records again.
+    """
+
+    def __init__(self, incomes: Iterable[Income], expenses: Iterable[Expense]):
+        self.incomes: List[Income] = list(incomes)
+        self.expenses: List[Expense] = list(expenses)
+        self._cache: Dict[str, object] = {}
+
+    # --------------------------------------------------------
+    # Construction
+    # --------------------------------------------------------
+    @classmethod
+    def load(cls, filename: str = DEFAULT_FILENAME) -> "AnalysisSession":
+        """Load files/filename once and build a session from it."""
+        return cls(*_load_split(filename))
+
+    @classmethod
+    def from_records(cls, records: Iterable[object]) -> "AnalysisSession":
+        """Build a session from already-loaded records (any supported mix)."""
+        report = ValidationReport()
+        split = _split_records(records, report)
+        report.emit(logger, "[session]")
+        return cls(*split)
+
+    def _memo(self, key: str, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    # --------------------------------------------------------
+    # Totals
+    # --------------------------------------------------------
+    def total_income(self) -> float:
+        return self._memo("income", lambda: _sum_amounts(self.incomes, "income"))
+
+    def total_expenses(self) -> float:
+        return self._memo("expenses", lambda: _sum_amounts(self.expenses, "expenses"))
+
+    def budget_balance(self) -> float:
+        balance = self.total_income() - self.total_expenses()
+        logger.info(f"[session] Budget balance computed: {balance}")
+        return balance
+
+    # --------------------------------------------------------
+    # Details & aggregates
+    # --------------------------------------------------------
+    def income_details(self) -> List[str]:
+        return _describe_records(self.incomes, "income")
+
+    def expense_details(self) -> List[str]:
+        return _describe_records(self.expenses, "expense")
+
+    def expense_by_category(self) -> Dict[str, float]:
+        return dict(self._memo("by_category", lambda: _group_totals(self.expenses, "category")))
+
+    def income_by_source(self) -> Dict[str, float]:
+        return dict(self._memo("by_source", lambda: _group_totals(self.incomes, "source")))
+
+    def date_index(self) -> DateIndex:
+        """Timestamp index over all records, built once per session."""
+        return self._memo("date_index", lambda: DateIndex(self.incomes + self.expenses))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(incomes={len(self.incomes)}, "
+            f"expenses={len(self.expenses)})"
+        )
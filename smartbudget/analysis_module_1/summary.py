@@ -6,11 +6,13 @@ Provides aggregation helpers and defensive handling for numeric amounts.
 Additional inline comments clarify key processing steps.
 """
 import logging
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import  Expense
 from smartbudget.file_io_module_3.json_io import load_from_json
 from smartbudget.analysis_module_1.insights import _load_split
+from smartbudget.analysis_module_1.diagnostics import UNREADABLE_AMOUNT, ValidationReport
+from smartbudget import stats
 
 
 
@@ -18,86 +20,117 @@ logger = logging.getLogger(__name__)
 
 
 # ============================
-# Internal validators
+# Internal helpers
 # ============================
 
-def _validate_amounts(records: Iterable) -> None:
-    """
-    Ensures that all Income/Expense entries contain valid numeric amounts.
-    Logs warnings if corrupted entries are detected.
-    """
-    for r in records:
-        if not hasattr(r, "amount"):
-            logger.warning(f"[summary] Record missing amount field: {r}")
-        elif not isinstance(r.amount, (int, float)):
-            logger.warning(f"[summary] Invalid amount type: {r.amount} ({type(r.amount)})")
-
-
-def _safe_sum(records: List) -> float:
+def _safe_sum(records: Iterable) -> float:
     """
     Safely sum the amounts of Income or Expense objects.
-    Gracefully handles corrupted or unreadable entries.
+    Accepts any iterable (including a lazy iter_records() stream) and walks it once.
+    Unreadable entries are skipped and reported in one error line.
     """
     total = 0.0
+    report = ValidationReport()
 
     for r in records:
         try:
             value = float(r.amount)
             total += value
-        except Exception as exc:
-            logger.error(f"[summary] Failed to read amount from {r}: {exc}")
+        except Exception:
+            report.add(UNREADABLE_AMOUNT, r)
 
+    report.emit(logger, "[summary]", "error")
     return round(total, 2)
 
 
+def _sum_amounts(records: List, label: str) -> float:
+    """
+    Sum one group of records (incomes or expenses).
+    Shared by the public wrappers below and AnalysisSession. The records
+    come from _split_records(), which already checked their amounts.
+    """
+    logger.info(f"[summary] Calculating total {label} for {len(records)} entries.")
+
+    total = _safe_sum(records)
+    logger.debug(f"[summary] Total {label} computed: {total}")
+    return total
+
+
+def _stream_totals(records: Iterable) -> Tuple[float, float]:
+    """
+    Income and expense totals from a single pass over any iterable of records.
+    Used for streamed input, where the records cannot be split into lists first.
+    """
+    income = 0.0
+    expenses = 0.0
+    report = ValidationReport()
+
+    for r in records:
+        try:
+            if isinstance(r, Income):
+                income += float(r.amount)
+            elif isinstance(r, Expense):
+                expenses += float(r.amount)
+        except Exception:
+            report.add(UNREADABLE_AMOUNT, r)
+
+    report.emit(logger, "[summary]", "error")
+    return round(income, 2), round(expenses, 2)
+
+
 # ============================
 # Public API
 # ============================
 
-def total_income() -> float:
+@stats.timed("summary.total_income")
+def total_income(records: Optional[Iterable] = None) -> float:
     """
     Return total income amount.
+    Pass an iterable such as iter_records() to total a ledger in constant memory;
+    by default records.json is loaded.
     Includes:
     - type validation
     - defensive summation
     - logging
     """
-    incomes, _ = _load_split()
-
-    logger.info(f"[summary] Calculating total income for {len(incomes)} entries.")
-    _validate_amounts(incomes)
+    if records is not None:
+        return _safe_sum(r for r in records if isinstance(r, Income))
 
-    total = _safe_sum(incomes)
-    logger.debug(f"[summary] Total income computed: {total}")
-    return total
+    incomes, _ = _load_split()
+    return _sum_amounts(incomes, "income")
 
 
-def total_expenses() -> float:
+@stats.timed("summary.total_expenses")
+def total_expenses(records: Optional[Iterable] = None) -> float:
     """
     Return total expense amount.
+    Accepts an optional iterable of records, like total_income().
     Includes:
     - type validation
     - safe summation
     - logging
     """
-    _, expenses = _load_split()
+    if records is not None:
+        return _safe_sum(r for r in records if isinstance(r, Expense))
 
-    logger.info(f"[summary] Calculating total expenses for {len(expenses)} entries.")
-    _validate_amounts(expenses)
-
-    total = _safe_sum(expenses)
-    logger.debug(f"[summary] Total expenses computed: {total}")
-    return total
+    _, expenses = _load_split()
+    return _sum_amounts(expenses, "expenses")
 
 
-def budget_balance() -> float:
+@stats.timed("summary.budget_balance")
+def budget_balance(records: Optional[Iterable] = None) -> float:
     """
     Returns the final balance (income minus expenses).
+    Records are loaded (or streamed) once and both totals come from the same pass.
     Includes error handling to ensure a fallback result is returned when needed.
     """
     try:
-        income = total_income()
-        expenses = total_expenses()
+        if records is not None:
+            income, expenses = _stream_totals(records)
+        else:
+            incomes, expenses = _load_split()
+            income = _sum_amounts(incomes, "income")
+            expenses = _sum_amounts(expenses, "expenses")
     except Exception as exc:
         logger.error(f"[summary] Failed to compute budget balance: {exc}")
         return 0.0
@@ -105,4 +138,4 @@ def budget_balance() -> float:
     balance = income - expenses
     logger.info(f"[summary] Budget balance computed: {balance}")
 
-    return balance
\ No newline at end of file
+    return balance
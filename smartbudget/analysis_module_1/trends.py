@@ -0,0 +1,94 @@
+"""
+Monthly trend reports for SmartBudget.
+
+Trends are read from the rollup cube kept in the totals store (see
+file_io_module_3.aggregate_store): (month x category) and (month x source)
+sums that are updated on every append. A report over years of history is
+therefore one small JSON read, not a pass over every record.
+
+Periods are "YYYY-MM" strings; `start` / `end` bounds are inclusive.
+Undated records are reported only when include_undated=True, under
+UNDATED_PERIOD.
+"""
+import logging
+from typing import Dict, List, Optional
+from smartbudget.file_io_module_3 import load_totals
+from smartbudget.file_io_module_3.json_io import DEFAULT_FILENAME
+from smartbudget.file_io_module_3.aggregate_store import UNDATED_PERIOD
+
+logger = logging.getLogger(__name__)
+
+
+def _in_range(period: str, start: Optional[str], end: Optional[str]) -> bool:
+    if period == UNDATED_PERIOD:
+        return False
+    return (start is None or period >= start) and (end is None or period <= end)
+
+
+def _selected_periods(totals: dict, start, end, include_undated) -> List[str]:
+    periods = set(totals["by_period_category"]) | set(totals["by_period_source"])
+    selected = sorted(p for p in periods if _in_range(p, start, end))
+    if include_undated and UNDATED_PERIOD in periods:
+        selected.append(UNDATED_PERIOD)
+    return selected
+
+
+# --------------------------------------------------------
+# Reports
+# --------------------------------------------------------
+def monthly_totals(filename=DEFAULT_FILENAME, start: Optional[str] = None,
+                   end: Optional[str] = None, include_undated: bool = False,
+                   totals: Optional[dict] = None) -> List[dict]:
+    """
+    One row per month, oldest first:
+    {"period", "income", "expenses", "balance"}.
+    `totals` (e.g. from a storage backend) is used instead of reading filename.
+    """
+    if totals is None:
+        totals = load_totals(filename)
+    report = []
+    for period in _selected_periods(totals, start, end, include_undated):
+        income = sum(totals["by_period_source"].get(period, {}).values())
+        expenses = sum(totals["by_period_category"].get(period, {}).values())
+        report.append({
+            "period": period,
+            "income": round(income, 2),
+            "expenses": round(expenses, 2),
+            "balance": round(income - expenses, 2),
+        })
+
+    logger.info(f"[trends] Monthly totals for {len(report)} periods")
+    return report
+
+
+def category_trend(category: str, filename=DEFAULT_FILENAME, start: Optional[str] = None,
+                   end: Optional[str] = None) -> Dict[str, float]:
+    """Monthly spending in one expense category, {period: amount}."""
+    label = category.strip().lower()
+    totals = load_totals(filename)
+    return {
+        period: round(cells[label], 2)
+        for period, cells in sorted(totals["by_period_category"].items())
+        if label in cells and _in_range(period, start, end)
+    }
+
+
+def source_trend(source: str, filename=DEFAULT_FILENAME, start: Optional[str] = None,
+                 end: Optional[str] = None) -> Dict[str, float]:
+    """Monthly income from one source, {period: amount}."""
+    label = source.strip().lower()
+    totals = load_totals(filename)
+    return {
+        period: round(cells[label], 2)
+        for period, cells in sorted(totals["by_period_source"].items())
+        if label in cells and _in_range(period, start, end)
+    }
+
+
+def period_breakdown(period: str, filename=DEFAULT_FILENAME) -> Dict[str, Dict[str, float]]:
+    """Per-category expenses and per-source income for one period."""
+    totals = load_totals(filename)
+    return {
+        "by_category": dict(totals["by_period_category"].get(period, {})),
+        "by_source": dict(totals["by_period_source"].get(period, {})),
+    }
@@ -6,10 +6,12 @@ Exports controllers and menu interface.
 from .app_menu_controller import print_menu, run
 from .budget_record_controller import BudgetRecordController
 from .file_io_data_controller import FileIoDataStorageController
+from .batch_import_controller import BatchImportController
 
 __all__ = [
     "print_menu",
     "run",
     "BudgetRecordController",
     "FileIoDataStorageController",
+    "BatchImportController",
 ]
@@ -6,14 +6,33 @@ SmartBudget CLI Application Interface
 from smartbudget.core_module_2.budget_record_controller import BudgetRecordController
 from smartbudget.core_module_2.file_io_data_controller import FileIoDataStorageController
 from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.file_io_module_3.storage import open_storage
+from smartbudget import profiling
 
 
 # ------------------ Create Controller Instances ------------------ #
 
+# Both controllers share one ledger backend ($SMARTBUDGET_STORAGE, default
+# json). It is opened by run(), not at import, so a bad backend name is
+# reported like any other error instead of breaking the import.
+storage = None
 rec = BudgetRecordController()
 sys = FileIoDataStorageController()
 
 
+def open_ledger() -> bool:
+    """Open the shared ledger backend once. False (and a message) on failure."""
+    global storage
+    if storage is None:
+        try:
+            storage = open_storage()
+        except SmartBudgetError as e:
+            print(f"❌ Cannot open ledger storage: {e}")
+            return False
+        rec.storage = sys.storage = storage
+    return True
+
+
 # ------------------ UI Menu ------------------ #
 
 def print_menu():
@@ -30,88 +49,139 @@ def print_menu():
     print("8. Delete Backup File")
     print("9. Reset Records")
     print("10. Show Expense Chart")
+    print("11. Show Monthly Trends")
+    print("12. Report Across Backup Files")
+    print("13. Incremental Backup")
+    print("14. Restore Backup Point")
     print("0. Exit")
     print("====================================")
 
 
 # ------------------ Main Application Loop ------------------ #
 
-def run():
+# Menu choice -> action name used for profiling spans and replay scripts
+MENU_ACTIONS = {
+    "1": "add_income", "2": "add_expense", "3": "summary", "4": "expense_details",
+    "5": "income_details", "6": "backup", "7": "list", "8": "delete", "9": "reset",
+    "10": "chart", "11": "trends", "12": "ledger_report", "13": "incremental_backup",
+    "14": "restore", "0": "exit",
+}
+
+
+def dispatch(choice: str) -> bool:
+    """Run one menu choice. Returns False when the user chose to exit."""
+    if choice == "1":
+        try:
+            rec.add_income()
+        except SmartBudgetError as e:
+            print(f"❌ Failed to add income: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+
+    elif choice == "2":
+        try:
+            rec.add_expense()
+        except SmartBudgetError as e:
+            print(f"❌ Failed to add expense: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+
+    elif choice == "3":
+        try:
+            rec.show_summary()
+        except Exception as e:
+            print(f"❌ Cannot display summary: {e}")
+
+    elif choice == "4":
+        try:
+            rec.show_expense_details()
+        except Exception as e:
+            print(f"❌ Cannot show expense details: {e}")
+
+    elif choice == "5":
+        try:
+            rec.show_income_details()
+        except Exception as e:
+            print(f"❌ Cannot show income details: {e}")
+
+    elif choice == "6":
+        try:
+            sys.save_data()
+        except Exception as e:
+            print(f"❌ Failed to save data: {e}")
+
+    elif choice == "7":
+        try:
+            sys.show_files()
+        except Exception as e:
+            print(f"❌ Cannot list files: {e}")
+
+    elif choice == "8":
+        try:
+            sys.delete_backup_file()
+        except Exception as e:
+            print(f"❌ Failed to delete file: {e}")
+
+    elif choice == "9":
+        try:
+            sys.clear_data()
+        except Exception as e:
+            print(f"❌ Failed to clear data: {e}")
+
+    elif choice == "10":
+        try:
+            rec.show_expense_plot()
+        except Exception as e:
+            print(f"❌ Failed to generate expense chart: {e}")
+
+    elif choice == "11":
+        try:
+            rec.show_monthly_trends()
+        except Exception as e:
+            print(f"❌ Cannot show monthly trends: {e}")
+
+    elif choice == "12":
+        try:
+            sys.report_backups()
+        except Exception as e:
+            print(f"❌ Cannot build backup report: {e}")
+
+    elif choice == "13":
+        try:
+            sys.backup_incremental()
+        except Exception as e:
+            print(f"❌ Failed to back up records: {e}")
+
+    elif choice == "14":
+        try:
+            sys.restore_point()
+        except Exception as e:
+            print(f"❌ Failed to restore backup: {e}")
+
+    elif choice == "0":
+        print("\nExiting SmartBudget. Goodbye!\n")
+        return False
+
+    else:
+        print("\n❌ Invalid choice. Try again.\n")
+
+    return True
+
+
+def run() -> bool:
+    """Interactive menu loop. Returns False if the ledger could not be opened."""
+    if not open_ledger():
+        return False
+
     while True:
         try:
             print_menu()
             choice = input("Enter your choice: ").strip()
 
-            if choice == "1":
-                try:
-                    rec.add_income()
-                except SmartBudgetError as e:
-                    print(f"❌ Failed to add income: {e}")
-                except Exception as e:
-                    print(f"❌ Unexpected error: {e}")
-
-            elif choice == "2":
-                try:
-                    rec.add_expense()
-                except SmartBudgetError as e:
-                    print(f"❌ Failed to add expense: {e}")
-                except Exception as e:
-                    print(f"❌ Unexpected error: {e}")
-
-            elif choice == "3":
-                try:
-                    rec.show_summary()
-                except Exception as e:
-                    print(f"❌ Cannot display summary: {e}")
-
-            elif choice == "4":
-                try:
-                    rec.show_expense_details()
-                except Exception as e:
-                    print(f"❌ Cannot show expense details: {e}")
-
-            elif choice == "5":
-                try:
-                    rec.show_income_details()
-                except Exception as e:
-                    print(f"❌ Cannot show income details: {e}")
-
-            elif choice == "6":
-                try:
-                    sys.save_data()
-                except Exception as e:
-                    print(f"❌ Failed to save data: {e}")
-
-            elif choice == "7":
-                try:
-                    sys.show_files()
-                except Exception as e:
-                    print(f"❌ Cannot list files: {e}")
-
-            elif choice == "8":
-                try:
-                    sys.delete_backup_file()
-                except Exception as e:
-                    print(f"❌ Failed to delete file: {e}")
-
-            elif choice == "9":
-                try:
-                    sys.clear_data()
-                except Exception as e:
-                    print(f"❌ Failed to clear data: {e}")
-
-            elif choice == "10":
-                try:
-                    rec.show_expense_plot()
-                except Exception as e:
-                    print(f"❌ Failed to generate expense chart: {e}")
-
-            elif choice == "0":
-                print("\nExiting SmartBudget. Goodbye!\n")
-                break
-
-            else:
-                print("\n❌ Invalid choice. Try again.\n")
+            # Profiling span per action; a no-op unless profiling is on
+            with profiling.action(MENU_ACTIONS.get(choice, "invalid"), choice=choice):
+                if not dispatch(choice):
+                    break
 
         except KeyboardInterrupt:
             print("\n\n⚠ Interrupted by user. Exiting safely...\n")
@@ -119,3 +189,5 @@ def run():
         except Exception as e:
             print(f"\n❌ Critical error: {e}\n")
             break
+
+    return True
@@ -0,0 +1,196 @@
+"""
+BatchImportController
+---------------------
+
+Non-interactive bulk import of income/expense records.
+
+Rows are read from a CSV file (columns: type, name, amount, category,
+source and optionally timestamp) or a JSON Lines file (one RecordBase.to_dict() object per line),
+validated in a single pass through the normal Income/Expense constructors,
+and written with one append: one journal write + fsync for the JSON ledger
+(append_to_json), or one transaction for a storage backend.
+Rows that fail validation, are not valid UTF-8 or are malformed CSV are
+reported with their line number and skipped; they never abort the import.
+"""
+
+import csv
+import json
+import os
+from typing import Iterator, List, Tuple
+
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.file_io_module_3 import append_to_json
+from smartbudget.file_io_module_3.json_io import DEFAULT_FILENAME
+
+# Rows between progress messages while validating
+DEFAULT_BATCH_SIZE = 5000
+
+# Per-row errors printed before the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+
+class ImportReport:
+    """Outcome of one import: counts plus (line, message) per rejected row."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.imported = 0
+        self.errors: List[Tuple[int, str]] = []
+
+    @property
+    def rejected(self) -> int:
+        return len(self.errors)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(path={self.path!r}, "
+            f"imported={self.imported}, rejected={self.rejected})"
+        )
+
+
+def _is_utf8(text: str) -> bool:
+    # Files are decoded with surrogateescape, which maps bad bytes to lone surrogates
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+_NOT_UTF8 = "Row is not valid UTF-8 text."
+
+
+def _iter_csv_rows(path: str) -> Iterator[Tuple[int, object]]:
+    with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        reader = csv.DictReader(f)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # The reader has consumed the bad line and can carry on
+                yield reader.line_num, SmartBudgetError(f"Malformed CSV: {e}")
+                continue
+            values = [v for v in row.values() if isinstance(v, str)]
+            if not all(_is_utf8(v) for v in values):
+                yield reader.line_num, SmartBudgetError(_NOT_UTF8)
+            else:
+                yield reader.line_num, row
+
+
+def _iter_jsonl_rows(path: str) -> Iterator[Tuple[int, object]]:
+    with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            if not _is_utf8(line):
+                yield lineno, SmartBudgetError(_NOT_UTF8)
+                continue
+            try:
+                yield lineno, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield lineno, e
+
+
+def iter_rows(path: str) -> Iterator[Tuple[int, object]]:
+    """Yield (line number, row) pairs from a .csv or .jsonl/.ndjson file."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return _iter_csv_rows(path)
+    if ext in (".jsonl", ".ndjson"):
+        return _iter_jsonl_rows(path)
+    raise SmartBudgetError(f"Unsupported import format '{ext}' (use .csv or .jsonl)")
+
+
+def build_record(row: dict):
+    """Validate one input row and return an Income or Expense."""
+    if not isinstance(row, dict):
+        raise SmartBudgetError(f"Row is not an object: {row!r}")
+
+    kind = str(row.get("type") or "").strip().lower()
+    amount = row.get("amount")
+    if isinstance(amount, str):
+        try:
+            amount = float(amount)
+        except ValueError:
+            raise SmartBudgetError(f"Amount must be numeric, got {amount!r}.")
+
+    if kind == "income":
+        return Income(row.get("name"), amount, row.get("source"), row.get("timestamp"))
+    if kind == "expense":
+        return Expense(row.get("name"), amount, row.get("category"), row.get("timestamp"))
+    raise SmartBudgetError(f"Unknown record type {row.get('type')!r}.")
+
+
+def import_file(path: str, filename: str = DEFAULT_FILENAME,
+                batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False,
+                progress=None, storage=None) -> ImportReport:
+    """
+    Import every valid row of `path` into files/filename, or into `storage`
+    (a StorageBackend) when one is given.
+    All accepted records are written together in one storage append.
+    `progress`, if given, is called with the number of rows checked after
+    every `batch_size` rows.
+    """
+    if not os.path.isfile(path):
+        raise SmartBudgetError(f"Import file not found: {path}")
+
+    report = ImportReport(path)
+    records = []
+    checked = 0
+
+    for lineno, row in iter_rows(path):
+        checked += 1
+        try:
+            if isinstance(row, SmartBudgetError):
+                raise row
+            if isinstance(row, Exception):
+                raise SmartBudgetError(f"Invalid JSON: {row}")
+            records.append(build_record(row))
+        except SmartBudgetError as e:
+            report.errors.append((lineno, str(e)))
+
+        if progress is not None and checked % batch_size == 0:
+            progress(checked)
+
+    if records and not dry_run:
+        try:
+            if storage is not None:
+                storage.append(records)
+            else:
+                append_to_json(records, filename)
+        except Exception as e:
+            raise SmartBudgetError(f"Failed to write imported records: {e}")
+
+    report.imported = len(records)
+    return report
+
+
+class BatchImportController:
+    """User-facing wrapper that runs an import and prints its report."""
+
+    def run_import(self, path: str, filename: str = DEFAULT_FILENAME,
+                   batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False,
+                   storage=None) -> ImportReport:
+        try:
+            report = import_file(
+                path, filename, batch_size, dry_run,
+                progress=lambda n: print(f"  ... {n} rows checked"),
+                storage=storage,
+            )
+        except SmartBudgetError as e:
+            print(f"❌ Import failed: {e}")
+            return None
+
+        for lineno, message in report.errors[:MAX_REPORTED_ERRORS]:
+            print(f"❌ Line {lineno}: {message}")
+        if report.rejected > MAX_REPORTED_ERRORS:
+            print(f"   ... and {report.rejected - MAX_REPORTED_ERRORS} more rejected rows")
+
+        verb = "Validated" if dry_run else "Imported"
+        print(f"✔ {verb} {report.imported} records from {path} "
+              f"({report.rejected} rejected)\n")
+        return report
@@ -9,44 +9,78 @@ Enhancements added for Step 3:
     - Ensures CLI never crashes due to bad input
 """
 
+from datetime import datetime
+
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import Expense
 from smartbudget.entity.base_record import SmartBudgetError
 
-from smartbudget.analysis_module_1.summary import (
-    total_income, total_expenses, budget_balance
-)
 from smartbudget.analysis_module_1.insights import (
     income_details, expense_details, plot_expense_by_category
 )
 
-from smartbudget.file_io_module_3 import append_to_json
+from smartbudget.analysis_module_1.trends import monthly_totals
+
+from smartbudget.file_io_module_3.storage import StorageBackend, open_storage
 
 
 class BudgetRecordController:
     """Controller for managing financial records and user-facing operations."""
 
-    def __init__(self):
+    def __init__(self, storage: StorageBackend = None):
         self.incomes = []
         self.expenses = []
+        # Ledger backend (JSON by default, see file_io_module_3.storage);
+        # opened on first use when none is given
+        self._storage = storage
+
+    @property
+    def storage(self) -> StorageBackend:
+        if self._storage is None:
+            self._storage = open_storage()
+        return self._storage
+
+    @storage.setter
+    def storage(self, backend: StorageBackend):
+        self._storage = backend
 
     # --------------------------------------------------------
     # Display Functions
     # --------------------------------------------------------
     def show_summary(self):
         try:
+            # Running totals / SUM queries: no pass over the records
+            totals = self.storage.totals()
+            income = round(totals["income"], 2)
+            expenses = round(totals["expenses"], 2)
             print("\n=== Budget Summary ===")
-            print("Total Income:", total_income())
-            print("Total Expenses:", total_expenses())
-            print("Balance:", budget_balance())
+            print("Total Income:", income)
+            print("Total Expenses:", expenses)
+            print("Balance:", income - expenses)
             print("=======================\n")
         except Exception as e:
             raise SmartBudgetError(f"Failed to display summary: {e}")
 
+    def show_monthly_trends(self):
+        try:
+            # Answered from the monthly rollups in the totals store
+            report = monthly_totals(include_undated=True, totals=self.storage.totals())
+            print("\n=== Monthly Trends ===")
+            if not report:
+                print("No records yet.\n")
+                return
+            print(f"{'Period':<10}{'Income':>12}{'Expenses':>12}{'Balance':>12}")
+            for row in report:
+                print(f"{row['period']:<10}{row['income']:>12.2f}"
+                      f"{row['expenses']:>12.2f}{row['balance']:>12.2f}")
+            print("=======================\n")
+        except Exception as e:
+            raise SmartBudgetError(f"Failed to display monthly trends: {e}")
+
     def show_income_details(self):
         try:
             print("\n=== Income Details ===")
-            details = income_details()
+            details = income_details(self.storage.load())
             if not details:
                 print("No incomes recorded.\n")
                 return
@@ -59,7 +93,7 @@ class BudgetRecordController:
     def show_expense_details(self):
         try:
             print("\n=== Expense Details ===")
-            details = expense_details()
+            details = expense_details(self.storage.load())
             if not details:
                 print("No expenses recorded.\n")
                 return
@@ -73,7 +107,7 @@ class BudgetRecordController:
         try:
             print("\n=== Expense Visualization ===")
             print("Generating chart...")
-            plot_expense_by_category()
+            plot_expense_by_category(self.storage.load())
             print("\n✔ Chart displayed!\n")
         except Exception as e:
             raise SmartBudgetError(f"Failed to display expense chart: {e}")
@@ -93,11 +127,11 @@ class BudgetRecordController:
 
             source = input("Enter source: ").strip()
 
-            inc = Income(name, amount, source)
+            inc = Income(name, amount, source, datetime.now())
             self.incomes.append(inc)
 
             try:
-                append_to_json([inc])
+                self.storage.append([inc])
             except Exception as e:
                 raise SmartBudgetError(f"Failed to save income: {e}")
 
@@ -121,11 +155,11 @@ class BudgetRecordController:
 
             category = input("Enter category: ").strip()
 
-            exp = Expense(name, amount, category)
+            exp = Expense(name, amount, category, datetime.now())
             self.expenses.append(exp)
 
             try:
-                append_to_json([exp])
+                self.storage.append([exp])
             except Exception as e:
                 raise SmartBudgetError(f"Failed to save expense: {e}")
 
@@ -8,23 +8,90 @@ Enhanced for Step 3:
     - Prevents crashes on missing files, bad JSON, IO failures
 """
 
+import os
+
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import Expense
 from smartbudget.entity.base_record import SmartBudgetError
 
+from smartbudget.analysis_module_1.multi_ledger import aggregate_ledgers, balance
+
 from smartbudget.file_io_module_3 import (
-    save_to_json,
     load_from_json,
     file_exists,
     list_files,
     delete_file,
-    clear_json,
+    journal_name,
+    totals_name,
+)
+from smartbudget.file_io_module_3.journal_io import JOURNAL_SUFFIX, WAL_SUFFIX, wal_name
+from smartbudget.file_io_module_3.aggregate_store import TOTALS_SUFFIX
+from smartbudget.file_io_module_3.backup_chain import (
+    chain_name,
+    is_chain_file,
+    list_backups,
+    restore_backup,
+    restore_records,
+)
+from smartbudget.file_io_module_3.storage import StorageBackend, open_storage
+from smartbudget.file_io_module_3.sqlite_io import DEFAULT_DB_FILENAME
+
+# records.json, its append-only journal, running totals and write-ahead
+# marker, and the SQLite ledger are managed by the app
+SYSTEM_FILES = (
+    "records.json", journal_name("records.json"), totals_name("records.json"),
+    wal_name("records.json"), DEFAULT_DB_FILENAME,
 )
 
 
+def _companion_owners(filename):
+    """Ledger names whose journal, totals store or WAL marker `filename` could be."""
+    owners = set()
+    if filename.endswith(WAL_SUFFIX):
+        owners.add(filename[:-len(WAL_SUFFIX)])
+    if filename.endswith(JOURNAL_SUFFIX):
+        owners.update((filename[:-1], filename[:-len(JOURNAL_SUFFIX)]))
+    base, ext = os.path.splitext(filename)
+    if base.endswith(TOTALS_SUFFIX):
+        owners.add(base[:-len(TOTALS_SUFFIX)] + ext)
+    return owners
+
+
+def is_companion_file(filename) -> bool:
+    """The journal, totals store or WAL marker of an existing ledger in files/."""
+    return any(
+        owner and filename in (journal_name(owner), totals_name(owner), wal_name(owner))
+        and file_exists(owner)
+        for owner in _companion_owners(filename)
+    )
+
+
+def is_system_file(filename) -> bool:
+    """
+    System files, incremental backup chain files and the helper files of
+    any ledger cannot be overwritten or deleted, and are not listed.
+    """
+    return filename in SYSTEM_FILES or is_chain_file(filename) or is_companion_file(filename)
+
+
 class FileIoDataStorageController:
     """High-level controller for SmartBudget's file-based storage operations."""
 
+    def __init__(self, storage: StorageBackend = None):
+        # Primary ledger backend, opened on first use when none is given;
+        # backups are always JSON files in files/
+        self._storage = storage
+
+    @property
+    def storage(self) -> StorageBackend:
+        if self._storage is None:
+            self._storage = open_storage()
+        return self._storage
+
+    @storage.setter
+    def storage(self, backend: StorageBackend):
+        self._storage = backend
+
     # --------------------------------------------------------
     # Clear primary data file
     # --------------------------------------------------------
@@ -33,10 +100,10 @@ class FileIoDataStorageController:
             confirm = input("⚠ Are you sure you want to CLEAR ALL DATA? (y/n): ").lower()
             if confirm == "y":
                 try:
-                    clear_json()
+                    self.storage.clear()
                     print("✔ All records have been cleared.\n")
                 except Exception as e:
-                    raise SmartBudgetError(f"Failed to clear records.json: {e}")
+                    raise SmartBudgetError(f"Failed to clear {self.storage.filename}: {e}")
             else:
                 print("❌ Cancelled.\n")
 
@@ -53,7 +120,7 @@ class FileIoDataStorageController:
             if not filename:
                 raise SmartBudgetError("Filename cannot be empty.")
 
-            if filename == "records.json":
+            if is_system_file(filename):
                 print("❌ Cannot save to system file.\n")
                 return
 
@@ -65,12 +132,8 @@ class FileIoDataStorageController:
                     return
 
             try:
-                data = load_from_json("records.json")
-            except Exception as e:
-                raise SmartBudgetError(f"Failed to read records.json: {e}")
-
-            try:
-                save_to_json(data, filename)
+                # JSON ledgers are backed up byte for byte (hard-linked snapshot)
+                self.storage.backup(filename)
             except Exception as e:
                 raise SmartBudgetError(f"Failed to save backup file '{filename}': {e}")
 
@@ -128,7 +191,7 @@ class FileIoDataStorageController:
             print("\nFiles in 'files/' directory:")
 
             try:
-                files = [f for f in list_files() if f != "records.json"]
+                files = [f for f in list_files() if not is_system_file(f)]
             except Exception as e:
                 raise SmartBudgetError(f"Failed to list files: {e}")
 
@@ -154,12 +217,15 @@ class FileIoDataStorageController:
             if not filename:
                 raise SmartBudgetError("Filename cannot be empty.")
 
-            if filename == "records.json":
+            if is_system_file(filename):
                 print("❌ Cannot delete system file.\n")
                 return
 
             try:
                 result = delete_file(filename)
+                # A backup may carry a journal and totals of its own
+                delete_file(journal_name(filename))
+                delete_file(totals_name(filename))
             except Exception as e:
                 raise SmartBudgetError(f"File deletion failed: {e}")
 
@@ -172,3 +238,124 @@ class FileIoDataStorageController:
             print(f"❌ Delete error: {e}")
         except Exception as e:
             print(f"❌ Unexpected error in delete_backup_file: {e}")
+
+    # --------------------------------------------------------
+    # Incremental backups with point-in-time restore
+    # --------------------------------------------------------
+    def backup_incremental(self):
+        try:
+            try:
+                entry = self.storage.backup_incremental()
+            except Exception as e:
+                raise SmartBudgetError(f"Failed to back up {self.storage.filename}: {e}")
+
+            if entry["kind"] == "full":
+                print(f"✔ Backup #{entry['id']}: full copy of {entry['total']} records\n")
+            else:
+                print(f"✔ Backup #{entry['id']}: {entry['count']} new records since the last backup\n")
+
+        except SmartBudgetError as e:
+            print(f"❌ Backup error: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error in backup_incremental: {e}")
+
+    def restore_point(self):
+        try:
+            ledger = self.storage.filename
+            try:
+                entries = list_backups(ledger)
+            except Exception as e:
+                raise SmartBudgetError(f"Failed to read {chain_name(ledger)}: {e}")
+
+            if not entries:
+                print(" (No incremental backups yet)\n")
+                return
+
+            print("\nIncremental backups:")
+            for entry in entries:
+                print(f" #{entry['id']:<4} {entry['created'][:19]}  {entry['kind']:<6}"
+                      f"{entry['total']} records")
+
+            point = input("Restore which backup? (id or date, blank = latest): ").strip() or None
+            target = input("Restore into file (blank = current records): ").strip()
+
+            if not target or target == ledger:
+                confirm = input("⚠ Replace ALL current records with this backup? (y/n): ").lower()
+                if confirm != "y":
+                    print("❌ Restore cancelled.\n")
+                    return
+                try:
+                    records = restore_records(ledger, point)
+                    self.storage.save(records)
+                except SmartBudgetError:
+                    raise
+                except Exception as e:
+                    raise SmartBudgetError(f"Failed to restore {ledger}: {e}")
+                print(f"✔ Restored {len(records)} records\n")
+                return
+
+            if is_system_file(target):
+                print("❌ Cannot restore into system file.\n")
+                return
+            if file_exists(target):
+                overwrite = input("⚠ File exists. Overwrite? (y/n): ").lower()
+                if overwrite != "y":
+                    print("❌ Restore cancelled.\n")
+                    return
+
+            try:
+                count = restore_backup(ledger, point, target)
+            except SmartBudgetError:
+                raise
+            except Exception as e:
+                raise SmartBudgetError(f"Failed to restore into '{target}': {e}")
+            print(f"✔ Restored {count} records into {target}\n")
+
+        except SmartBudgetError as e:
+            print(f"❌ Restore error: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error in restore_point: {e}")
+
+    # --------------------------------------------------------
+    # Combined report across backup files
+    # --------------------------------------------------------
+    def report_backups(self):
+        try:
+            raw = input("Enter backup files to combine (comma-separated, blank = all): ").strip()
+            filenames = [f.strip() for f in raw.split(",") if f.strip()] or None
+            self.show_ledger_report(filenames)
+        except Exception as e:
+            print(f"❌ Unexpected error in report_backups: {e}")
+
+    def show_ledger_report(self, filenames=None, workers=None) -> bool:
+        """Print totals per ledger and combined; returns False on failure."""
+        try:
+            try:
+                report = aggregate_ledgers(filenames, workers)
+            except SmartBudgetError:
+                raise
+            except Exception as e:
+                raise SmartBudgetError(f"Failed to aggregate ledgers: {e}")
+
+            if not report["ledgers"]:
+                print(" (No backup files found)\n")
+                return True
+
+            print("\n=== Combined Ledger Report ===")
+            print(f"{'Ledger':<24}{'Income':>12}{'Expenses':>12}{'Balance':>12}")
+            rows = list(report["ledgers"].items()) + [("TOTAL", report["combined"])]
+            for name, totals in rows:
+                print(f"{name:<24}{totals['income']:>12.2f}"
+                      f"{totals['expenses']:>12.2f}{balance(totals):>12.2f}")
+
+            by_category = report["combined"]["by_category"]
+            if by_category:
+                print("\nExpenses by category:")
+                for category, amount in sorted(by_category.items(), key=lambda kv: -kv[1]):
+                    print(f" - {category}: {amount:.2f}")
+            print("==============================\n")
+            return True
+
+        except SmartBudgetError as e:
+            print(f"❌ Report error: {e}")
+            return False
@@ -1,5 +1,17 @@
 from .base_record import RecordBase
 from .income import  Income
 from .expense import Expense
+from .labels import LabelRegistry, CATEGORIES, SOURCES
 
-__all__ = ["RecordBase", "Expense", "Income"]
+__all__ = [
+    "RecordBase", "Expense", "Income", "RecordTable",
+    "LabelRegistry", "CATEGORIES", "SOURCES",
+]
+
+
+def __getattr__(name):
+    # RecordTable needs NumPy; import it only when first requested
+    if name == "RecordTable":
+        from .record_table import RecordTable
+        return RecordTable
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
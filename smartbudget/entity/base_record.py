@@ -1,8 +1,47 @@
+from datetime import date, datetime, time
+from typing import Optional
 from smartbudget.entity.constants import Limits
 from smartbudget.customized_exception import SmartBudgetError
 
 
+def parse_timestamp(value) -> Optional[datetime]:
+    """
+    Normalize an optional record timestamp to a naive local datetime.
+
+    Accepts None / "" (undated), a datetime, a date (midnight) or an ISO-8601
+    string such as "2025-03-14" or "2025-03-14T09:30:00". Naive values are
+    taken as local time, like datetime.now() and CSV imports; aware values
+    are converted to local time and their offset dropped, so every stored
+    timestamp compares with every other and falls in its local month.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip())
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    elif not isinstance(value, datetime):
+        raise TypeError("Timestamp must be a datetime, date or ISO-8601 string.")
+
+    return _local_naive(value)
+
 
+def _local_naive(value: datetime) -> datetime:
+    """Aware datetime -> naive local time; naive values are returned as-is."""
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _stored_timestamp(data: dict) -> Optional[datetime]:
+    """Timestamp of a row written by to_dict(); used by the trusted fast path."""
+    stamp = data.get("timestamp")
+    return _local_naive(datetime.fromisoformat(stamp)) if stamp else None
+
+
+def _restore_record(cls, data: dict) -> "RecordBase":
+    """Unpickle helper: rebuild a record from its to_dict() row."""
+    return cls.from_trusted_dict(data)
 
 
 class RecordBase:
@@ -13,18 +52,36 @@ class RecordBase:
         - Robust error handling (try/except wrappers)
         - Custom SmartBudgetError exception
         - More descriptive validation errors
+
+    Records use __slots__ instead of a per-instance __dict__, which keeps
+    large in-memory ledgers compact. Subclasses declare only their own fields.
     """
 
-    def __init__(self, name: str, amount: float):
+    __slots__ = ("_name", "_amount", "_timestamp")
+
+    def __init__(self, name: str, amount: float, timestamp=None):
         try:
             self.name = name       # triggers validation
             self.amount = amount   # triggers validation
+            self.timestamp = timestamp
         except (ValueError, TypeError) as e:
             # convert all validation failures into app-level exception
             raise SmartBudgetError(f"Invalid record initialization: {e}") from e
         except Exception as e:
             raise SmartBudgetError(f"Unexpected error creating RecordBase: {e}") from e
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "RecordBase":
+        """
+        Fast path for rows this app serialized itself (see to_dict()).
+        Skips every validation layer; do not use for user input.
+        """
+        record = cls.__new__(cls)
+        record._name = data["name"]
+        record._amount = float(data["amount"])
+        record._timestamp = _stored_timestamp(data)
+        return record
+
     # --------------------------------------------------------
     # Properties — safe attribute access
     # --------------------------------------------------------
@@ -52,6 +109,18 @@ class RecordBase:
         except Exception as e:
             raise SmartBudgetError(f"Invalid amount: {e}") from e
 
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """When the record happened, or None for undated records."""
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value):
+        try:
+            self._timestamp = parse_timestamp(value)
+        except Exception as e:
+            raise SmartBudgetError(f"Invalid timestamp: {e}") from e
+
     # --------------------------------------------------------
     # Validation
     # --------------------------------------------------------
@@ -82,14 +151,25 @@ class RecordBase:
 
     def to_dict(self) -> dict:
         try:
-            return {
+            return self._with_timestamp({
                 "type": self.__class__.__name__,
                 "name": self.name,
                 "amount": float(self.amount),
-            }
+            })
         except Exception as e:
             raise SmartBudgetError(f"Serialization failed: {e}")
 
+    def _with_timestamp(self, data: dict) -> dict:
+        """Add the ISO timestamp to a serialized row; undated rows omit the key."""
+        if self._timestamp is not None:
+            data["timestamp"] = self._timestamp.isoformat()
+        return data
+
+    def __reduce__(self):
+        # Pickle by value: label ids are only meaningful inside one process's
+        # registries, so records cross process boundaries as their stored row.
+        return _restore_record, (self.__class__, self.to_dict())
+
     # --------------------------------------------------------
     # Debug & Utility
     # --------------------------------------------------------
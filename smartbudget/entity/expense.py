@@ -1,4 +1,5 @@
-from .base_record import RecordBase, SmartBudgetError
+from .base_record import RecordBase, SmartBudgetError, _stored_timestamp
+from .labels import CATEGORIES
 
 from .base_record import  SmartBudgetError
 class Expense(RecordBase):
@@ -11,7 +12,9 @@ class Expense(RecordBase):
         - Defensive programming: avoid bad category values
     """
 
-    def __init__(self, name: str, amount: float, category: str):
+    __slots__ = ("_category_id",)
+
+    def __init__(self, name: str, amount: float, category: str, timestamp=None):
         try:
             # ---- Validation ----
             if not isinstance(name, str) or not name.strip():
@@ -27,22 +30,35 @@ class Expense(RecordBase):
                 raise ValueError("Expense category must be a non-empty string.")
 
             # ---- Call base class (handles name + amount validation) ----
-            super().__init__(name.strip(), float(abs(amount)))
+            super().__init__(name.strip(), float(abs(amount)), timestamp)
 
             # ---- Normalize category ----
-            self._category = category.strip().lower()
+            self._category_id = CATEGORIES.register(category)
 
         except (TypeError, ValueError) as e:
             raise SmartBudgetError(f"Invalid Expense initialization: {e}") from e
         except Exception as e:
             raise SmartBudgetError(f"Unexpected error creating Expense: {e}") from e
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "Expense":
+        """
+        Build an Expense from a stored row without re-validating it.
+        Older files stored expenses as negative amounts, hence abs().
+        """
+        record = cls.__new__(cls)
+        record._name = data["name"]
+        record._amount = float(abs(data["amount"]))
+        record._category_id = CATEGORIES.register(data.get("category", "未知"))
+        record._timestamp = _stored_timestamp(data)
+        return record
+
     # --------------------------------------------------------
     # Properties (safe attribute access)
     # --------------------------------------------------------
     @property
     def category(self) -> str:
-        return self._category
+        return CATEGORIES.label(self._category_id)
 
     @category.setter
     def category(self, value: str):
@@ -53,11 +69,16 @@ class Expense(RecordBase):
             if not value.strip():
                 raise ValueError("Category must be a non-empty string.")
 
-            self._category = value.strip().lower()
+            self._category_id = CATEGORIES.register(value)
 
         except Exception as e:
             raise SmartBudgetError(f"Invalid category: {e}") from e
 
+    @property
+    def category_id(self) -> int:
+        """Compact id of the normalized category in the shared CATEGORIES registry."""
+        return self._category_id
+
     # --------------------------------------------------------
     # Description
     # --------------------------------------------------------
@@ -68,7 +89,7 @@ class Expense(RecordBase):
                 f"  Name     : {self.name}\n"
                 f"  Category : {self.category}\n"
                 f"  Amount   : {self.amount:.2f}\n"
-            )
+            ) + (f"  Date     : {self.timestamp:%Y-%m-%d %H:%M}\n" if self.timestamp else "")
         except Exception as e:
             raise SmartBudgetError(f"Error generating Expense description: {e}")
 
@@ -77,11 +98,11 @@ class Expense(RecordBase):
     # --------------------------------------------------------
     def to_dict(self) -> dict:
         try:
-            return {
+            return self._with_timestamp({
                 "type": "Expense",
                 "name": self.name,
                 "amount": float(self.amount),
                 "category": self.category,
-            }
+            })
         except Exception as e:
             raise SmartBudgetError(f"Error serializing Expense: {e}")
@@ -9,7 +9,8 @@ Enhancements required for Project Step 3:
     - Fully compatible with unittest mocking
 """
 
-from .base_record import RecordBase, SmartBudgetError
+from .base_record import RecordBase, SmartBudgetError, _stored_timestamp
+from .labels import SOURCES
 
 
 class Income(RecordBase):
@@ -22,7 +23,9 @@ class Income(RecordBase):
         - Safe normalization and defensive attribute access
     """
 
-    def __init__(self, name: str, amount: float, source: str):
+    __slots__ = ("_source_id",)
+
+    def __init__(self, name: str, amount: float, source: str, timestamp=None):
         try:
             # -------- Validation --------
             if not isinstance(name, str) or not name.strip():
@@ -38,22 +41,32 @@ class Income(RecordBase):
                 raise ValueError("Income source must be a non-empty string.")
 
             # -------- Call base class --------
-            super().__init__(name.strip(), float(abs(amount)))
+            super().__init__(name.strip(), float(abs(amount)), timestamp)
 
             # -------- Normalize --------
-            self._source = source.strip().lower()
+            self._source_id = SOURCES.register(source)
 
         except (TypeError, ValueError) as e:
             raise SmartBudgetError(f"Invalid Income initialization: {e}") from e
         except Exception as e:
             raise SmartBudgetError(f"Unexpected error creating Income: {e}") from e
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "Income":
+        """Build an Income from a stored row without re-validating it."""
+        record = cls.__new__(cls)
+        record._name = data["name"]
+        record._amount = float(data["amount"])
+        record._source_id = SOURCES.register(data.get("source", "未知"))
+        record._timestamp = _stored_timestamp(data)
+        return record
+
     # --------------------------------------------------------
     # Properties — safe attribute access
     # --------------------------------------------------------
     @property
     def source(self) -> str:
-        return self._source
+        return SOURCES.label(self._source_id)
 
     @source.setter
     def source(self, value: str):
@@ -63,11 +76,16 @@ class Income(RecordBase):
             if not value.strip():
                 raise ValueError("Source must be a non-empty string.")
 
-            self._source = value.strip().lower()
+            self._source_id = SOURCES.register(value)
 
         except Exception as e:
             raise SmartBudgetError(f"Invalid income source: {e}") from e
 
+    @property
+    def source_id(self) -> int:
+        """Compact id of the normalized source in the shared SOURCES registry."""
+        return self._source_id
+
     # --------------------------------------------------------
     # Description
     # --------------------------------------------------------
@@ -78,7 +96,7 @@ class Income(RecordBase):
                 f"  Name   : {self.name}\n"
                 f"  Source : {self.source}\n"
                 f"  Amount : {self.amount:.2f}\n"
-            )
+            ) + (f"  Date   : {self.timestamp:%Y-%m-%d %H:%M}\n" if self.timestamp else "")
         except Exception as e:
             raise SmartBudgetError(f"Error generating Income description: {e}")
 
@@ -87,11 +105,11 @@ class Income(RecordBase):
     # --------------------------------------------------------
     def to_dict(self) -> dict:
         try:
-            return {
+            return self._with_timestamp({
                 "type": "Income",
                 "name": self.name,
                 "amount": float(self.amount),
                 "source": self.source,
-            }
+            })
         except Exception as e:
             raise SmartBudgetError(f"Error serializing Income: {e}")
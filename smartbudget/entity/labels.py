@@ -0,0 +1,70 @@
+"""
+Shared label registries for SmartBudget entity classes.
+
+Expense categories and income sources are normalized (strip + lower),
+interned once, and given a small integer id. Records store only the id, so a
+ledger with ten categories holds ten label strings no matter how many rows it
+has, and aggregations can group by int instead of hashing full strings.
+
+Ids are assigned in first-seen order and are only meaningful inside one
+process; files always store the label text, never the id.
+"""
+
+import sys
+from typing import Dict, List, Optional
+
+
+class LabelRegistry:
+    """Interns normalized labels and maps them to compact integer ids."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._labels: List[str] = []
+        # Raw spellings ("Food", " food") and normalized labels both map to ids,
+        # so repeated values skip strip()/lower() entirely.
+        self._ids: Dict[str, int] = {}
+
+    def register(self, value: str) -> int:
+        """Return the id for `value`, registering its normalized label if new."""
+        label_id = self._ids.get(value)
+        if label_id is not None:
+            return label_id
+
+        label = value.strip().lower()
+        label_id = self._ids.get(label)
+        if label_id is None:
+            label_id = len(self._labels)
+            self._labels.append(sys.intern(label))
+            self._ids[label] = label_id
+
+        self._ids[value] = label_id
+        return label_id
+
+    def label(self, label_id: int) -> str:
+        """Return the normalized label for an id."""
+        return self._labels[label_id]
+
+    def id_of(self, value: str) -> Optional[int]:
+        """Return the id for `value` without registering it (None if unknown)."""
+        label_id = self._ids.get(value)
+        if label_id is None and isinstance(value, str):
+            label_id = self._ids.get(value.strip().lower())
+        return label_id
+
+    def labels(self) -> List[str]:
+        """All registered labels, indexed by id."""
+        return list(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __contains__(self, value):
+        return self.id_of(value) is not None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.kind!r}, labels={len(self)})"
+
+
+# Process-wide registries used by Expense and Income
+CATEGORIES = LabelRegistry("category")
+SOURCES = LabelRegistry("source")
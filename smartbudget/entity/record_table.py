@@ -0,0 +1,139 @@
+"""
+RecordTable — columnar, array-backed record container.
+
+Holds a ledger as parallel NumPy columns instead of a list of objects:
+    - amounts      float64
+    - types        int8   (TYPE_OTHER / TYPE_INCOME / TYPE_EXPENSE)
+    - label_codes  int32  index into `labels` (category or source)
+    - name_codes   int32  index into `names` (interned record names)
+    - timestamps   datetime64[us] (NaT for undated records)
+
+Totals and per-label sums run as vectorized NumPy reductions, so analytics
+over millions of rows avoid per-object Python work.
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from smartbudget.entity.base_record import RecordBase
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+TYPE_OTHER = 0
+TYPE_INCOME = 1
+TYPE_EXPENSE = 2
+
+_TYPE_CODES = {"Income": TYPE_INCOME, "Expense": TYPE_EXPENSE}
+_TYPE_CLASSES = {TYPE_OTHER: RecordBase, TYPE_INCOME: Income, TYPE_EXPENSE: Expense}
+_LABEL_FIELDS = {TYPE_INCOME: "source", TYPE_EXPENSE: "category"}
+
+
+class RecordTable:
+    """Columnar view of a ledger with vectorized aggregation helpers."""
+
+    def __init__(self, amounts, types, label_codes, name_codes,
+                 labels: List[str], names: List[str], timestamps=None):
+        self.amounts = np.asarray(amounts, dtype=np.float64)
+        self.types = np.asarray(types, dtype=np.int8)
+        self.label_codes = np.asarray(label_codes, dtype=np.int32)
+        self.name_codes = np.asarray(name_codes, dtype=np.int32)
+        if timestamps is None:
+            self.timestamps = np.full(len(self.amounts), np.datetime64("NaT", "us"))
+        else:
+            self.timestamps = np.asarray(timestamps, dtype="datetime64[us]")
+        self.labels = labels
+        self.names = names
+
+    # --------------------------------------------------------
+    # Construction
+    # --------------------------------------------------------
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "RecordTable":
+        """
+        Build a table straight from stored dicts (see RecordBase.to_dict()),
+        without creating record objects. Rows are trusted, as with
+        from_trusted_dict(); legacy negative expense amounts are made positive.
+        """
+        amounts, types, label_codes, name_codes, timestamps = [], [], [], [], []
+        labels: Dict[str, int] = {}
+        names: Dict[str, int] = {}
+
+        for row in rows:
+            code = _TYPE_CODES.get(row.get("type"), TYPE_OTHER)
+            amount = float(row["amount"])
+            label = row.get(_LABEL_FIELDS[code], "未知") if code else ""
+
+            types.append(code)
+            amounts.append(abs(amount) if code == TYPE_EXPENSE else amount)
+            label_codes.append(labels.setdefault(label, len(labels)))
+            name_codes.append(names.setdefault(row["name"], len(names)))
+            timestamps.append(row.get("timestamp") or None)
+
+        return cls(amounts, types, label_codes, name_codes, list(labels), list(names),
+                   np.array(timestamps, dtype="datetime64[us]"))
+
+    @classmethod
+    def from_records(cls, records: Iterable[RecordBase]) -> "RecordTable":
+        """Build a table from Income / Expense / RecordBase objects."""
+        return cls.from_rows(r.to_dict() for r in records)
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rows={len(self)}, labels={len(self.labels)})"
+
+    # --------------------------------------------------------
+    # Row access
+    # --------------------------------------------------------
+    def row(self, index: int) -> dict:
+        """Return row `index` in the same shape as RecordBase.to_dict()."""
+        code = int(self.types[index])
+        data = {
+            "type": _TYPE_CLASSES[code].__name__,
+            "name": self.names[self.name_codes[index]],
+            "amount": float(self.amounts[index]),
+        }
+        if code:
+            data[_LABEL_FIELDS[code]] = self.labels[self.label_codes[index]]
+        stamp = self.timestamps[index]
+        if not np.isnat(stamp):
+            data["timestamp"] = stamp.item().isoformat()
+        return data
+
+    def to_records(self) -> List[RecordBase]:
+        """Materialize the table back into record objects."""
+        return [
+            _TYPE_CLASSES[int(self.types[i])].from_trusted_dict(self.row(i))
+            for i in range(len(self))
+        ]
+
+    # --------------------------------------------------------
+    # Vectorized analytics
+    # --------------------------------------------------------
+    def _total(self, code: int) -> float:
+        return round(float(self.amounts[self.types == code].sum()), 2)
+
+    def _label_totals(self, code: int) -> Dict[str, float]:
+        mask = self.types == code
+        codes = self.label_codes[mask]
+        sums = np.bincount(codes, weights=np.abs(self.amounts[mask]),
+                           minlength=len(self.labels))
+        present = np.bincount(codes, minlength=len(self.labels)) > 0
+        return {self.labels[i]: float(sums[i]) for i in np.flatnonzero(present)}
+
+    def total_income(self) -> float:
+        return self._total(TYPE_INCOME)
+
+    def total_expenses(self) -> float:
+        return self._total(TYPE_EXPENSE)
+
+    def budget_balance(self) -> float:
+        return self.total_income() - self.total_expenses()
+
+    def expense_by_category(self) -> Dict[str, float]:
+        return self._label_totals(TYPE_EXPENSE)
+
+    def income_by_source(self) -> Dict[str, float]:
+        return self._label_totals(TYPE_INCOME)
@@ -10,9 +10,53 @@ from .json_io import (
     save_to_json,
     load_from_json,
     append_to_json,
-    clear_json
+    clear_json,
+    iter_records,
+    load_totals,
+    verify_totals,
+    clear_record_cache,
 )
 
+from .journal_io import (
+    compact_journal,
+    journal_name,
+)
+
+from .aggregate_store import totals_name
+
+from .binary_io import (
+    save_to_binary,
+    load_from_binary,
+    binary_totals,
+    json_to_binary,
+    binary_to_json,
+)
+
+from .parallel_io import (
+    load_parallel,
+    load_rows_parallel,
+    load_jsonl_parallel,
+    totals_parallel,
+)
+
+from .backup_io import backup_ledger
+
+from .backup_chain import (
+    backup_incremental,
+    list_backups,
+    restore_rows,
+    restore_backup,
+    chain_name,
+)
+
+from .storage import (
+    StorageBackend,
+    JsonStorage,
+    open_storage,
+)
+
+from .sqlite_io import SqliteStorage
+
 from .file_utils import (
     file_exists,
     delete_file,
@@ -25,6 +69,46 @@ __all__ = [
     "load_from_json",
     "append_to_json",
     "clear_json",
+    "iter_records",
+    "clear_record_cache",
+
+    # Running totals
+    "load_totals",
+    "verify_totals",
+    "totals_name",
+
+    # Append-only journal
+    "compact_journal",
+    "journal_name",
+
+    # Binary snapshots
+    "save_to_binary",
+    "load_from_binary",
+    "binary_totals",
+    "json_to_binary",
+    "binary_to_json",
+
+    # Parallel sharded loading
+    "load_parallel",
+    "load_rows_parallel",
+    "load_jsonl_parallel",
+    "totals_parallel",
+
+    # Copy-on-write backups
+    "backup_ledger",
+
+    # Incremental backup chains
+    "backup_incremental",
+    "list_backups",
+    "restore_rows",
+    "restore_backup",
+    "chain_name",
+
+    # Storage backends
+    "StorageBackend",
+    "JsonStorage",
+    "SqliteStorage",
+    "open_storage",
 
     # File utilities
     "file_exists",
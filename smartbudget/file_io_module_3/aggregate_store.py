@@ -0,0 +1,183 @@
+"""
+Running totals stored next to a ledger file.
+
+For files/records.json the store is files/records.totals.json. It holds the
+income total, expense total, per-category / per-source sums and a rollup
+cube of (month x category) and (month x source) sums, together with a
+fingerprint (size + mtime) of the snapshot and journal they describe.
+
+Rollup periods are "YYYY-MM" keys taken from the row timestamp; undated rows
+roll up under UNDATED_PERIOD.
+
+json_io keeps the store current: each append adds the new rows in O(1) and a
+reset zeroes it. If the ledger changed behind the store's back (fingerprint
+mismatch, e.g. a hand-edited records.json) the totals are rebuilt from a
+full pass over the rows.
+"""
+
+import json
+import logging
+import os
+from typing import Iterable, Optional
+from smartbudget import stats
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir, atomic_write
+from smartbudget.file_io_module_3.journal_io import journal_path
+from smartbudget.entity.labels import CATEGORIES, SOURCES
+
+logger = logging.getLogger(__name__)
+
+TOTALS_SUFFIX = ".totals"
+# Version 2 added the period rollups; older stores are rebuilt on first read
+STORE_VERSION = 2
+
+UNDATED_PERIOD = "undated"
+
+
+def totals_name(filename):
+    """Return the totals filename paired with a ledger filename."""
+    base, ext = os.path.splitext(filename)
+    return f"{base}{TOTALS_SUFFIX}{ext or '.json'}"
+
+
+def totals_path(filename):
+    return os.path.join(FILES_DIR, totals_name(filename))
+
+
+# --------------------------------------------------------
+# Aggregation
+# --------------------------------------------------------
+def empty_totals() -> dict:
+    return {
+        "count": 0, "income": 0.0, "expenses": 0.0,
+        "by_category": {}, "by_source": {},
+        "by_period_category": {}, "by_period_source": {},
+    }
+
+
+def period_key(row: dict) -> str:
+    """Rollup period of a stored row: "YYYY-MM", or UNDATED_PERIOD."""
+    stamp = row.get("timestamp")
+    return stamp[:7] if stamp else UNDATED_PERIOD
+
+
+@stats.timed("aggregate.rows")
+def aggregate_rows(rows: Iterable[dict], totals: Optional[dict] = None) -> dict:
+    """
+    Fold stored rows (RecordBase.to_dict() shape) into a totals dict.
+    Rows are added in order, so running and full totals sum identically.
+    """
+    totals = totals if totals is not None else empty_totals()
+    by_category = totals["by_category"]
+    by_source = totals["by_source"]
+    by_period_category = totals["by_period_category"]
+    by_period_source = totals["by_period_source"]
+
+    for row in rows:
+        kind = row.get("type")
+        totals["count"] += 1
+
+        if kind == "Income":
+            amount = float(row["amount"])
+            label = SOURCES.label(SOURCES.register(row.get("source", "未知")))
+            totals["income"] += amount
+            by_source[label] = by_source.get(label, 0.0) + amount
+            cell = by_period_source.setdefault(period_key(row), {})
+            cell[label] = cell.get(label, 0.0) + amount
+        elif kind == "Expense":
+            amount = abs(float(row["amount"]))
+            label = CATEGORIES.label(CATEGORIES.register(row.get("category", "未知")))
+            totals["expenses"] += amount
+            by_category[label] = by_category.get(label, 0.0) + amount
+            cell = by_period_category.setdefault(period_key(row), {})
+            cell[label] = cell.get(label, 0.0) + amount
+
+    return totals
+
+
+def merge_totals(left: dict, right: dict) -> dict:
+    """Combine two totals dicts (e.g. partial results from separate files)."""
+    merged = empty_totals()
+    for part in (left, right):
+        merged["count"] += part["count"]
+        merged["income"] += part["income"]
+        merged["expenses"] += part["expenses"]
+        for key in ("by_category", "by_source"):
+            for label, value in part[key].items():
+                merged[key][label] = merged[key].get(label, 0.0) + value
+        for key in ("by_period_category", "by_period_source"):
+            for period, cells in part[key].items():
+                target = merged[key].setdefault(period, {})
+                for label, value in cells.items():
+                    target[label] = target.get(label, 0.0) + value
+    return merged
+
+
+def totals_equal(left: dict, right: dict, places: int = 2) -> bool:
+    """Compare two totals dicts after rounding amounts to `places`."""
+    def sums(d):
+        return {k: round(v, places) for k, v in d.items()}
+
+    def rounded(t):
+        return (
+            t["count"],
+            round(t["income"], places),
+            round(t["expenses"], places),
+            sums(t["by_category"]),
+            sums(t["by_source"]),
+            {p: sums(cells) for p, cells in t["by_period_category"].items()},
+            {p: sums(cells) for p, cells in t["by_period_source"].items()},
+        )
+    return rounded(left) == rounded(right)
+
+
+# --------------------------------------------------------
+# Fingerprint & persistence
+# --------------------------------------------------------
+def ledger_fingerprint(filename) -> list:
+    """(size, mtime_ns) of the snapshot and of the journal; zeros when missing."""
+    stamp = []
+    for path in (os.path.join(FILES_DIR, filename), journal_path(filename)):
+        try:
+            st = os.stat(path)
+            stamp.extend([st.st_size, st.st_mtime_ns])
+        except OSError:
+            stamp.extend([0, 0])
+    return stamp
+
+
+@stats.timed("read.totals")
+def read_totals(filename) -> Optional[dict]:
+    """Return the stored totals if they still describe the ledger, else None."""
+    try:
+        with open(totals_path(filename), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if stored.get("version") != STORE_VERSION:
+        return None
+    if stored.get("fingerprint") != ledger_fingerprint(filename):
+        return None
+
+    return stored["totals"]
+
+
+@stats.timed("write.totals")
+def write_totals(totals: dict, filename) -> None:
+    """Persist totals stamped with the ledger's current fingerprint."""
+    ensure_files_dir()
+    payload = {
+        "version": STORE_VERSION,
+        "fingerprint": ledger_fingerprint(filename),
+        "totals": totals,
+    }
+    with atomic_write(totals_path(filename)) as f:
+        json.dump(payload, f)
+
+
+def delete_totals(filename) -> bool:
+    path = totals_path(filename)
+    if os.path.exists(path):
+        os.remove(path)
+        return True
+    return False
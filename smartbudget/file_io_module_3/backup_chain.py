@@ -0,0 +1,333 @@
+"""
+Incremental (delta) backup chains with point-in-time restore.
+
+A chain is one full backup of a ledger followed by deltas holding only the
+records appended since the backup before them:
+
+    files/records.chain.json          manifest, one entry per backup
+    files/records.chain.0001.jsonl    full: every row of the ledger
+    files/records.chain.0002.jsonl    delta: rows appended since #1
+    ...
+
+Every entry records the ledger's row count and a chained SHA-256 digest of
+its rows, digest_k = sha256(digest_{k-1} + sha256(rows of segment k)), with
+the chain restarting at each full backup. Finding the new rows is cheap in
+the common case: when the snapshot file is the one seen by the previous
+backup, the ledger can only have grown through its journal, so the delta is
+the journal past the recorded byte offset. After a compaction (or for a
+non-JSON backend) the ledger is streamed once and its prefix checked
+against the digest; a ledger that was rewritten, edited or cleared gets a
+new full backup instead of a delta.
+
+restore_rows() replays the full backup and the deltas up to any entry, so
+every backup is a restorable point in time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+from smartbudget.entity.base_record import SmartBudgetError, parse_timestamp
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir, atomic_write
+from smartbudget.file_io_module_3.journal_io import (
+    journal_end,
+    journal_path,
+    recover_ledger,
+    replace_snapshot,
+)
+from smartbudget.file_io_module_3.aggregate_store import aggregate_rows, write_totals
+from smartbudget.file_io_module_3.json_io import (
+    DEFAULT_FILENAME,
+    iter_raw_records,
+    _file_stamp,
+    _gc_paused,
+    _invalidate_cache,
+    _record_from_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+CHAIN_VERSION = 1
+CHAIN_SUFFIX = ".chain"
+KIND_FULL = "full"
+KIND_DELTA = "delta"
+
+
+# --------------------------------------------------------
+# Naming
+# --------------------------------------------------------
+def _stem(filename) -> str:
+    return filename[:-len(".json")] if filename.endswith(".json") else filename
+
+
+def chain_name(filename=DEFAULT_FILENAME) -> str:
+    """Manifest filename of the backup chain of a ledger (records.chain.json)."""
+    return _stem(filename) + CHAIN_SUFFIX + ".json"
+
+
+def segment_name(filename, entry_id: int) -> str:
+    return f"{_stem(filename)}{CHAIN_SUFFIX}.{entry_id:04d}.jsonl"
+
+
+def is_chain_file(name) -> bool:
+    """Whether name is a chain manifest or segment managed by this module."""
+    if name.endswith(CHAIN_SUFFIX + ".json"):
+        return True
+    parts = name.rsplit(".", 3)
+    return (len(parts) == 4 and "." + parts[1] == CHAIN_SUFFIX
+            and parts[2].isdigit() and parts[3] == "jsonl")
+
+
+# --------------------------------------------------------
+# Manifest
+# --------------------------------------------------------
+def read_manifest(filename=DEFAULT_FILENAME) -> dict:
+    """The chain manifest of a ledger; an empty chain when none exists."""
+    path = os.path.join(FILES_DIR, chain_name(filename))
+    if not os.path.exists(path):
+        return {"version": CHAIN_VERSION, "ledger": filename, "entries": []}
+
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != CHAIN_VERSION:
+        raise SmartBudgetError(f"Unsupported backup chain version in {path}")
+    return manifest
+
+
+def _write_manifest(manifest: dict, filename) -> None:
+    with atomic_write(os.path.join(FILES_DIR, chain_name(filename))) as f:
+        json.dump(manifest, f, indent=4)
+
+
+def list_backups(filename=DEFAULT_FILENAME) -> List[dict]:
+    """Entries of the chain, oldest first: {"id", "kind", "created", "count", "total", ...}."""
+    return read_manifest(filename)["entries"]
+
+
+# --------------------------------------------------------
+# Digests
+# --------------------------------------------------------
+def _canonical(row: dict) -> bytes:
+    return json.dumps(row, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _segment_digest(rows: Iterable[dict]) -> str:
+    h = hashlib.sha256()
+    for row in rows:
+        h.update(_canonical(row))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _chain_digest(previous: str, segment: str) -> str:
+    return hashlib.sha256((previous + segment).encode("ascii")).hexdigest()
+
+
+def _current_link(entries: List[dict]) -> List[dict]:
+    """Entries from the latest full backup onward."""
+    for i in range(len(entries) - 1, -1, -1):
+        if entries[i]["kind"] == KIND_FULL:
+            return entries[i:]
+    return []
+
+
+# --------------------------------------------------------
+# Finding new rows
+# --------------------------------------------------------
+def _journal_rows_since(filename, offset: int, end: int) -> Optional[List[dict]]:
+    """Rows in journal bytes [offset, end), or None if the journal shrank."""
+    if end < offset:
+        return None
+    if end == offset:
+        return []
+    with open(journal_path(filename), "rb") as f:
+        f.seek(offset)
+        data = f.read(end - offset)
+    return [json.loads(line) for line in data.split(b"\n") if line.strip()]
+
+
+def _rows_after_prefix(rows: Iterable[dict], link: List[dict]) -> Optional[List[dict]]:
+    """
+    Verify that `rows` starts with the rows backed up by `link` and return
+    the rest, or None when the ledger no longer matches the chain.
+    """
+    boundaries = [entry["total"] for entry in link]
+    chain, position, segment = "", 0, hashlib.sha256()
+    index, extra = 0, []
+
+    def close_segments():
+        nonlocal chain, segment, index
+        # Several boundaries can coincide (empty deltas, empty full backup)
+        while index < len(boundaries) and position == boundaries[index]:
+            chain = _chain_digest(chain, segment.hexdigest())
+            segment = hashlib.sha256()
+            index += 1
+
+    for row in rows:
+        close_segments()
+        if index < len(boundaries):
+            segment.update(_canonical(row))
+            segment.update(b"\n")
+            position += 1
+        else:
+            extra.append(row)
+    close_segments()
+
+    if index < len(boundaries) or chain != link[-1]["digest"]:
+        return None
+    return extra
+
+
+# --------------------------------------------------------
+# Backup
+# --------------------------------------------------------
+def backup_incremental(filename=DEFAULT_FILENAME,
+                       rows: Optional[Callable[[], Iterable[dict]]] = None) -> dict:
+    """
+    Add a backup of files/filename to its chain and return the new entry.
+
+    Writes a delta with the rows appended since the previous backup, or a
+    full backup when the chain is empty or the ledger was rewritten.
+    `rows` returns the ledger's stored dicts for backends other than the
+    JSON ledger (no journal fast path then).
+    """
+    ensure_files_dir()
+    manifest = read_manifest(filename)
+    entries = manifest["entries"]
+    link = _current_link(entries)
+    last = link[-1] if link else None
+
+    snapshot, end_offset = None, 0
+    if rows is None:
+        recover_ledger(filename)
+        snapshot = _file_stamp(os.path.join(FILES_DIR, filename))
+        snapshot = list(snapshot) if snapshot is not None else None
+        end_offset = journal_end(filename)
+
+        def rows():
+            return iter_raw_records(filename)
+
+    new_rows = None
+    if last is not None:
+        if snapshot is not None and snapshot == last.get("snapshot"):
+            new_rows = _journal_rows_since(filename, last["journal_offset"], end_offset)
+        if new_rows is None:
+            new_rows = _rows_after_prefix(rows(), link)
+
+    if new_rows is None:
+        kind, new_rows, previous, base_total = KIND_FULL, list(rows()), "", 0
+    else:
+        kind, previous, base_total = KIND_DELTA, last["digest"], last["total"]
+
+    entry_id = entries[-1]["id"] + 1 if entries else 1
+    entry = {
+        "id": entry_id,
+        "kind": kind,
+        "file": segment_name(filename, entry_id),
+        "created": datetime.now().isoformat(),
+        "count": len(new_rows),
+        "total": base_total + len(new_rows),
+        "digest": _chain_digest(previous, _segment_digest(new_rows)),
+        "snapshot": snapshot,
+        "journal_offset": end_offset,
+    }
+
+    with atomic_write(os.path.join(FILES_DIR, entry["file"])) as f:
+        for row in new_rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    # The manifest is written last: a crash before it leaves an unreferenced segment
+    entries.append(entry)
+    _write_manifest(manifest, filename)
+
+    logger.info(f"[backup_chain] Backup #{entry_id} of {filename}: {kind}, {len(new_rows)} rows")
+    return entry
+
+
+# --------------------------------------------------------
+# Restore
+# --------------------------------------------------------
+def _is_bare_date(point) -> bool:
+    if isinstance(point, str):
+        return "T" not in point.strip() and " " not in point.strip()
+    return isinstance(point, date) and not isinstance(point, datetime)
+
+
+def find_backup(filename=DEFAULT_FILENAME, point=None) -> dict:
+    """
+    The entry to restore for `point`: None = latest, an int = that backup
+    id, otherwise the latest backup taken at or before the given time
+    (a bare date includes the whole day).
+    """
+    entries = list_backups(filename)
+    if not entries:
+        raise SmartBudgetError(f"No backups of '{filename}' found")
+
+    if point is None:
+        return entries[-1]
+    if isinstance(point, int) or (isinstance(point, str) and point.strip().isdigit()):
+        for entry in entries:
+            if entry["id"] == int(point):
+                return entry
+        raise SmartBudgetError(f"Backup #{int(point)} of '{filename}' not found")
+
+    cutoff = parse_timestamp(point)
+    if _is_bare_date(point):
+        cutoff += timedelta(days=1)
+        candidates = [e for e in entries if parse_timestamp(e["created"]) < cutoff]
+    else:
+        candidates = [e for e in entries if parse_timestamp(e["created"]) <= cutoff]
+    if not candidates:
+        raise SmartBudgetError(f"No backup of '{filename}' at or before {point}")
+    return candidates[-1]
+
+
+def _read_segment(name) -> List[dict]:
+    path = os.path.join(FILES_DIR, name)
+    if not os.path.exists(path):
+        raise SmartBudgetError(f"Backup segment '{name}' is missing")
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def restore_rows(filename=DEFAULT_FILENAME, point=None) -> List[dict]:
+    """Stored dicts of files/filename as of a backup point (see find_backup)."""
+    target = find_backup(filename, point)
+    entries = list_backups(filename)
+    upto = entries[:entries.index(target) + 1]
+
+    rows: List[dict] = []
+    for entry in _current_link(upto):
+        rows.extend(_read_segment(entry["file"]))
+
+    if len(rows) != target["total"]:
+        raise SmartBudgetError(
+            f"Backup chain of '{filename}' is inconsistent at #{target['id']}"
+        )
+    return rows
+
+
+def restore_records(filename=DEFAULT_FILENAME, point=None) -> list:
+    """Record objects of files/filename as of a backup point, e.g. for StorageBackend.save()."""
+    rows = restore_rows(filename, point)
+    with _gc_paused():
+        return [_record_from_dict(row, validate=False) for row in rows]
+
+
+def restore_backup(filename=DEFAULT_FILENAME, point=None, target: Optional[str] = None) -> int:
+    """
+    Rebuild the ledger as of `point` into files/target (default: the
+    ledger itself). Returns the number of restored records.
+    """
+    rows = restore_rows(filename, point)
+    target = target or filename
+
+    recover_ledger(target)
+    replace_snapshot(rows, target)
+    _invalidate_cache(target)
+    write_totals(aggregate_rows(rows), target)
+
+    logger.info(f"[backup_chain] Restored {len(rows)} rows of {filename} into {target}")
+    return len(rows)
@@ -0,0 +1,77 @@
+"""
+Copy-on-write backups of JSON ledgers.
+
+A backup copies the ledger's files byte for byte; no record is parsed or
+re-serialized. The snapshot is never modified in place (every write
+replaces it with os.replace, see journal_io.replace_snapshot), so a backup
+can share it through a hard link: ten backups of an unchanged ledger cost
+one copy of the data. The append-only journal is modified in place and is
+therefore copied. When hard links are not supported (other file system,
+permissions) the snapshot is copied as well. Editing a snapshot in place
+outside the app would show through in every backup linked to it.
+
+The totals store is copied with its timestamps, so the backup's running
+totals are current immediately.
+"""
+
+import logging
+import os
+import shutil
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir, fsync_dir
+from smartbudget.file_io_module_3.journal_io import journal_path, recover_ledger
+from smartbudget.file_io_module_3.aggregate_store import totals_path
+
+logger = logging.getLogger(__name__)
+
+MODE_LINK = "link"
+MODE_COPY = "copy"
+
+
+def _replace_with_link(src, dst) -> str:
+    """Make dst a hard link to src (copy if linking fails); atomic for dst."""
+    tmp = dst + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    try:
+        os.link(src, tmp)
+        mode = MODE_LINK
+    except OSError:
+        shutil.copy2(src, tmp)
+        mode = MODE_COPY
+    os.replace(tmp, dst)
+    return mode
+
+
+def _replace_with_copy(src, dst) -> None:
+    """Copy src over dst (timestamps preserved), or remove dst if src is absent."""
+    if not os.path.exists(src):
+        if os.path.exists(dst):
+            os.remove(dst)
+        return
+    tmp = dst + ".tmp"
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+
+def backup_ledger(source, target) -> str:
+    """
+    Back up files/source (snapshot, journal, totals) to files/target.
+    Returns MODE_LINK when the snapshot is shared, MODE_COPY otherwise.
+    """
+    ensure_files_dir()
+    recover_ledger(source)
+
+    if source == target:
+        raise ValueError("Backup target is the ledger itself")
+    src = os.path.join(FILES_DIR, source)
+    dst = os.path.join(FILES_DIR, target)
+    if not os.path.exists(src):
+        raise FileNotFoundError(src)
+
+    mode = _replace_with_link(src, dst)
+    _replace_with_copy(journal_path(source), journal_path(target))
+    _replace_with_copy(totals_path(source), totals_path(target))
+    fsync_dir(FILES_DIR)
+
+    logger.info(f"[backup_io] Backed up {source} to {target} ({mode})")
+    return mode
@@ -0,0 +1,260 @@
+"""
+Compact binary snapshot format for SmartBudget records.
+
+Layout (little-endian, every section starts on an 8-byte boundary):
+
+    header      magic b"SBRB", version u16, flags u16, count u64,
+                label_count u32, name_count u32
+    amounts     float64 x count
+    types       uint8   x count   (0 = other, 1 = Income, 2 = Expense)
+    label ids   uint32  x count   (index into the label table)
+    name ids    uint32  x count   (index into the name table)
+    timestamps  int64   x count   (only when flags & FLAG_TIMESTAMPS; microseconds
+                                   since 1970-01-01, NO_TIMESTAMP when undated)
+    offsets     uint32  x (label_count + name_count + 1)
+    heap        UTF-8 bytes of all labels followed by all names
+
+Fixed-width columns let binary_totals() sum a snapshot through mmap without
+decoding any record. Strings are stored once each in the heap.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+from itertools import compress
+from typing import Iterable, Iterator, List, Tuple
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir, atomic_write
+from smartbudget.file_io_module_3.json_io import (
+    DEFAULT_FILENAME,
+    iter_raw_records,
+    save_to_json,
+    _record_from_dict,
+    _gc_paused,
+)
+
+DEFAULT_BINARY_FILENAME = "records.sbr"
+
+MAGIC = b"SBRB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQII")
+
+# Header flags
+FLAG_TIMESTAMPS = 1
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+NO_TIMESTAMP = -(2 ** 63)
+
+TYPE_OTHER = 0
+TYPE_INCOME = 1
+TYPE_EXPENSE = 2
+
+_TYPE_CODES = {"Income": TYPE_INCOME, "Expense": TYPE_EXPENSE}
+_TYPE_NAMES = {TYPE_OTHER: "RecordBase", TYPE_INCOME: "Income", TYPE_EXPENSE: "Expense"}
+_LABEL_FIELDS = {TYPE_INCOME: "source", TYPE_EXPENSE: "category"}
+
+
+def _pad(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _layout(count: int, label_count: int, name_count: int, flags: int = 0) -> dict:
+    """Byte offsets of each section for the given sizes."""
+    offsets = {"amounts": _pad(HEADER.size)}
+    offsets["types"] = offsets["amounts"] + _pad(8 * count)
+    offsets["labels"] = offsets["types"] + _pad(count)
+    offsets["names"] = offsets["labels"] + _pad(4 * count)
+    offsets["strings"] = offsets["names"] + _pad(4 * count)
+    if flags & FLAG_TIMESTAMPS:
+        offsets["timestamps"] = offsets["strings"]
+        offsets["strings"] += 8 * count
+    offsets["heap"] = offsets["strings"] + 4 * (label_count + name_count + 1)
+    return offsets
+
+
+# --------------------------------------------------------
+# Writing
+# --------------------------------------------------------
+def save_rows_to_binary(rows: Iterable[dict], filename=DEFAULT_BINARY_FILENAME) -> int:
+    """
+    Write stored-format rows (RecordBase.to_dict() shape) to files/filename.
+    Rows are streamed into compact arrays; returns the number written.
+    """
+    amounts, types = array("d"), array("B")
+    label_ids, name_ids = array("I"), array("I")
+    stamps = array("q")
+    labels, names = {}, {}
+
+    for row in rows:
+        code = _TYPE_CODES.get(row.get("type"), TYPE_OTHER)
+        amount = float(row["amount"])
+        label = row.get(_LABEL_FIELDS[code], "未知") if code else ""
+
+        types.append(code)
+        amounts.append(abs(amount) if code == TYPE_EXPENSE else amount)
+        label_ids.append(labels.setdefault(label, len(labels)))
+        name_ids.append(names.setdefault(row["name"], len(names)))
+
+        stamp = row.get("timestamp")
+        stamps.append((datetime.fromisoformat(stamp) - _EPOCH) // _MICROSECOND
+                      if stamp else NO_TIMESTAMP)
+
+    count = len(amounts)
+    encoded = [s.encode("utf-8") for s in list(labels) + list(names)]
+    string_offsets = array("I", [0])
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    # Undated ledgers keep the original layout; the column costs 8 bytes/row
+    flags = FLAG_TIMESTAMPS if any(s != NO_TIMESTAMP for s in stamps) else 0
+    sections = [("amounts", amounts), ("types", types), ("labels", label_ids), ("names", name_ids)]
+    if flags & FLAG_TIMESTAMPS:
+        sections.append(("timestamps", stamps))
+    sections.append(("strings", string_offsets))
+
+    if sys.byteorder == "big":
+        for column in (amounts, label_ids, name_ids, stamps, string_offsets):
+            column.byteswap()
+
+    layout = _layout(count, len(labels), len(names), flags)
+
+    ensure_files_dir()
+    path = os.path.join(FILES_DIR, filename)
+    with atomic_write(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, count, len(labels), len(names)))
+        for section, column in sections:
+            f.write(b"\0" * (layout[section] - f.tell()))
+            column.tofile(f)
+        f.write(b"".join(encoded))
+
+    return count
+
+
+def save_to_binary(records, filename=DEFAULT_BINARY_FILENAME) -> int:
+    """Save Income / Expense / RecordBase objects as a binary snapshot."""
+    return save_rows_to_binary((r.to_dict() for r in records), filename)
+
+
+# --------------------------------------------------------
+# Reading
+# --------------------------------------------------------
+class _Snapshot:
+    """mmap-backed view of one binary snapshot; use as a context manager."""
+
+    def __init__(self, filename):
+        self.path = os.path.join(FILES_DIR, filename)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+
+        magic, version, flags, count, label_count, name_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a SmartBudget binary snapshot")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported binary snapshot version {version} in {self.path}")
+
+        self.flags = flags
+        self.count = count
+        self.label_count = label_count
+        self.name_count = name_count
+        self.layout = _layout(count, label_count, name_count, flags)
+
+    def column(self, section: str, fmt: str, length: int) -> memoryview:
+        """Zero-copy typed view of one fixed-width section."""
+        start = self.layout[section]
+        raw = memoryview(self._map)[start:start + length * struct.calcsize(fmt)]
+        self._views.append(raw)
+
+        if sys.byteorder == "big" and fmt != "B":
+            # Stored little-endian: big-endian hosts read a swapped copy
+            column = array(fmt, raw.tobytes())
+            column.byteswap()
+            return memoryview(column)
+
+        view = raw.cast(fmt)
+        self._views.append(view)
+        return view
+
+    def strings(self) -> Tuple[List[str], List[str]]:
+        """Decode the label and name tables from the heap."""
+        offsets = self.column("strings", "I", self.label_count + self.name_count + 1)
+        heap = self.layout["heap"]
+        table = [
+            self._map[heap + offsets[i]:heap + offsets[i + 1]].decode("utf-8")
+            for i in range(self.label_count + self.name_count)
+        ]
+        return table[:self.label_count], table[self.label_count:]
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_binary_rows(filename=DEFAULT_BINARY_FILENAME) -> Iterator[dict]:
+    """Yield rows of a binary snapshot in RecordBase.to_dict() shape."""
+    with _Snapshot(filename) as snap:
+        labels, names = snap.strings()
+        amounts = snap.column("amounts", "d", snap.count)
+        types = snap.column("types", "B", snap.count)
+        label_ids = snap.column("labels", "I", snap.count)
+        name_ids = snap.column("names", "I", snap.count)
+        stamps = (snap.column("timestamps", "q", snap.count)
+                  if snap.flags & FLAG_TIMESTAMPS else None)
+
+        for i in range(snap.count):
+            code = types[i]
+            row = {"type": _TYPE_NAMES[code], "name": names[name_ids[i]], "amount": amounts[i]}
+            if code:
+                row[_LABEL_FIELDS[code]] = labels[label_ids[i]]
+            if stamps is not None and stamps[i] != NO_TIMESTAMP:
+                row["timestamp"] = (_EPOCH + stamps[i] * _MICROSECOND).isoformat()
+            yield row
+
+
+def load_from_binary(filename=DEFAULT_BINARY_FILENAME, validate=True):
+    """Load a binary snapshot as Income / Expense / RecordBase objects."""
+    with _gc_paused():
+        return [_record_from_dict(row, validate) for row in iter_binary_rows(filename)]
+
+
+def binary_totals(filename=DEFAULT_BINARY_FILENAME) -> Tuple[float, float]:
+    """
+    (total income, total expenses) of a binary snapshot.
+    Sums the mmap'd amount column filtered by the type column; no record or
+    string is decoded.
+    """
+    with _Snapshot(filename) as snap:
+        amounts = snap.column("amounts", "d", snap.count)
+        types = snap.column("types", "B", snap.count)
+        income = sum(compress(amounts, map(TYPE_INCOME.__eq__, types)))
+        expenses = sum(compress(amounts, map(TYPE_EXPENSE.__eq__, types)))
+    return round(income, 2), round(expenses, 2)
+
+
+# --------------------------------------------------------
+# Conversion
+# --------------------------------------------------------
+def json_to_binary(json_filename=DEFAULT_FILENAME, binary_filename=DEFAULT_BINARY_FILENAME) -> int:
+    """Convert a JSON ledger (snapshot + journal) to a binary snapshot."""
+    return save_rows_to_binary(iter_raw_records(json_filename), binary_filename)
+
+
+def binary_to_json(binary_filename=DEFAULT_BINARY_FILENAME, json_filename=DEFAULT_FILENAME) -> int:
+    """Convert a binary snapshot back to a JSON ledger. Returns the record count."""
+    records = load_from_binary(binary_filename, validate=False)
+    save_to_json(records, json_filename)
+    return len(records)
@@ -4,6 +4,7 @@ All functions operate inside the 'files' directory.
 """
 
 import os
+from contextlib import contextmanager
 
 # Directory where all files are stored
 FILES_DIR = "files"
@@ -36,3 +37,43 @@ def list_files():
     ensure_files_dir()
     return [f for f in os.listdir(FILES_DIR)
             if os.path.isfile(os.path.join(FILES_DIR, f))]
+
+
+# --------------------------------------------------------
+# Durable writes
+# --------------------------------------------------------
+def fsync_dir(directory):
+    """Flush a directory entry (rename/unlink) to disk; no-op where unsupported."""
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path, mode="w", encoding="utf-8"):
+    """
+    Write `path` all-or-nothing: data goes to path + ".tmp", is fsynced and
+    then renamed over `path` with os.replace(). A crash or exception at any
+    point leaves the previous file untouched.
+    """
+    tmp = path + ".tmp"
+    f = open(tmp, mode, encoding=None if "b" in mode else encoding)
+    try:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(tmp, path)
+    except BaseException:
+        f.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    fsync_dir(os.path.dirname(path))
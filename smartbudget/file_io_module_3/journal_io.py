@@ -0,0 +1,274 @@
+"""
+Append-only journal storage for SmartBudget.
+
+A ledger file such as records.json (a JSON array, the "snapshot") may have a
+companion journal, records.jsonl, holding one JSON object per line for every
+record appended since the last compaction. Appending a record is a single
+buffered write plus fsync instead of a full rewrite of the snapshot.
+
+Compaction folds the journal into the snapshot and removes the journal.
+Existing records.json files need no conversion: a snapshot without a
+journal is read exactly as before, and the first compaction rewrites it in
+the same array format.
+
+Replacing the snapshot and dropping the journal is two steps, so it is
+guarded by a write-ahead marker (records.json.wal). The new snapshot is
+written and fsynced to records.json.tmp first; then the marker is written;
+then the temp file is renamed over the snapshot, the journal removed and
+the marker deleted. recover_ledger() finishes a replace interrupted after
+the marker and discards a temp file that never got one, so a crash leaves
+either the old ledger or the new one, never a mix.
+"""
+
+import json
+import logging
+import os
+from typing import Iterator, List
+from smartbudget import stats
+from smartbudget.file_io_module_3.file_utils import (
+    FILES_DIR,
+    ensure_files_dir,
+    atomic_write,
+    fsync_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".jsonl"
+WAL_SUFFIX = ".wal"
+
+# Compact once the journal is at least this large AND larger than the
+# snapshot, so the cost of rewriting the snapshot is amortized over appends.
+COMPACT_MIN_BYTES = 1024 * 1024
+
+# Bytes read per step when scanning back for the journal's last newline
+_TAIL_CHUNK = 64 * 1024
+
+
+def journal_name(filename):
+    """Return the journal filename paired with a snapshot filename."""
+    if filename.endswith(".json"):
+        return filename + "l"
+    return filename + JOURNAL_SUFFIX
+
+
+def journal_path(filename):
+    """Return the full path of the journal paired with files/filename."""
+    return os.path.join(FILES_DIR, journal_name(filename))
+
+
+def wal_name(filename):
+    """Return the write-ahead marker filename paired with a snapshot filename."""
+    return filename + WAL_SUFFIX
+
+
+def wal_path(filename):
+    return os.path.join(FILES_DIR, wal_name(filename))
+
+
+def journal_size(filename) -> int:
+    """Size of the journal in bytes (0 when there is none)."""
+    try:
+        return os.path.getsize(journal_path(filename))
+    except OSError:
+        return 0
+
+
+def journal_end(filename) -> int:
+    """Byte offset just past the journal's last complete line."""
+    path = journal_path(filename)
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0
+
+    with open(path, "rb") as f:
+        end = size
+        while end > 0:
+            start = max(0, end - _TAIL_CHUNK)
+            f.seek(start)
+            chunk = f.read(end - start)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def truncate_torn_tail(filename) -> int:
+    """
+    Cut a torn final line (crash mid-append) off the journal of
+    files/filename, so the next append starts on a fresh line.
+    Returns the number of bytes removed.
+    """
+    size = journal_size(filename)
+    end = journal_end(filename)
+    if end >= size:
+        return 0
+
+    with open(journal_path(filename), "r+b") as f:
+        f.truncate(end)
+        f.flush()
+        os.fsync(f.fileno())
+    logger.warning(f"[journal_io] Removed {size - end} bytes of an incomplete last line "
+                   f"from {journal_name(filename)}.")
+    return size - end
+
+
+@stats.timed("write.journal")
+def append_to_journal(rows: List[dict], filename) -> int:
+    """
+    Append serialized records to the journal of files/filename.
+    All rows go out in one write followed by fsync. Returns bytes written.
+    A torn last line left by an earlier crash is truncated first; appending
+    after it would glue the new row onto the fragment.
+    """
+    if not rows:
+        return 0
+
+    ensure_files_dir()
+    truncate_torn_tail(filename)
+    payload = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+    data = payload.encode("utf-8")
+
+    with open(journal_path(filename), "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    return len(data)
+
+
+def iter_journal(filename) -> Iterator[dict]:
+    """
+    Yield the rows stored in the journal of files/filename, in append order.
+    A torn final line (crash mid-append) is skipped with a warning. Reads
+    leave it in place; append_to_journal() truncates it before the next row
+    is written, so it never ends up in the middle of the journal. Any other
+    line that does not parse raises.
+    """
+    path = journal_path(filename)
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                if line.endswith("\n"):
+                    raise
+                logger.warning(
+                    f"[journal_io] Ignoring incomplete last line {lineno} in {path}: {exc}"
+                )
+
+
+def read_journal(filename) -> List[dict]:
+    """Return all journal rows of files/filename as a list."""
+    return list(iter_journal(filename))
+
+
+def clear_journal(filename) -> bool:
+    """Remove the journal of files/filename. Returns True if one existed."""
+    path = journal_path(filename)
+    if os.path.exists(path):
+        os.remove(path)
+        return True
+    return False
+
+
+def should_compact(filename) -> bool:
+    """Whether the journal has grown enough to be folded into the snapshot."""
+    size = journal_size(filename)
+    if size < COMPACT_MIN_BYTES:
+        return False
+
+    try:
+        snapshot_size = os.path.getsize(os.path.join(FILES_DIR, filename))
+    except OSError:
+        snapshot_size = 0
+
+    return size >= snapshot_size
+
+
+def compact_journal(filename) -> int:
+    """
+    Fold the journal into the snapshot files/filename and drop the journal.
+    Works on the stored rows directly; no record objects are built.
+    Returns the number of rows moved out of the journal.
+    """
+    rows = read_journal(filename)
+    if not rows:
+        clear_journal(filename)
+        return 0
+
+    ensure_files_dir()
+    path = os.path.join(FILES_DIR, filename)
+
+    snapshot = []
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+
+    replace_snapshot(snapshot + rows, filename)
+    logger.info(f"[journal_io] Compacted {len(rows)} journal rows into {path}.")
+    return len(rows)
+
+
+# --------------------------------------------------------
+# Snapshot replacement (write-ahead marker)
+# --------------------------------------------------------
+def _finish_replace(filename) -> None:
+    """Steps after the marker; safe to repeat if interrupted again."""
+    path = os.path.join(FILES_DIR, filename)
+    if os.path.exists(path + ".tmp"):
+        os.replace(path + ".tmp", path)
+    clear_journal(filename)
+    fsync_dir(FILES_DIR)
+    os.remove(wal_path(filename))
+
+
+@stats.timed("write.snapshot")
+def replace_snapshot(rows: List[dict], filename) -> None:
+    """
+    Atomically make `rows` the whole ledger files/filename: the snapshot
+    is replaced and the journal dropped as one crash-safe operation.
+    """
+    ensure_files_dir()
+    path = os.path.join(FILES_DIR, filename)
+
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        # Interrupted before the marker: the old ledger stays authoritative
+        if os.path.exists(path + ".tmp"):
+            os.remove(path + ".tmp")
+        raise
+
+    with atomic_write(wal_path(filename)) as f:
+        json.dump({"op": "replace_snapshot", "snapshot": filename}, f)
+
+    _finish_replace(filename)
+
+
+def recover_ledger(filename) -> bool:
+    """
+    Repair files/filename after a crash during replace_snapshot().
+    Returns True when an interrupted replace was completed.
+    """
+    if os.path.exists(wal_path(filename)):
+        _finish_replace(filename)
+        logger.warning(f"[journal_io] Completed interrupted snapshot replace of {filename}.")
+        return True
+
+    tmp = os.path.join(FILES_DIR, filename) + ".tmp"
+    if os.path.exists(tmp):
+        # Written before the marker: the old snapshot + journal are authoritative
+        os.remove(tmp)
+        logger.warning(f"[journal_io] Discarded incomplete snapshot write {tmp}.")
+    return False
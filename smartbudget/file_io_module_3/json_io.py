@@ -1,69 +1,388 @@
 """
 JSON input/output helpers for SmartBudget.
+
+A ledger is stored as a JSON array snapshot (files/<name>.json) plus an
+append-only JSON Lines journal (files/<name>.jsonl, see journal_io).
+Loading reads both; appending only touches the journal. iter_records()
+streams the same data lazily for constant-memory passes over big ledgers.
+Running totals (see aggregate_store) are kept current by every write here.
+Every write is crash-safe: snapshots are replaced atomically (see
+journal_io.replace_snapshot) and reads first finish any interrupted replace.
+
+load_from_json() keeps the parsed records of recently loaded ledgers in a
+small LRU cache keyed by path and the (mtime_ns, size, inode) of the snapshot
+and journal. Writes through this module drop the entry explicitly; any other
+change to the files changes the key. Cached record objects are shared
+between callers and should be treated as read-only.
 """
 
+import gc
 import json
 import os
-from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir, atomic_write
+from smartbudget.file_io_module_3.journal_io import (
+    append_to_journal,
+    iter_journal,
+    journal_path,
+    replace_snapshot,
+    recover_ledger,
+    should_compact,
+    compact_journal,
+)
+from smartbudget.file_io_module_3.aggregate_store import (
+    aggregate_rows,
+    empty_totals,
+    read_totals,
+    write_totals,
+    totals_equal,
+    totals_path,
+)
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import  Expense
 from smartbudget.entity.base_record import RecordBase
+from smartbudget import stats
 
 DEFAULT_FILENAME = "records.json"
 
+# Characters read per refill when streaming a snapshot array
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_ITEM_SEPARATORS = re.compile(r"[ \t\r\n,]*")
+
+
+# Record classes by stored "type"; anything else loads as a RecordBase
+_RECORD_TYPES = {"Income": Income, "Expense": Expense}
+
+# Parsed ledgers kept by load_from_json(); least recently used is evicted
+RECORD_CACHE_SIZE = 8
+_record_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+# --------------------------------------------------------
+# Parsed-records cache
+# --------------------------------------------------------
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _ledger_stamp(filename):
+    """Identity of the ledger's current contents: snapshot and journal stats."""
+    return (
+        _file_stamp(os.path.join(FILES_DIR, filename)),
+        _file_stamp(journal_path(filename)),
+    )
+
+
+def _cache_get(filename, validate):
+    key = (os.path.abspath(os.path.join(FILES_DIR, filename)), validate)
+    entry = _record_cache.get(key)
+    if entry is None or entry[0] != _ledger_stamp(filename):
+        stats.count("cache.miss")
+        return None
+    _record_cache.move_to_end(key)
+    stats.count("cache.hit")
+    return entry[1]
+
+
+def _cache_put(filename, validate, records):
+    if RECORD_CACHE_SIZE <= 0:
+        return
+    key = (os.path.abspath(os.path.join(FILES_DIR, filename)), validate)
+    _record_cache[key] = (_ledger_stamp(filename), records)
+    _record_cache.move_to_end(key)
+    while len(_record_cache) > RECORD_CACHE_SIZE:
+        _record_cache.popitem(last=False)
+
+
+def _invalidate_cache(filename):
+    path = os.path.abspath(os.path.join(FILES_DIR, filename))
+    for validate in (True, False):
+        _record_cache.pop((path, validate), None)
+
+
+def clear_record_cache():
+    """Drop every cached ledger (e.g. after editing files outside the app)."""
+    _record_cache.clear()
+
+
+def _record_from_dict(item, validate=True):
+    """
+    Rebuild an Income / Expense / RecordBase from its stored dict.
+    validate=False trusts the row (written by this app) and skips validation.
+    """
+    if not validate:
+        return _RECORD_TYPES.get(item.get("type"), RecordBase).from_trusted_dict(item)
+
+    if item.get("type") == "Income":
+        return Income(item["name"], item["amount"], item.get("source", "未知"), item.get("timestamp"))
+    if item.get("type") == "Expense":
+        return Expense(item["name"], abs(item["amount"]), item.get("category", "未知"), item.get("timestamp"))
+    return RecordBase(item["name"], item["amount"], item.get("timestamp"))
+
+
+def _use_workers(workers) -> bool:
+    """
+    Whether a workers= request should go through parallel_io. Extra
+    processes only help with a CPU each; otherwise the serial path is faster.
+    """
+    return workers is not None and min(workers, os.cpu_count() or 1) > 1
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Suspend the cyclic garbage collector while building many records.
+    Records hold no reference cycles, so the collector's repeated full
+    passes over a growing list are pure overhead during a bulk load.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _write_empty_snapshot(path):
+    with atomic_write(path) as f:
+        json.dump([], f, indent=4)
+
+
 def save_to_json(records, filename=DEFAULT_FILENAME):
-    """Save to files/filename."""
+    """Save to files/filename. Replaces the snapshot and drops its journal."""
     ensure_files_dir()
+    data = [r.to_dict() for r in records]
+
+    recover_ledger(filename)
+    replace_snapshot(data, filename)
+    _invalidate_cache(filename)
+
+    # Refresh running totals only for ledgers that already keep them
+    if os.path.exists(totals_path(filename)):
+        write_totals(aggregate_rows(data), filename)
+
+
+def _iter_json_array(f, chunk_size=STREAM_CHUNK_SIZE) -> Iterator:
+    """
+    Yield the items of a top-level JSON array from an open text file.
+    Only the current item plus one chunk is held in memory at a time.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    opened = False
+
+    while True:
+        # Skip whitespace (and item separators once inside the array)
+        pos = (_ITEM_SEPARATORS if opened else _WHITESPACE).match(buf, pos).end()
+
+        if pos == len(buf):
+            if eof:
+                raise json.JSONDecodeError("Unterminated JSON array", buf, pos)
+            chunk = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+
+        if not opened:
+            if buf[pos] != "[":
+                raise json.JSONDecodeError("Expected a JSON array", buf, pos)
+            opened = True
+            pos += 1
+            continue
+
+        if buf[pos] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = None
+
+        # Incomplete item, or a scalar that may continue in the next chunk
+        if end is None or (end == len(buf) and not eof):
+            chunk = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+
+        yield item
+        pos = end
+
+
+def iter_raw_records(filename=DEFAULT_FILENAME) -> Iterator[dict]:
+    """
+    Stream the stored dicts of files/filename: snapshot first, then journal.
+    A missing file yields nothing (and is not created).
+    """
     path = os.path.join(FILES_DIR, filename)
+    recover_ledger(filename)
+
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _iter_json_array(f)
+
+    yield from iter_journal(filename)
 
-    data = [r.to_dict() for r in records]
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+def iter_records(filename=DEFAULT_FILENAME, validate=True) -> Iterator[RecordBase]:
+    """
+    Lazily yield Income / Expense / RecordBase objects from files/filename.
+    Memory use stays bounded regardless of ledger size.
+    """
+    for item in iter_raw_records(filename):
+        yield _record_from_dict(item, validate)
 
 
-def load_from_json(filename=DEFAULT_FILENAME):
-    """Load from files/filename. Returns list of RecordBase objects."""
+def load_from_json(filename=DEFAULT_FILENAME, validate=True, as_table=False, workers=None):
+    """
+    Load from files/filename (snapshot + journal). Returns list of RecordBase objects.
+    validate=False builds records through from_trusted_dict() for files this
+    app wrote itself, skipping per-field validation.
+    as_table=True returns a columnar RecordTable instead; with validate=False
+    it is filled straight from the stored rows without creating objects.
+    workers > 1 parses the snapshot and journal in byte-range shards across
+    processes (see parallel_io), when the machine has more than one CPU.
+    An unchanged ledger is answered from the parsed-records cache; the list
+    is new on every call but the record objects are shared.
+    """
     ensure_files_dir()
     path = os.path.join(FILES_DIR, filename)
 
 
+    recover_ledger(filename)
+
     if not os.path.exists(path):
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump([], f, indent=4)
-        return []
+        _write_empty_snapshot(path)
+        _invalidate_cache(filename)
 
+    if not as_table:
+        cached = _cache_get(filename, validate)
+        if cached is not None:
+            return list(cached)
 
-    with open(path, "r", encoding="utf-8") as f:
-       raw = json.load(f)
+    if _use_workers(workers):
+        from smartbudget.file_io_module_3.parallel_io import load_parallel, load_rows_parallel
 
-    objects = []
-    for item in raw:
-        if item.get("type") == "Income":
-            obj = Income(item["name"], item["amount"], item.get("source", "未知"))
-        elif item.get("type") == "Expense":
-            obj = Expense(item["name"], abs(item["amount"]), item.get("category", "未知"))
-        else:
-            obj = RecordBase(item["name"], item["amount"])
+        if as_table:
+            from smartbudget.entity.record_table import RecordTable
+            return RecordTable.from_rows(load_rows_parallel(filename, workers, validate))
+        objects = load_parallel(filename, workers, validate)
+        _cache_put(filename, validate, objects)
+        return list(objects)
+
+    with _gc_paused():
+        # The whole list is materialized anyway, so use the C parser directly
+        with stats.timer("json.read"):
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        with stats.timer("json.parse"):
+            raw = json.loads(text)
+        del text
+        with stats.timer("journal.read"):
+            raw.extend(iter_journal(filename))
+        stats.count("records.loaded", len(raw))
+
+        if as_table:
+            # Imported here so NumPy is only loaded for table users
+            from smartbudget.entity.record_table import RecordTable
+
+            if not validate:
+                return RecordTable.from_rows(raw)
+
+        with stats.timer("records.construct" if validate else "records.construct_trusted"):
+            objects = [_record_from_dict(item, validate) for item in raw]
 
-        objects.append(obj)
+        if as_table:
+            return RecordTable.from_records(objects)
 
-    return objects
+    _cache_put(filename, validate, objects)
+    return list(objects)
 
 
 def append_to_json(new_records, filename=DEFAULT_FILENAME):
-    """Append new_records to files/filename."""
-    existing = load_from_json(filename)
-    all_records = existing + new_records
-    save_to_json(all_records, filename)
+    """
+    Append new_records to files/filename.
+    Records go to the journal in one write; the snapshot is only rewritten
+    when the journal has outgrown it (amortized compaction).
+    """
+    ensure_files_dir()
+    path = os.path.join(FILES_DIR, filename)
+
+    recover_ledger(filename)
+
+    if not os.path.exists(path):
+        _write_empty_snapshot(path)
+
+    # Totals must be read before the journal changes their fingerprint
+    totals = read_totals(filename)
+    rows = [r.to_dict() for r in new_records]
+
+    append_to_journal(rows, filename)
+    stats.count("records.appended", len(rows))
+    _invalidate_cache(filename)
+
+    if should_compact(filename):
+        compact_journal(filename)
+
+    if totals is not None:
+        write_totals(aggregate_rows(rows, totals), filename)
 
 def clear_json(filename=DEFAULT_FILENAME):
-    """Clear all records in the given JSON file."""
+    """Clear all records in the given JSON file (snapshot and journal)."""
     ensure_files_dir()
-    path = os.path.join(FILES_DIR, filename)
+    recover_ledger(filename)
+    replace_snapshot([], filename)
+    _invalidate_cache(filename)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump([], f, indent=4)
+    if os.path.exists(totals_path(filename)):
+        write_totals(empty_totals(), filename)
 
     return True
 
+
+def load_totals(filename=DEFAULT_FILENAME, workers=None) -> dict:
+    """
+    Return running totals for files/filename:
+    {"count", "income", "expenses", "by_category", "by_source",
+     "by_period_category", "by_period_source"}.
+    Answered from the totals store in constant time; rebuilt with one
+    streaming pass when the store is missing or out of date (or with
+    per-shard partial totals across `workers` processes).
+    """
+    totals = read_totals(filename)
+    if totals is None:
+        if _use_workers(workers):
+            from smartbudget.file_io_module_3.parallel_io import totals_parallel
+            # iter_raw_records() recovers on the serial path; workers read the files directly
+            recover_ledger(filename)
+            totals = totals_parallel(filename, workers)
+        else:
+            totals = aggregate_rows(iter_raw_records(filename))
+        write_totals(totals, filename)
+    return totals
+
+
+def verify_totals(filename=DEFAULT_FILENAME) -> bool:
+    """
+    Check the stored totals against a full recompute of files/filename.
+    On mismatch the store is replaced with the recomputed values.
+    Returns True when the stored totals were correct.
+    """
+    stored = read_totals(filename)
+    full = aggregate_rows(iter_raw_records(filename))
+
+    if stored is not None and totals_equal(stored, full):
+        return True
+
+    write_totals(full, filename)
+    return False
@@ -0,0 +1,345 @@
+"""
+Parallel, sharded loading of SmartBudget ledgers.
+
+Both halves of a ledger are split into byte-range shards:
+
+- the journal (and any .jsonl export) at line boundaries;
+- the snapshot at item boundaries of its JSON array. The snapshot is
+  written one item per indented line group ("[\n    {...},\n    {...}\n]",
+  see replace_snapshot), so the start of a line holding the item indent
+  and "{" begins an item. A snapshot without that layout (written by hand
+  on one line, say) is parsed as a single shard.
+
+Each shard is parsed, and validated, in its own process by a
+ProcessPoolExecutor. Workers send back plain stored rows, never record
+objects: a list of dicts pickles and unpickles several times faster than
+records pickled by value (RecordBase.__reduce__ goes through to_dict()
+and from_trusted_dict() for every record). The parent builds records from
+the rows with from_trusted_dict(), shard by shard as results arrive, so
+that work overlaps with the workers still parsing. Validated rows are
+re-serialized by the worker, so the trusted build gives the same records
+as a validated serial load.
+
+For totals, each worker returns a partial aggregate (see aggregate_store)
+and only the small totals dicts travel back to be combined with
+merge_totals(); this is where extra processes pay off most.
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+from smartbudget.file_io_module_3.file_utils import FILES_DIR
+from smartbudget.file_io_module_3.journal_io import journal_path, recover_ledger
+from smartbudget.file_io_module_3.aggregate_store import (
+    aggregate_rows,
+    empty_totals,
+    merge_totals,
+)
+from smartbudget.file_io_module_3.json_io import (
+    DEFAULT_FILENAME,
+    _record_from_dict,
+    _gc_paused,
+    iter_raw_records,
+    load_from_json,
+)
+
+logger = logging.getLogger(__name__)
+
+# Smallest shard worth a process of its own; smaller files use fewer shards
+MIN_SHARD_BYTES = 1024 * 1024
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+# --------------------------------------------------------
+# Sharding
+# --------------------------------------------------------
+def shard_ranges(path: str, shards: int, min_shard_bytes: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a JSON Lines file into at most `shards` byte ranges [start, end).
+    Every boundary is moved forward to the start of the next line, so no
+    line is split between two shards. Returns [] for a missing/empty file.
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return []
+    if size == 0:
+        return []
+
+    if min_shard_bytes is None:
+        min_shard_bytes = MIN_SHARD_BYTES
+    shards = max(1, min(shards, size // max(1, min_shard_bytes)))
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, shards):
+            target = max(size * i // shards, bounds[-1])
+            f.seek(target)
+            if target:
+                f.readline()  # finish the line the target falls into
+            offset = f.tell()
+            if offset >= size:
+                break
+            if offset > bounds[-1]:
+                bounds.append(offset)
+    bounds.append(size)
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def snapshot_ranges(path: str, shards: int, min_shard_bytes: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a snapshot (JSON array) into at most `shards` byte ranges that
+    each hold whole items. Boundaries sit at the start of an item line;
+    a snapshot without one item start per line gets a single range.
+    Returns [] for a missing/empty file.
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return []
+    if size == 0:
+        return []
+
+    if min_shard_bytes is None:
+        min_shard_bytes = MIN_SHARD_BYTES
+    shards = max(1, min(shards, size // max(1, min_shard_bytes)))
+    bounds = [0]
+    with open(path, "rb") as f:
+        item_start = _item_prefix(f)
+        for i in range(1, shards if item_start else 1):
+            target = max(size * i // shards, bounds[-1])
+            f.seek(target)
+            f.readline()  # finish the line the target falls into
+            offset = f.tell()
+            line = f.readline()
+            while line and not line.startswith(item_start):
+                offset = f.tell()
+                line = f.readline()
+            if not line:
+                break
+            if offset > bounds[-1]:
+                bounds.append(offset)
+    bounds.append(size)
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _item_prefix(f) -> Optional[bytes]:
+    """Indent + "{" that starts every item line, or None for other layouts."""
+    if f.readline().strip() != b"[":
+        return None
+    second = f.readline()
+    body = second.lstrip(b" \t")
+    if not body.startswith(b"{"):
+        return None
+    return second[:len(second) - len(body)] + b"{"
+
+
+def _read_range(path: str, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _iter_shard_rows(path: str, start: int, end: int, is_last: bool):
+    data = _read_range(path, start, end)
+
+    # Split on "\n" only: str.splitlines() would also break on U+2028 etc.
+    lines = data.split(b"\n")
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as exc:
+            # Same rule as iter_journal: only a torn final line is tolerated
+            # (append_to_journal truncates it before the next append).
+            # The last piece of the split is the only one without a "\n".
+            if not (is_last and i == len(lines) - 1):
+                raise
+            logger.warning(f"[parallel_io] Ignoring incomplete last line in {path}: {exc}")
+
+
+def _snapshot_shard_rows(path: str, start: int, end: int, is_last: bool) -> list:
+    """Items of one snapshot range, parsed as an array of their own."""
+    data = _read_range(path, start, end)
+    body = data.strip()
+    if start == 0:
+        if not body.startswith(b"["):
+            raise json.JSONDecodeError("Expected a JSON array", data.decode("utf-8", "replace"), 0)
+        body = body[1:]
+    if is_last:
+        if not body.endswith(b"]"):
+            raise json.JSONDecodeError("Unterminated JSON array", data.decode("utf-8", "replace"), len(data))
+        body = body[:-1]
+    body = body.strip().rstrip(b",")
+    return json.loads(b"[" + body + b"]")
+
+
+# --------------------------------------------------------
+# Worker tasks (module level so they can be pickled)
+# --------------------------------------------------------
+def _validated_rows(rows, validate):
+    """
+    Rows as the trusted path may rebuild them: with validate, each row is
+    built through the validating constructors and re-serialized normalized.
+    """
+    if not validate:
+        return rows if isinstance(rows, list) else list(rows)
+    with _gc_paused():
+        return [_record_from_dict(row, True).to_dict() for row in rows]
+
+
+def _load_shard(path, start, end, is_last, validate):
+    return _validated_rows(_iter_shard_rows(path, start, end, is_last), validate)
+
+
+def _aggregate_shard(path, start, end, is_last):
+    return aggregate_rows(_iter_shard_rows(path, start, end, is_last))
+
+
+def _load_snapshot_shard(path, start, end, is_last, validate):
+    return _validated_rows(_snapshot_shard_rows(path, start, end, is_last), validate)
+
+
+def _aggregate_snapshot_shard(path, start, end, is_last):
+    return aggregate_rows(_snapshot_shard_rows(path, start, end, is_last))
+
+
+# --------------------------------------------------------
+# Scheduling
+# --------------------------------------------------------
+def _range_tasks(path, ranges, fn, extra=()):
+    return [
+        (fn, (path, start, end, i == len(ranges) - 1) + extra)
+        for i, (start, end) in enumerate(ranges)
+    ]
+
+
+def _shard_tasks(path, shard_fn, workers, extra=()):
+    return _range_tasks(path, shard_ranges(path, workers), shard_fn, extra)
+
+
+def _imap(tasks, workers) -> Iterator:
+    """
+    Results of (fn, args) tasks in task order, each yielded as soon as it
+    is ready. Runs in a process pool when there is more than one task.
+    """
+    if len(tasks) <= 1 or workers <= 1:
+        for fn, args in tasks:
+            yield fn(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(fn, *args) for fn, args in tasks]
+        for future in futures:
+            yield future.result()
+
+
+def _ledger_tasks(filename, workers, snapshot_fn, shard_fn, extra=(), split_snapshot=True):
+    """
+    Snapshot and journal shards of one ledger, in stored order. The two
+    files share the workers in proportion to their size.
+    """
+    snapshot = os.path.join(FILES_DIR, filename)
+    journal = journal_path(filename)
+    sizes = [os.path.getsize(p) if os.path.exists(p) else 0 for p in (snapshot, journal)]
+    snapshot_shards = max(1, round(workers * sizes[0] / (sum(sizes) or 1)))
+    journal_shards = max(1, workers - snapshot_shards)
+
+    ranges = snapshot_ranges(snapshot, snapshot_shards if split_snapshot else 1)
+    tasks = _range_tasks(snapshot, ranges, snapshot_fn, extra)
+    tasks.extend(_shard_tasks(journal, shard_fn, journal_shards, extra))
+    return tasks
+
+
+def _run_ledger(filename, workers, snapshot_fn, shard_fn, consume, serial, extra=()):
+    """
+    consume() the per-shard results of files/filename in stored order.
+    A ledger that makes a single shard (or a single worker) goes to
+    serial() instead: shipping rows between processes only pays when
+    several processes share the parsing.
+    If a shard does not parse (a snapshot whose layout fooled
+    snapshot_ranges, or a corrupt file) the ledger is run again with the
+    snapshot as one shard, which raises as a serial load would.
+    """
+    recover_ledger(filename)
+    tasks = _ledger_tasks(filename, workers, snapshot_fn, shard_fn, extra)
+    if len(tasks) <= 1 or workers <= 1:
+        return serial()
+    try:
+        return consume(_imap(tasks, workers))
+    except json.JSONDecodeError as exc:
+        logger.warning(f"[parallel_io] {filename} did not parse in shards ({exc}); "
+                       f"retrying with an unsplit snapshot")
+    tasks = _ledger_tasks(filename, workers, snapshot_fn, shard_fn, extra, split_snapshot=False)
+    return consume(_imap(tasks, workers))
+
+
+def _build_records(parts) -> list:
+    """Trusted records from per-shard row lists, built as each part arrives."""
+    records = []
+    with _gc_paused():
+        for rows in parts:
+            records.extend([_record_from_dict(row, False) for row in rows])
+    return records
+
+
+def _merge_parts(parts) -> dict:
+    totals = empty_totals()
+    for part in parts:
+        totals = merge_totals(totals, part)
+    return totals
+
+
+# --------------------------------------------------------
+# Public API
+# --------------------------------------------------------
+def load_jsonl_parallel(path: str, workers: Optional[int] = None, validate: bool = True) -> list:
+    """Load every row of a JSON Lines file as records, one shard per worker."""
+    workers = workers or default_workers()
+    return _build_records(_imap(_shard_tasks(path, _load_shard, workers, (validate,)), workers))
+
+
+def load_rows_parallel(filename=DEFAULT_FILENAME, workers: Optional[int] = None,
+                       validate: bool = True) -> list:
+    """
+    Stored rows of files/filename (snapshot first, then journal), parsed in
+    shards. With validate, every row has passed the validating constructors
+    and comes back normalized (RecordBase.to_dict() of the built record).
+    """
+    workers = workers or default_workers()
+
+    def serial():
+        return _validated_rows(iter_raw_records(filename), validate)
+
+    return _run_ledger(filename, workers, _load_snapshot_shard, _load_shard,
+                       lambda parts: [row for rows in parts for row in rows], serial, (validate,))
+
+
+def load_parallel(filename=DEFAULT_FILENAME, workers: Optional[int] = None, validate: bool = True) -> list:
+    """
+    Parallel equivalent of load_from_json(filename): snapshot records first,
+    then journal records, in stored order. A missing ledger loads as [].
+    """
+    workers = workers or default_workers()
+    records = _run_ledger(filename, workers, _load_snapshot_shard, _load_shard, _build_records,
+                          lambda: load_from_json(filename, validate), (validate,))
+
+    logger.info(f"[parallel_io] Loaded {len(records)} records from {filename} on {workers} workers")
+    return records
+
+
+def totals_parallel(filename=DEFAULT_FILENAME, workers: Optional[int] = None) -> dict:
+    """
+    Full recompute of the running totals of files/filename (same shape as
+    load_totals()), with each shard aggregated in its own process.
+    """
+    workers = workers or default_workers()
+    return _run_ledger(filename, workers, _aggregate_snapshot_shard, _aggregate_shard, _merge_parts,
+                       lambda: aggregate_rows(iter_raw_records(filename)))
@@ -0,0 +1,157 @@
+"""
+SQLite storage backend for SmartBudget (stdlib sqlite3).
+
+All records live in one table of files/records.db:
+
+    records(id, type, name, amount, label, timestamp)
+
+`label` is the category of an Expense or the source of an Income, already
+normalized by the entity classes; `timestamp` is the ISO-8601 string of
+RecordBase.to_dict() or NULL. Indexes on (type, label) and (timestamp) let
+totals run as SUM ... GROUP BY queries and date ranges as index range scans.
+Appends are single-transaction INSERTs, so nothing is ever rewritten.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+from smartbudget import stats
+from smartbudget.entity.base_record import parse_timestamp
+from smartbudget.file_io_module_3.file_utils import FILES_DIR, ensure_files_dir
+from smartbudget.file_io_module_3.aggregate_store import UNDATED_PERIOD, empty_totals
+from smartbudget.file_io_module_3.json_io import _record_from_dict, _gc_paused
+from smartbudget.file_io_module_3.storage import StorageBackend
+
+DEFAULT_DB_FILENAME = "records.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id        INTEGER PRIMARY KEY,
+    type      TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    amount    REAL NOT NULL,
+    label     TEXT,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_records_type_label ON records (type, label);
+CREATE INDEX IF NOT EXISTS idx_records_timestamp ON records (timestamp);
+"""
+
+_LABEL_FIELDS = {"Income": "source", "Expense": "category"}
+_COLUMNS = "type, name, amount, label, timestamp"
+
+
+def _to_row(record) -> tuple:
+    data = record.to_dict()
+    kind = data["type"]
+    label = data.get(_LABEL_FIELDS[kind]) if kind in _LABEL_FIELDS else None
+    return kind, data["name"], data["amount"], label, data.get("timestamp")
+
+
+def _to_dict(kind, name, amount, label, timestamp) -> dict:
+    data = {"type": kind, "name": name, "amount": amount}
+    if kind in _LABEL_FIELDS:
+        data[_LABEL_FIELDS[kind]] = label
+    if timestamp is not None:
+        data["timestamp"] = timestamp
+    return data
+
+
+class SqliteStorage(StorageBackend):
+    """Ledger stored in an indexed SQLite database inside files/."""
+
+    def __init__(self, filename: str = DEFAULT_DB_FILENAME):
+        self.filename = filename
+        self.path = os.path.join(FILES_DIR, filename)
+        self._conn = None
+
+    # --------------------------------------------------------
+    # Connection
+    # --------------------------------------------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            ensure_files_dir()
+            self._conn = sqlite3.connect(self.path)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        with conn:  # commits, or rolls back on error
+            yield conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --------------------------------------------------------
+    # StorageBackend
+    # --------------------------------------------------------
+    def _records(self, cursor, validate: bool) -> list:
+        with stats.timer("sqlite.load"), _gc_paused():
+            records = [_record_from_dict(_to_dict(*row), validate) for row in cursor]
+        stats.count("records.loaded", len(records))
+        return records
+
+    def load(self, validate: bool = True) -> list:
+        cursor = self._connection().execute(f"SELECT {_COLUMNS} FROM records ORDER BY id")
+        return self._records(cursor, validate)
+
+    def append(self, records: Iterable[object]) -> None:
+        rows = [_to_row(r) for r in records]
+        with stats.timer("sqlite.write"), self._transaction() as conn:
+            conn.executemany(f"INSERT INTO records ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows)
+        stats.count("records.appended", len(rows))
+
+    def save(self, records: Iterable[object]) -> None:
+        rows = [_to_row(r) for r in records]
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM records")
+            conn.executemany(f"INSERT INTO records ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def clear(self) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM records")
+
+    @stats.timed("sqlite.totals")
+    def totals(self) -> dict:
+        conn = self._connection()
+        totals = empty_totals()
+        totals["count"] = conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+        groups = {"Income": "by_source", "Expense": "by_category"}
+        for kind, label, amount in conn.execute(
+            "SELECT type, label, SUM(amount) FROM records "
+            "WHERE type IN ('Income', 'Expense') GROUP BY type, label"
+        ):
+            totals[groups[kind]][label] = amount
+            totals["income" if kind == "Income" else "expenses"] += amount
+
+        for kind, period, label, amount in conn.execute(
+            "SELECT type, COALESCE(substr(timestamp, 1, 7), ?), label, SUM(amount) "
+            "FROM records WHERE type IN ('Income', 'Expense') GROUP BY 1, 2, 3",
+            (UNDATED_PERIOD,),
+        ):
+            cells = totals["by_period_" + groups[kind][3:]].setdefault(period, {})
+            cells[label] = amount
+
+        return totals
+
+    def records_between(self, start=None, end=None) -> list:
+        """Dated records with start <= timestamp < end, via the timestamp index."""
+        clauses, params = ["timestamp IS NOT NULL"], []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(parse_timestamp(start).isoformat())
+        if end is not None:
+            clauses.append("timestamp < ?")
+            params.append(parse_timestamp(end).isoformat())
+
+        cursor = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM records WHERE {' AND '.join(clauses)} ORDER BY timestamp, id",
+            params,
+        )
+        return self._records(cursor, validate=False)
@@ -0,0 +1,150 @@
+"""
+Pluggable storage backends for the SmartBudget ledger.
+
+Controllers talk to a StorageBackend instead of importing the JSON
+functions directly:
+
+    JsonStorage     files/records.json + journal (json_io)
+    SqliteStorage   files/records.db via the stdlib sqlite3 (sqlite_io)
+
+open_storage() picks a backend by name; without one it reads the
+SMARTBUDGET_STORAGE environment variable and defaults to "json".
+Backups and exports stay JSON files whatever the backend is.
+"""
+
+import os
+from typing import Iterable, Optional
+from smartbudget.entity.base_record import SmartBudgetError, parse_timestamp
+from smartbudget.file_io_module_3.backup_io import backup_ledger
+from smartbudget.file_io_module_3.backup_chain import backup_incremental
+from smartbudget.file_io_module_3.json_io import (
+    DEFAULT_FILENAME,
+    save_to_json,
+    load_from_json,
+    append_to_json,
+    clear_json,
+    load_totals,
+)
+
+STORAGE_ENV_VAR = "SMARTBUDGET_STORAGE"
+DEFAULT_STORAGE = "json"
+
+# Ledger file extensions each backend accepts
+BACKEND_EXTENSIONS = {
+    "json": (".json",),
+    "sqlite": (".db", ".sqlite", ".sqlite3"),
+}
+
+
+class StorageBackend:
+    """
+    Interface every ledger backend implements.
+
+    totals() returns the load_totals() shape:
+    {"count", "income", "expenses", "by_category", "by_source",
+     "by_period_category", "by_period_source"}.
+    """
+
+    # File inside files/ owned by this backend (protected from backup/delete)
+    filename: str = ""
+
+    def load(self, validate: bool = True) -> list:
+        raise NotImplementedError
+
+    def append(self, records: Iterable[object]) -> None:
+        raise NotImplementedError
+
+    def save(self, records: Iterable[object]) -> None:
+        """Replace the whole ledger with `records`."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def totals(self) -> dict:
+        raise NotImplementedError
+
+    def records_between(self, start=None, end=None) -> list:
+        """Dated records with start <= timestamp < end, oldest first."""
+        lo = parse_timestamp(start) if start is not None else None
+        hi = parse_timestamp(end) if end is not None else None
+        dated = [
+            r for r in self.load()
+            if r.timestamp is not None
+            and (lo is None or r.timestamp >= lo)
+            and (hi is None or r.timestamp < hi)
+        ]
+        return sorted(dated, key=lambda r: r.timestamp)
+
+    def backup(self, target: str) -> None:
+        """Write the whole ledger to files/target as a JSON ledger."""
+        save_to_json(self.load(validate=False), target)
+
+    def backup_incremental(self) -> dict:
+        """Add a full or delta backup to this ledger's chain; returns its entry."""
+        return backup_incremental(
+            self.filename, rows=lambda: (r.to_dict() for r in self.load(validate=False))
+        )
+
+    def close(self) -> None:
+        """Release any open resources; the default backend holds none."""
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.filename!r})"
+
+
+class JsonStorage(StorageBackend):
+    """The JSON snapshot + journal ledger implemented in json_io."""
+
+    def __init__(self, filename: str = DEFAULT_FILENAME):
+        self.filename = filename
+
+    def load(self, validate: bool = True) -> list:
+        return load_from_json(self.filename, validate)
+
+    def append(self, records: Iterable[object]) -> None:
+        append_to_json(records, self.filename)
+
+    def save(self, records: Iterable[object]) -> None:
+        save_to_json(records, self.filename)
+
+    def clear(self) -> None:
+        clear_json(self.filename)
+
+    def totals(self) -> dict:
+        return load_totals(self.filename)
+
+    def backup(self, target: str) -> None:
+        # Byte-level copy-on-write backup; no records are parsed
+        backup_ledger(self.filename, target)
+
+    def backup_incremental(self) -> dict:
+        # The journal is read past the last backup's offset; nothing is parsed twice
+        return backup_incremental(self.filename)
+
+
+def open_storage(kind: Optional[str] = None, filename: Optional[str] = None) -> StorageBackend:
+    """
+    Create a backend by name ("json" or "sqlite").
+    `kind` defaults to $SMARTBUDGET_STORAGE, then to "json".
+    A `filename` must carry an extension of the chosen backend (see
+    BACKEND_EXTENSIONS), so a SQLite database is never named like a JSON
+    ledger or the other way round.
+    """
+    kind = (kind or os.environ.get(STORAGE_ENV_VAR) or DEFAULT_STORAGE).strip().lower()
+    if kind not in BACKEND_EXTENSIONS:
+        raise SmartBudgetError(f"Unknown storage backend '{kind}' (use json or sqlite)")
+
+    if filename is not None:
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in BACKEND_EXTENSIONS[kind]:
+            raise SmartBudgetError(
+                f"'{filename}' does not fit the {kind} backend "
+                f"(use a {' / '.join(BACKEND_EXTENSIONS[kind])} file)"
+            )
+
+    if kind == "json":
+        return JsonStorage(filename or DEFAULT_FILENAME)
+    from smartbudget.file_io_module_3.sqlite_io import SqliteStorage, DEFAULT_DB_FILENAME
+    return SqliteStorage(filename or DEFAULT_DB_FILENAME)
+
@@ -0,0 +1,171 @@
+"""
+Opt-in profiling of interactive menu actions.
+
+When a profile directory is set, every menu dispatch in
+app_menu_controller.run() becomes a span in a Chrome trace-event file
+(open it in chrome://tracing or https://ui.perfetto.dev). The hot-path
+timers of smartbudget.stats (file reads, JSON parse, record construction,
+writes...) appear as nested spans inside each action:
+
+    <dir>/trace-20250314-093000-1234.json
+
+With cProfile enabled as well, each action also gets its own profile,
+readable with `python -m pstats` or snakeviz:
+
+    <dir>/20250314-093000-1234-003-summary.pstats
+
+The trace file is rewritten after every action, so a session that is
+killed still leaves the actions completed so far. Profiling is switched
+on with SMARTBUDGET_PROFILE=<dir> (plus SMARTBUDGET_PROFILE_CPROFILE=1)
+or `python -m smartbudget --profile DIR [--cprofile]`. While it is off,
+action() returns a shared no-op context manager.
+"""
+
+import atexit
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import List, Optional
+
+from smartbudget import stats
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = "SMARTBUDGET_PROFILE"
+CPROFILE_ENV_VAR = "SMARTBUDGET_PROFILE_CPROFILE"
+
+_NULL_CONTEXT = nullcontext()
+_session: Optional["ProfileSession"] = None
+# Whether start() switched stats collection on (and stop() should switch it off)
+_owns_stats = False
+
+
+class ProfileSession:
+    """Collects trace events for one process and writes them into `directory`."""
+
+    def __init__(self, directory: str, cprofile: bool = False):
+        self.directory = directory
+        self.cprofile = cprofile
+        self.prefix = f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+        self.trace_path = os.path.join(directory, f"trace-{self.prefix}.json")
+        self.events: List[dict] = [
+            {"ph": "M", "name": "process_name", "pid": os.getpid(), "tid": 0,
+             "args": {"name": "SmartBudget"}},
+        ]
+        self._origin_ns = time.perf_counter_ns()
+        self._actions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    # --------------------------------------------------------
+    # Events
+    # --------------------------------------------------------
+    def _us(self, ns: int) -> float:
+        return (ns - self._origin_ns) / 1000
+
+    def add_span(self, name: str, start_ns: int, duration_ns: int,
+                 category: str = "stats", args: Optional[dict] = None) -> None:
+        event = {
+            "ph": "X", "name": name, "cat": category,
+            "ts": self._us(start_ns), "dur": duration_ns / 1000,
+            "pid": os.getpid(), "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def _on_timer(self, name: str, start_ns: int, duration_ns: int) -> None:
+        self.add_span(name, start_ns, duration_ns)
+
+    @contextmanager
+    def action(self, name: str, **args):
+        """Span (and optional cProfile) around one menu action."""
+        self._actions += 1
+        profiler = cProfile.Profile() if self.cprofile else None
+        start = time.perf_counter_ns()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield self
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            self.add_span(name, start, time.perf_counter_ns() - start, "menu", args)
+            if profiler is not None:
+                profiler.dump_stats(self.pstats_path(name))
+            self.flush()
+
+    # --------------------------------------------------------
+    # Output
+    # --------------------------------------------------------
+    def pstats_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{self._actions:03d}-{name}.pstats")
+
+    def flush(self) -> None:
+        """Rewrite the trace file with every event so far."""
+        tmp = self.trace_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+            os.replace(tmp, self.trace_path)
+        except OSError as exc:
+            logger.error(f"[profiling] Could not write {self.trace_path}: {exc}")
+
+
+# --------------------------------------------------------
+# Module-level switch
+# --------------------------------------------------------
+def start(directory: str, cprofile: bool = False) -> ProfileSession:
+    """Begin profiling menu actions into `directory` (replaces any session)."""
+    global _session, _owns_stats
+    stop()
+    _session = ProfileSession(directory, cprofile)
+    # The stats timers provide the nested spans
+    if not stats.is_enabled():
+        stats.enable(report_at_exit=False)
+        _owns_stats = True
+    stats.add_listener(_session._on_timer)
+    logger.info(f"[profiling] Writing traces to {_session.trace_path}")
+    return _session
+
+
+def stop() -> None:
+    """Write the current session's trace and end it."""
+    global _session, _owns_stats
+    if _session is None:
+        return
+    stats.remove_listener(_session._on_timer)
+    if _owns_stats:
+        stats.disable()
+        _owns_stats = False
+    _session.flush()
+    _session = None
+
+
+def is_active() -> bool:
+    return _session is not None
+
+
+def action(name: str, **args):
+    """Context manager profiling one menu action; no-op unless profiling."""
+    if _session is None:
+        return _NULL_CONTEXT
+    return _session.action(name, **args)
+
+
+def configure_from_env() -> bool:
+    """Apply $SMARTBUDGET_PROFILE / $SMARTBUDGET_PROFILE_CPROFILE."""
+    directory = os.environ.get(PROFILE_ENV_VAR, "").strip()
+    if not directory:
+        return False
+    cprofile = os.environ.get(CPROFILE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+    start(directory, cprofile)
+    return True
+
+
+atexit.register(stop)
+configure_from_env()
@@ -0,0 +1,230 @@
+"""
+Lightweight timing instrumentation for SmartBudget hot paths.
+
+    with stats.timer("json.parse"):
+        raw = json.loads(text)
+    stats.count("records.loaded", len(raw))
+
+    @stats.timed("summary.budget_balance")
+    def budget_balance(...): ...
+
+Collection is off by default: timer() then hands back one shared no-op
+context manager and count() returns at once, so an instrumented site costs
+a single function call. Sites wrap whole passes (a file read, a parse, a
+list of records), never individual records.
+
+Collection is switched on by the SMARTBUDGET_STATS environment variable or
+by `python -m smartbudget --stats [--stats-file PATH]`:
+
+    SMARTBUDGET_STATS=1             print the report to stderr on exit
+    SMARTBUDGET_STATS=stats.json    print it and dump it as JSON to that path
+
+The report gives, for every timer, the number of calls, the total and the
+p50/p95/p99/max durations in milliseconds, and the value of every counter.
+Work done in worker processes (parallel_io, multi_ledger) is not included.
+
+Listeners (add_listener) receive every finished timer as (name, start_ns,
+duration_ns); smartbudget.profiling uses this to draw them as trace spans.
+"""
+
+import atexit
+import functools
+import json
+import math
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+STATS_ENV_VAR = "SMARTBUDGET_STATS"
+_FALSE_VALUES = ("", "0", "false", "no", "off")
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+_enabled = False
+_dump_path: Optional[str] = None
+_exit_hook_registered = False
+
+# Raw samples in nanoseconds; percentiles are computed when reporting
+_durations: Dict[str, List[int]] = {}
+_counters: Dict[str, int] = {}
+_listeners: List[Callable[[str, int, int], None]] = []
+
+
+# --------------------------------------------------------
+# Timers and counters
+# --------------------------------------------------------
+class _NullTimer:
+    """What timer() returns while collection is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter_ns() - self._start
+        samples = _durations.get(self.name)
+        if samples is None:
+            samples = _durations[self.name] = []
+        samples.append(elapsed)
+        for listener in _listeners:
+            listener(self.name, self._start, elapsed)
+        return False
+
+
+def timer(name: str):
+    """Context manager timing its block under `name` (no-op when disabled)."""
+    return _Timer(name) if _enabled else _NULL_TIMER
+
+
+def timed(name: str) -> Callable:
+    """Decorator form of timer()."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Timer(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add n to the counter `name` (no-op when disabled)."""
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+# --------------------------------------------------------
+# Switching on and off
+# --------------------------------------------------------
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(dump_path: Optional[str] = None, report_at_exit: bool = True) -> None:
+    """
+    Start collecting. With report_at_exit the report is printed (and
+    dumped to dump_path, if given) when the interpreter exits.
+    """
+    global _enabled, _dump_path, _exit_hook_registered
+    _enabled = True
+    _dump_path = dump_path
+    if report_at_exit and not _exit_hook_registered:
+        atexit.register(_report_at_exit)
+        _exit_hook_registered = True
+
+
+def disable() -> None:
+    """Stop collecting; samples gathered so far are kept until reset()."""
+    global _enabled
+    _enabled = False
+
+
+def add_listener(listener: Callable[[str, int, int], None]) -> None:
+    """Call listener(name, start_ns, duration_ns) after every timed block."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[str, int, int], None]) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def reset() -> None:
+    _durations.clear()
+    _counters.clear()
+
+
+def configure_from_env() -> bool:
+    """Apply $SMARTBUDGET_STATS; returns whether collection is on."""
+    value = os.environ.get(STATS_ENV_VAR, "").strip()
+    if value.lower() in _FALSE_VALUES:
+        return _enabled
+    enable(None if value.lower() in _TRUE_VALUES else value)
+    return True
+
+
+# --------------------------------------------------------
+# Report
+# --------------------------------------------------------
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 for an empty one)."""
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def report() -> dict:
+    """{"timers": {name: {"count", "total_ms", "p50_ms", ...}}, "counters": {...}}."""
+    timers = {}
+    for name, samples in sorted(_durations.items()):
+        ordered = sorted(samples)
+        ms = 1e-6
+        timers[name] = {
+            "count": len(ordered),
+            "total_ms": sum(ordered) * ms,
+            "p50_ms": percentile(ordered, 50) * ms,
+            "p95_ms": percentile(ordered, 95) * ms,
+            "p99_ms": percentile(ordered, 99) * ms,
+            "max_ms": ordered[-1] * ms,
+        }
+    return {"timers": timers, "counters": dict(sorted(_counters.items()))}
+
+
+def format_report(data: Optional[dict] = None) -> str:
+    data = report() if data is None else data
+    lines = ["=== SmartBudget Stats ==="]
+    if data["timers"]:
+        lines.append(f"{'timer':<28}{'count':>8}{'total ms':>12}{'p50':>10}"
+                     f"{'p95':>10}{'p99':>10}{'max':>10}")
+        for name, t in data["timers"].items():
+            lines.append(f"{name:<28}{t['count']:>8}{t['total_ms']:>12.2f}{t['p50_ms']:>10.3f}"
+                         f"{t['p95_ms']:>10.3f}{t['p99_ms']:>10.3f}{t['max_ms']:>10.3f}")
+    if data["counters"]:
+        lines.append("")
+        lines.append(f"{'counter':<28}{'value':>12}")
+        for name, value in data["counters"].items():
+            lines.append(f"{name:<28}{value:>12,}")
+    if not data["timers"] and not data["counters"]:
+        lines.append("(nothing recorded)")
+    return "\n".join(lines)
+
+
+def dump(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report(), f, indent=2)
+
+
+def _report_at_exit() -> None:
+    if not _durations and not _counters:
+        return
+    print("\n" + format_report(), file=sys.stderr)
+    if _dump_path:
+        try:
+            dump(_dump_path)
+        except OSError as exc:
+            print(f"[stats] Could not write {_dump_path}: {exc}", file=sys.stderr)
+
+
+configure_from_env()
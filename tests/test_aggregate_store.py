@@ -0,0 +1,120 @@
+import os
+import json
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.file_io_module_3 import aggregate_store, json_io
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+class TestAggregateStore(unittest.TestCase):
+
+    TEST_DIR = "files"
+    TEST_FILE = "records.json"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+
+        json_io.save_to_json([
+            Income("Salary", 3000, "Job"),
+            Expense("Rent", 1200, "Housing"),
+        ], self.TEST_FILE)
+
+    def tearDown(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    # ----------------------------
+    # aggregation helpers
+    # ----------------------------
+    def test_totals_name(self):
+        self.assertEqual(aggregate_store.totals_name("records.json"), "records.totals.json")
+        self.assertEqual(aggregate_store.totals_name("backup"), "backup.totals.json")
+
+    def test_aggregate_rows(self):
+        totals = aggregate_store.aggregate_rows([
+            {"type": "Income", "name": "A", "amount": 10, "source": "Job"},
+            {"type": "Expense", "name": "B", "amount": -4, "category": "food"},
+            {"type": "Other", "name": "C", "amount": 99},
+        ])
+        self.assertEqual(totals["count"], 3)
+        self.assertEqual(totals["income"], 10)
+        self.assertEqual(totals["expenses"], 4)
+        self.assertEqual(totals["by_source"], {"job": 10})
+        self.assertEqual(totals["by_category"], {"food": 4})
+
+    def test_merge_totals(self):
+        a = aggregate_store.aggregate_rows([{"type": "Expense", "name": "x", "amount": 1, "category": "food"}])
+        b = aggregate_store.aggregate_rows([{"type": "Expense", "name": "y", "amount": 2, "category": "food"}])
+        merged = aggregate_store.merge_totals(a, b)
+        self.assertEqual(merged["count"], 2)
+        self.assertEqual(merged["by_category"], {"food": 3})
+
+    # ----------------------------
+    # maintenance through json_io
+    # ----------------------------
+    def test_load_totals_builds_store(self):
+        totals = json_io.load_totals(self.TEST_FILE)
+        self.assertEqual(totals["income"], 3000)
+        self.assertEqual(totals["expenses"], 1200)
+        self.assertTrue(os.path.exists(aggregate_store.totals_path(self.TEST_FILE)))
+
+    def test_append_updates_without_rescan(self):
+        json_io.load_totals(self.TEST_FILE)
+        json_io.append_to_json([Expense("Food", 50, "Groceries")], self.TEST_FILE)
+
+        with patch("smartbudget.file_io_module_3.json_io.iter_raw_records") as mock_scan:
+            totals = json_io.load_totals(self.TEST_FILE)
+        mock_scan.assert_not_called()
+
+        self.assertEqual(totals["expenses"], 1250)
+        self.assertEqual(totals["by_category"]["groceries"], 50)
+        self.assertTrue(json_io.verify_totals(self.TEST_FILE))
+
+    def test_clear_resets_store(self):
+        json_io.load_totals(self.TEST_FILE)
+        json_io.clear_json(self.TEST_FILE)
+
+        totals = aggregate_store.read_totals(self.TEST_FILE)
+        self.assertEqual(totals, aggregate_store.empty_totals())
+
+    def test_save_refreshes_existing_store(self):
+        json_io.load_totals(self.TEST_FILE)
+        json_io.save_to_json([Income("Bonus", 500, "Job")], self.TEST_FILE)
+
+        totals = aggregate_store.read_totals(self.TEST_FILE)
+        self.assertEqual(totals["income"], 500)
+        self.assertEqual(totals["expenses"], 0)
+
+    def test_save_does_not_create_store(self):
+        json_io.save_to_json([Income("Bonus", 500, "Job")], "backup.json")
+        self.assertFalse(os.path.exists(aggregate_store.totals_path("backup.json")))
+
+    def test_hand_edited_ledger_is_detected(self):
+        json_io.load_totals(self.TEST_FILE)
+
+        path = os.path.join(self.TEST_DIR, self.TEST_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"type": "Income", "name": "Only", "amount": 7, "source": "x"}], f)
+
+        self.assertIsNone(aggregate_store.read_totals(self.TEST_FILE))
+        self.assertEqual(json_io.load_totals(self.TEST_FILE)["income"], 7)
+
+    def test_verify_repairs_wrong_totals(self):
+        totals = json_io.load_totals(self.TEST_FILE)
+        totals["income"] = 1.0
+        aggregate_store.write_totals(totals, self.TEST_FILE)
+
+        self.assertFalse(json_io.verify_totals(self.TEST_FILE))
+        self.assertEqual(json_io.load_totals(self.TEST_FILE)["income"], 3000)
+
+    def test_corrupt_store_is_ignored(self):
+        with open(aggregate_store.totals_path(self.TEST_FILE), "w") as f:
+            f.write("not json")
+        self.assertIsNone(aggregate_store.read_totals(self.TEST_FILE))
+        self.assertTrue(aggregate_store.delete_totals(self.TEST_FILE))
+        self.assertFalse(aggregate_store.delete_totals(self.TEST_FILE))
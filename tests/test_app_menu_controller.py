@@ -1,6 +1,12 @@
+import os
+import subprocess
+import sys
 import unittest
 from unittest.mock import patch
 import smartbudget.core_module_2.app_menu_controller as app_menu
+from smartbudget.file_io_module_3.storage import STORAGE_ENV_VAR
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class TestAppMenuController(unittest.TestCase):
@@ -100,6 +106,39 @@ class TestAppMenuController(unittest.TestCase):
         app_menu.run()
         mock_plot.assert_called_once()
 
+    # ---------------------------------------------------
+    # 11 — rec.show_monthly_trends()
+    # ---------------------------------------------------
+    @patch("builtins.input", side_effect=["11", "0"])
+    @patch("smartbudget.core_module_2.app_menu_controller.rec.show_monthly_trends")
+    def test_show_monthly_trends(self, mock_trends, mock_input):
+        app_menu.run()
+        mock_trends.assert_called_once()
+
+    # ---------------------------------------------------
+    # 12 — sys.report_backups()
+    # ---------------------------------------------------
+    @patch("builtins.input", side_effect=["12", "0"])
+    @patch("smartbudget.core_module_2.app_menu_controller.FileIoDataStorageController.report_backups")
+    def test_report_backups(self, mock_report, mock_input):
+        app_menu.run()
+        mock_report.assert_called_once()
+
+    # ---------------------------------------------------
+    # 13 / 14 — incremental backup and restore
+    # ---------------------------------------------------
+    @patch("builtins.input", side_effect=["13", "0"])
+    @patch("smartbudget.core_module_2.app_menu_controller.FileIoDataStorageController.backup_incremental")
+    def test_backup_incremental(self, mock_backup, mock_input):
+        app_menu.run()
+        mock_backup.assert_called_once()
+
+    @patch("builtins.input", side_effect=["14", "0"])
+    @patch("smartbudget.core_module_2.app_menu_controller.FileIoDataStorageController.restore_point")
+    def test_restore_point(self, mock_restore, mock_input):
+        app_menu.run()
+        mock_restore.assert_called_once()
+
     # ---------------------------------------------------
     # invalid options
     # ---------------------------------------------------
@@ -123,6 +162,32 @@ class TestAppMenuController(unittest.TestCase):
         output = "".join(str(c.args[0]) for c in mock_print.call_args_list)
         self.assertIn("Interrupted", output)
 
+    # ---------------------------------------------------
+    # bad $SMARTBUDGET_STORAGE
+    # ---------------------------------------------------
+    @patch("builtins.input", side_effect=["0"])
+    @patch("builtins.print")
+    def test_bad_storage_backend_is_reported(self, mock_print, mock_input):
+        with patch.object(app_menu, "storage", None), \
+                patch.dict(os.environ, {STORAGE_ENV_VAR: "bogus"}):
+            self.assertFalse(app_menu.run())
+        mock_input.assert_not_called()
+        out = "".join(str(c.args[0]) for c in mock_print.call_args_list)
+        self.assertIn("❌ Cannot open ledger storage", out)
+        self.assertIn("Unknown storage backend 'bogus'", out)
+
+    def test_bad_storage_backend_does_not_break_startup(self):
+        env = dict(os.environ, **{STORAGE_ENV_VAR: "bogus"})
+        imported = subprocess.run([sys.executable, "-c", "import main"],
+                                  cwd=ROOT, env=env, capture_output=True, text=True)
+        self.assertEqual(imported.returncode, 0, imported.stderr)
+
+        cli = subprocess.run([sys.executable, "-m", "smartbudget"], input="0\n",
+                             cwd=ROOT, env=env, capture_output=True, text=True)
+        self.assertEqual(cli.returncode, 1, cli.stderr)
+        self.assertIn("Cannot open ledger storage", cli.stdout)
+        self.assertNotIn("Traceback", cli.stderr)
+
     @patch("builtins.input", side_effect=["10", "0"])
     @patch("smartbudget.core_module_2.app_menu_controller.rec.show_expense_plot", side_effect=Exception("x"))
     @patch("builtins.print")
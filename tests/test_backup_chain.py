@@ -0,0 +1,198 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.file_io_module_3 import backup_chain, json_io, journal_io
+from smartbudget.file_io_module_3.aggregate_store import read_totals
+from smartbudget.file_io_module_3.storage import JsonStorage
+from smartbudget.file_io_module_3.sqlite_io import SqliteStorage
+from smartbudget.analysis_module_1.multi_ledger import ledger_files
+from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+class TestBackupChain(unittest.TestCase):
+
+    TEST_DIR = "files"
+    LEDGER = "records.json"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+        json_io.clear_record_cache()
+        json_io.save_to_json([Income("Salary", 100, "job"), Expense("Food", 20, "meal")], self.LEDGER)
+
+    def tearDown(self):
+        json_io.clear_record_cache()
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    def names(self, rows):
+        return [row["name"] for row in rows]
+
+    def segment(self, entry):
+        with open(os.path.join(self.TEST_DIR, entry["file"]), encoding="utf-8") as f:
+            return [line for line in f if line.strip()]
+
+    # ----------------------------
+    # naming
+    # ----------------------------
+    def test_names(self):
+        self.assertEqual(backup_chain.chain_name("records.json"), "records.chain.json")
+        self.assertEqual(backup_chain.segment_name("records.json", 3), "records.chain.0003.jsonl")
+        self.assertTrue(backup_chain.is_chain_file("records.chain.json"))
+        self.assertTrue(backup_chain.is_chain_file("records.chain.0003.jsonl"))
+        self.assertFalse(backup_chain.is_chain_file("records.jsonl"))
+        self.assertFalse(backup_chain.is_chain_file("chain.json.backup"))
+
+    # ----------------------------
+    # full and delta backups
+    # ----------------------------
+    def test_first_backup_is_full(self):
+        entry = backup_chain.backup_incremental(self.LEDGER)
+        self.assertEqual(entry["kind"], backup_chain.KIND_FULL)
+        self.assertEqual((entry["count"], entry["total"]), (2, 2))
+        self.assertEqual(len(self.segment(entry)), 2)
+
+    def test_delta_holds_only_appended_rows(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.LEDGER)
+        entry = backup_chain.backup_incremental(self.LEDGER)
+
+        self.assertEqual(entry["kind"], backup_chain.KIND_DELTA)
+        self.assertEqual((entry["count"], entry["total"]), (1, 3))
+        self.assertEqual(len(self.segment(entry)), 1)
+
+    def test_unchanged_ledger_gives_empty_delta(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        entry = backup_chain.backup_incremental(self.LEDGER)
+        self.assertEqual((entry["kind"], entry["count"]), (backup_chain.KIND_DELTA, 0))
+
+    def test_delta_does_not_reparse_ledger(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.LEDGER)
+        with patch("smartbudget.file_io_module_3.backup_chain.iter_raw_records") as mock_iter:
+            backup_chain.backup_incremental(self.LEDGER)
+        mock_iter.assert_not_called()
+
+    def test_delta_after_compaction(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.LEDGER)
+        journal_io.compact_journal(self.LEDGER)
+        json_io.append_to_json([Expense("Taxi", 9, "transport")], self.LEDGER)
+
+        entry = backup_chain.backup_incremental(self.LEDGER)
+        self.assertEqual(entry["kind"], backup_chain.KIND_DELTA)
+        self.assertEqual(entry["count"], 2)
+
+    def test_torn_journal_line_waits_for_next_backup(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.LEDGER)
+        with open(journal_io.journal_path(self.LEDGER), "a", encoding="utf-8") as f:
+            f.write('{"type": "Exp')
+
+        entry = backup_chain.backup_incremental(self.LEDGER)
+        self.assertEqual(entry["count"], 1)
+
+    def test_rewritten_ledger_starts_new_full_backup(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.save_to_json([Income("Gift", 5, "family")], self.LEDGER)
+
+        entry = backup_chain.backup_incremental(self.LEDGER)
+        self.assertEqual(entry["kind"], backup_chain.KIND_FULL)
+        self.assertEqual(entry["total"], 1)
+
+    def test_cleared_ledger_starts_new_full_backup(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.clear_json(self.LEDGER)
+        entry = backup_chain.backup_incremental(self.LEDGER)
+        self.assertEqual((entry["kind"], entry["total"]), (backup_chain.KIND_FULL, 0))
+
+    # ----------------------------
+    # restore
+    # ----------------------------
+    def make_chain(self):
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.LEDGER)
+        backup_chain.backup_incremental(self.LEDGER)
+        json_io.append_to_json([Expense("Taxi", 9, "transport")], self.LEDGER)
+        backup_chain.backup_incremental(self.LEDGER)
+
+    def test_restore_each_point(self):
+        self.make_chain()
+        self.assertEqual(self.names(backup_chain.restore_rows(self.LEDGER, 1)), ["Salary", "Food"])
+        self.assertEqual(self.names(backup_chain.restore_rows(self.LEDGER, 2)), ["Salary", "Food", "Bus"])
+        self.assertEqual(self.names(backup_chain.restore_rows(self.LEDGER)),
+                         ["Salary", "Food", "Bus", "Taxi"])
+
+    def test_restore_after_new_full_backup(self):
+        self.make_chain()
+        json_io.save_to_json([Income("Gift", 5, "family")], self.LEDGER)
+        backup_chain.backup_incremental(self.LEDGER)
+
+        self.assertEqual(self.names(backup_chain.restore_rows(self.LEDGER)), ["Gift"])
+        self.assertEqual(len(backup_chain.restore_rows(self.LEDGER, 3)), 4)
+
+    def test_restore_by_time(self):
+        self.make_chain()
+        manifest = backup_chain.read_manifest(self.LEDGER)
+        for entry, created in zip(manifest["entries"],
+                                  ["2025-03-01T09:00:00", "2025-03-02T09:00:00", "2025-03-02T18:00:00"]):
+            entry["created"] = created
+        backup_chain._write_manifest(manifest, self.LEDGER)
+
+        self.assertEqual(backup_chain.find_backup(self.LEDGER, "2025-03-02T12:00:00")["id"], 2)
+        self.assertEqual(backup_chain.find_backup(self.LEDGER, "2025-03-02")["id"], 3)
+        self.assertEqual(backup_chain.find_backup(self.LEDGER, "3")["id"], 3)
+        with self.assertRaises(SmartBudgetError):
+            backup_chain.find_backup(self.LEDGER, "2025-02-28")
+
+    def test_restore_backup_into_file(self):
+        self.make_chain()
+        count = backup_chain.restore_backup(self.LEDGER, 2, "old.json")
+
+        self.assertEqual(count, 3)
+        self.assertEqual([r.name for r in json_io.load_from_json("old.json")], ["Salary", "Food", "Bus"])
+        self.assertEqual(read_totals("old.json")["count"], 3)
+
+    def test_restore_records_into_current_ledger(self):
+        self.make_chain()
+        JsonStorage(self.LEDGER).save(backup_chain.restore_records(self.LEDGER, 1))
+        self.assertEqual([r.name for r in json_io.load_from_json(self.LEDGER)], ["Salary", "Food"])
+
+    def test_no_backups(self):
+        with self.assertRaises(SmartBudgetError):
+            backup_chain.restore_rows(self.LEDGER)
+
+    def test_missing_segment(self):
+        self.make_chain()
+        os.remove(os.path.join(self.TEST_DIR, backup_chain.segment_name(self.LEDGER, 2)))
+        with self.assertRaises(SmartBudgetError):
+            backup_chain.restore_rows(self.LEDGER)
+
+    def test_chain_files_are_not_ledgers(self):
+        self.make_chain()
+        self.assertEqual(ledger_files(include_primary=True), ["records.json"])
+
+    # ----------------------------
+    # storage backends
+    # ----------------------------
+    def test_sqlite_storage_chain(self):
+        storage = SqliteStorage()
+        try:
+            storage.save([Income("Salary", 100, "job")])
+            self.assertEqual(storage.backup_incremental()["kind"], backup_chain.KIND_FULL)
+            storage.append([Expense("Bus", 3, "transport")])
+            entry = storage.backup_incremental()
+
+            self.assertEqual((entry["kind"], entry["count"]), (backup_chain.KIND_DELTA, 1))
+            self.assertEqual(self.names(backup_chain.restore_rows(storage.filename)), ["Salary", "Bus"])
+        finally:
+            storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
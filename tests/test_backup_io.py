@@ -0,0 +1,99 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.file_io_module_3 import backup_io, json_io, journal_io
+from smartbudget.file_io_module_3.aggregate_store import read_totals
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+class TestBackupIO(unittest.TestCase):
+
+    TEST_DIR = "files"
+    SOURCE = "records.json"
+    TARGET = "backup.json"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+        json_io.clear_record_cache()
+        json_io.save_to_json([Income("Salary", 100, "job"), Expense("Food", 20, "meal")], self.SOURCE)
+
+    def tearDown(self):
+        json_io.clear_record_cache()
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    def path(self, name):
+        return os.path.join(self.TEST_DIR, name)
+
+    # ----------------------------
+    # snapshot sharing
+    # ----------------------------
+    def test_snapshot_is_hard_linked(self):
+        mode = backup_io.backup_ledger(self.SOURCE, self.TARGET)
+        self.assertEqual(mode, backup_io.MODE_LINK)
+        self.assertTrue(os.path.samefile(self.path(self.SOURCE), self.path(self.TARGET)))
+
+    def test_backup_unchanged_by_later_writes(self):
+        backup_io.backup_ledger(self.SOURCE, self.TARGET)
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.SOURCE)
+        json_io.save_to_json([Income("Gift", 5, "family")], self.SOURCE)
+
+        names = [r.name for r in json_io.load_from_json(self.TARGET)]
+        self.assertEqual(names, ["Salary", "Food"])
+        self.assertFalse(os.path.samefile(self.path(self.SOURCE), self.path(self.TARGET)))
+
+    def test_falls_back_to_copy(self):
+        with patch("smartbudget.file_io_module_3.backup_io.os.link", side_effect=OSError("EXDEV")):
+            mode = backup_io.backup_ledger(self.SOURCE, self.TARGET)
+
+        self.assertEqual(mode, backup_io.MODE_COPY)
+        self.assertFalse(os.path.samefile(self.path(self.SOURCE), self.path(self.TARGET)))
+        self.assertEqual(len(json_io.load_from_json(self.TARGET)), 2)
+
+    # ----------------------------
+    # journal and totals
+    # ----------------------------
+    def test_journal_is_copied(self):
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.SOURCE)
+        backup_io.backup_ledger(self.SOURCE, self.TARGET)
+
+        self.assertEqual(len(journal_io.read_journal(self.TARGET)), 1)
+        self.assertEqual(len(json_io.load_from_json(self.TARGET)), 3)
+
+        json_io.append_to_json([Expense("Taxi", 9, "transport")], self.SOURCE)
+        self.assertEqual(len(journal_io.read_journal(self.TARGET)), 1)
+
+    def test_stale_backup_journal_is_removed(self):
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.TARGET)
+        backup_io.backup_ledger(self.SOURCE, self.TARGET)
+        self.assertFalse(os.path.exists(journal_io.journal_path(self.TARGET)))
+
+    def test_totals_are_fresh_in_backup(self):
+        json_io.append_to_json([Expense("Bus", 3, "transport")], self.SOURCE)
+        json_io.load_totals(self.SOURCE)
+        backup_io.backup_ledger(self.SOURCE, self.TARGET)
+
+        totals = read_totals(self.TARGET)
+        self.assertIsNotNone(totals)
+        self.assertEqual(totals["count"], 3)
+        self.assertAlmostEqual(totals["expenses"], 23)
+
+    # ----------------------------
+    # errors
+    # ----------------------------
+    def test_missing_source(self):
+        with self.assertRaises(FileNotFoundError):
+            backup_io.backup_ledger("missing.json", self.TARGET)
+
+    def test_target_is_source(self):
+        with self.assertRaises(ValueError):
+            backup_io.backup_ledger(self.SOURCE, self.SOURCE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import csv
+import json
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.core_module_2.batch_import_controller import (
+    BatchImportController,
+    build_record,
+    import_file,
+)
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.file_io_module_3 import json_io
+from smartbudget import __main__ as cli
+
+
+TEST_DIR = "files"
+INPUT_DIR = "import_inputs"
+
+
+class TestBatchImportController(unittest.TestCase):
+
+    def setUp(self):
+        for d in (TEST_DIR, INPUT_DIR):
+            if os.path.exists(d):
+                shutil.rmtree(d)
+        os.makedirs(TEST_DIR, exist_ok=True)
+        os.makedirs(INPUT_DIR, exist_ok=True)
+
+        self.csv_path = os.path.join(INPUT_DIR, "ledger.csv")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write("type,name,amount,category,source\n")
+            f.write("income,Salary,3000,,Job\n")
+            f.write("expense,Rent,1200,Housing,\n")
+            f.write("expense,Broken,abc,Food,\n")
+            f.write("gift,Mystery,5,,\n")
+            f.write("Expense,Lunch,12.5,Food,\n")
+
+        self.jsonl_path = os.path.join(INPUT_DIR, "ledger.jsonl")
+        with open(self.jsonl_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(Income("Gift", 50, "family").to_dict()) + "\n")
+            f.write("{not json\n")
+            f.write("\n")
+            f.write(json.dumps({"type": "Expense", "name": "", "amount": 3, "category": "x"}) + "\n")
+
+    def tearDown(self):
+        for d in (TEST_DIR, INPUT_DIR):
+            if os.path.exists(d):
+                shutil.rmtree(d)
+
+    # --------------------------------------------------------
+    # row validation
+    # --------------------------------------------------------
+    def test_build_record(self):
+        self.assertIsInstance(build_record({"type": "Income", "name": "A", "amount": "5", "source": "x"}), Income)
+        self.assertIsInstance(build_record({"type": "expense", "name": "A", "amount": 5, "category": "x"}), Expense)
+        dated = build_record({"type": "expense", "name": "A", "amount": 5, "category": "x", "timestamp": "2025-03-01"})
+        self.assertEqual(dated.timestamp.month, 3)
+
+        for bad in ([1, 2], {"type": "expense", "name": "A", "amount": 5},
+                    {"type": "refund", "name": "A", "amount": 5}):
+            with self.assertRaises(SmartBudgetError):
+                build_record(bad)
+
+    # --------------------------------------------------------
+    # import_file
+    # --------------------------------------------------------
+    def test_import_csv_keeps_going_after_bad_rows(self):
+        report = import_file(self.csv_path)
+
+        self.assertEqual(report.imported, 3)
+        self.assertEqual([line for line, _ in report.errors], [4, 5])
+
+        records = json_io.load_from_json()
+        self.assertEqual([r.name for r in records], ["Salary", "Rent", "Lunch"])
+
+    def test_import_is_one_storage_write(self):
+        with patch("smartbudget.core_module_2.batch_import_controller.append_to_json") as mock_append:
+            import_file(self.csv_path)
+        mock_append.assert_called_once()
+        self.assertEqual(len(mock_append.call_args.args[0]), 3)
+
+    def test_import_jsonl(self):
+        report = import_file(self.jsonl_path)
+        self.assertEqual(report.imported, 1)
+        self.assertEqual([line for line, _ in report.errors], [2, 4])
+        self.assertIn("Invalid JSON", report.errors[0][1])
+
+    def test_dry_run_writes_nothing(self):
+        report = import_file(self.csv_path, dry_run=True)
+        self.assertEqual(report.imported, 3)
+        self.assertEqual(json_io.load_from_json(), [])
+
+    def test_progress_callback(self):
+        seen = []
+        import_file(self.csv_path, batch_size=2, dry_run=True, progress=seen.append)
+        self.assertEqual(seen, [2, 4])
+
+    def test_bad_inputs(self):
+        with self.assertRaises(SmartBudgetError):
+            import_file(os.path.join(INPUT_DIR, "missing.csv"))
+
+        other = os.path.join(INPUT_DIR, "ledger.xml")
+        open(other, "w").close()
+        with self.assertRaises(SmartBudgetError):
+            import_file(other)
+
+    def test_non_utf8_rows_are_rejected(self):
+        path = os.path.join(INPUT_DIR, "latin1.csv")
+        with open(path, "wb") as f:
+            f.write(b"type,name,amount,category,source\n")
+            f.write("expense,Café,4,Food,\n".encode("latin-1"))
+            f.write(b"income,Salary,3000,,Job\n")
+
+        report = import_file(path)
+        self.assertEqual(report.imported, 1)
+        self.assertEqual([line for line, _ in report.errors], [2])
+        self.assertIn("not valid UTF-8", report.errors[0][1])
+
+        jsonl = os.path.join(INPUT_DIR, "latin1.jsonl")
+        with open(jsonl, "wb") as f:
+            f.write('{"type": "Expense", "name": "Café", "amount": 4, "category": "x"}\n'.encode("latin-1"))
+        self.assertEqual([line for line, _ in import_file(jsonl).errors], [1])
+
+    def test_malformed_csv_rows_are_rejected(self):
+        path = os.path.join(INPUT_DIR, "huge.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("type,name,amount,category,source\n")
+            f.write("expense," + "x" * (csv.field_size_limit() + 1) + ",4,Food,\n")
+            f.write("income,Salary,3000,,Job\n")
+
+        report = import_file(path)
+        self.assertEqual(report.imported, 1)
+        self.assertIn("Malformed CSV", report.errors[0][1])
+
+    # --------------------------------------------------------
+    # controller & CLI
+    # --------------------------------------------------------
+    @patch("builtins.print")
+    def test_controller_prints_report(self, mock_print):
+        report = BatchImportController().run_import(self.csv_path)
+        out = "\n".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertEqual(report.rejected, 2)
+        self.assertIn("Line 4", out)
+        self.assertIn("Imported 3 records", out)
+
+    @patch("builtins.print")
+    def test_controller_handles_failure(self, mock_print):
+        self.assertIsNone(BatchImportController().run_import("nope.csv"))
+
+    @patch("builtins.print")
+    def test_cli_import(self, mock_print):
+        self.assertEqual(cli.main(["import", self.jsonl_path]), 1)
+        self.assertEqual(cli.main(["import", self.jsonl_path, "--into", "other.json", "--dry-run"]), 1)
+        self.assertEqual(len(json_io.load_from_json()), 1)
+
+    @patch("builtins.print")
+    def test_cli_non_utf8_import_fails_cleanly(self, mock_print):
+        path = os.path.join(INPUT_DIR, "latin1.csv")
+        with open(path, "wb") as f:
+            f.write(b"type,name,amount,category,source\n")
+            f.write("expense,Café,4,Food,\n".encode("latin-1"))
+        self.assertEqual(cli.main(["import", path]), 1)
+
+    @patch("builtins.print")
+    def test_cli_rejects_target_of_other_backend(self, mock_print):
+        self.assertEqual(cli.main(["import", self.csv_path, "--storage", "sqlite", "--into", "x.json"]), 1)
+        self.assertEqual(cli.main(["import", self.csv_path, "--storage", "json", "--into", "x.db"]), 1)
+        self.assertFalse(os.path.exists(os.path.join(TEST_DIR, "x.json")))
+        self.assertFalse(os.path.exists(os.path.join(TEST_DIR, "x.db")))
+        out = "\n".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("does not fit the sqlite backend", out)
+
+    @patch("smartbudget.__main__.run")
+    def test_cli_without_command_runs_menu(self, mock_run):
+        self.assertEqual(cli.main([]), 0)
+        mock_run.assert_called_once()
@@ -0,0 +1,156 @@
+import os
+import shutil
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from benchmarks import ledger_gen, replay, suite
+from smartbudget.file_io_module_3 import json_io, journal_io
+
+
+class TestLedgerGen(unittest.TestCase):
+
+    TEST_DIR = "files"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        json_io.clear_record_cache()
+
+    def tearDown(self):
+        json_io.clear_record_cache()
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    def test_deterministic(self):
+        self.assertEqual(ledger_gen.generate_rows(500, seed=1), ledger_gen.generate_rows(500, seed=1))
+        self.assertNotEqual(ledger_gen.generate_rows(500, seed=1), ledger_gen.generate_rows(500, seed=2))
+
+    def test_distribution(self):
+        rows = ledger_gen.generate_rows(5000)
+        kinds = Counter(r["type"] for r in rows)
+        self.assertGreater(kinds["Expense"], kinds["Income"] * 5)
+
+        categories = Counter(r["category"] for r in rows if r["type"] == "Expense")
+        self.assertEqual(categories.most_common(1)[0][0], "food")
+        self.assertTrue(all(r["amount"] > 0 for r in rows))
+
+        stamps = [r["timestamp"] for r in rows]
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_undated_share(self):
+        rows = ledger_gen.generate_rows(200, undated_share=1.0)
+        self.assertFalse(any("timestamp" in r for r in rows))
+
+    def test_write_ledger_round_trip(self):
+        ledger_gen.write_ledger(300, "gen.json", journal_rows=50)
+        records = json_io.load_from_json("gen.json")
+
+        self.assertEqual([r.to_dict() for r in records], ledger_gen.generate_rows(300))
+        self.assertEqual(len(journal_io.read_journal("gen.json")), 50)
+
+    def test_write_empty_ledger(self):
+        ledger_gen.write_ledger(0, "empty.json")
+        self.assertEqual(json_io.load_from_json("empty.json"), [])
+
+    def test_write_ledger_replaces_file(self):
+        ledger_gen.write_ledger(10, "gen.json")
+        path = os.path.join(self.TEST_DIR, "gen.json")
+        backup = os.path.join(self.TEST_DIR, "backup.json")
+        os.link(path, backup)
+        with open(backup, encoding="utf-8") as f:
+            before = f.read()
+
+        ledger_gen.write_ledger(20, "gen.json", seed=2)
+        with open(backup, encoding="utf-8") as f:
+            self.assertEqual(f.read(), before)
+
+    @patch("builtins.print")
+    def test_cli_refuses_system_files(self, mock_print):
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            ledger_gen.main(["--rows", "5", "--output", "records.json"])
+        self.assertFalse(os.path.exists(os.path.join(self.TEST_DIR, "records.json")))
+
+        ledger_gen.main(["--rows", "5"])
+        self.assertTrue(os.path.exists(os.path.join(self.TEST_DIR, ledger_gen.DEFAULT_OUTPUT)))
+
+
+class TestSuite(unittest.TestCase):
+
+    @patch("builtins.print")
+    def test_run_size(self, mock_print):
+        results = suite.run_size(200, repeat=2, seed=1, cases=["load_split", "backup_incremental", "append"])
+
+        self.assertEqual([r["case"] for r in results], ["load_split", "backup_incremental", "append"])
+        for result in results:
+            self.assertEqual(result["size"], 200)
+            self.assertEqual(len(result["runs"]), 2)
+            self.assertLessEqual(result["best"], result["mean"])
+
+    def test_every_case_named_once(self):
+        names = [case.name for case in suite.build_cases()]
+        self.assertEqual(len(names), len(set(names)))
+
+    @patch("builtins.print")
+    def test_compare_flags_regressions(self, mock_print):
+        baseline = {"results": [
+            {"case": "load", "size": 10, "best": 0.010},
+            {"case": "fast", "size": 10, "best": 0.0001},
+        ]}
+        results = [
+            {"case": "load", "size": 10, "best": 0.020},
+            {"case": "fast", "size": 10, "best": 0.0005},
+            {"case": "new", "size": 10, "best": 1.0},
+        ]
+        regressions = suite.compare(results, baseline, threshold=1.25)
+        self.assertEqual([(r["case"], round(r["ratio"], 1)) for r in regressions], [("load", 2.0)])
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        self.script = replay.load_script(replay.DEFAULT_SCRIPT)
+
+    @patch.dict(os.environ, {"MPLBACKEND": "Agg"})
+    def test_replay_default_script(self):
+        steps = replay.replay(self.script, rows=300, repeat=1)
+
+        self.assertEqual([s["action"] for s in steps], [s["action"] for s in self.script["steps"]])
+        for step in steps:
+            self.assertGreaterEqual(step["seconds"], 0)
+            self.assertIn("read_bytes", step)
+            self.assertIn("peak_bytes", step)
+
+        summary = replay.summarize(steps)
+        self.assertEqual(summary["summary"]["steps"], 3)
+        for action in ("add_income", "backup", "list", "delete", "reset", "chart"):
+            self.assertIn(action, summary)
+
+    def test_missing_answer(self):
+        script = {"steps": [{"action": "add_income", "inputs": ["1", "Salary"]},
+                            {"action": "exit", "inputs": ["0"]}]}
+        with replay.scratch_ledger(10):
+            with self.assertRaises(replay.ReplayError):
+                replay.replay_once(script)
+
+    def test_unused_answer(self):
+        script = {"steps": [{"action": "summary", "inputs": ["3", "extra"]},
+                            {"action": "exit", "inputs": ["0"]}]}
+        with replay.scratch_ledger(10):
+            with self.assertRaises(replay.ReplayError):
+                replay.replay_once(script)
+
+    def test_record_session(self):
+        answers = iter(["3", "1", "Salary", "3000", "job", "0"])
+        with replay.scratch_ledger(10) as workdir:
+            path = os.path.join(workdir, "recorded.json")
+            with patch("builtins.input", lambda prompt="": next(answers)), patch("builtins.print"):
+                script = replay.record_session(path)
+            self.assertEqual(replay.load_script(path), script)
+
+        self.assertEqual([s["action"] for s in script["steps"]], ["summary", "add_income", "exit"])
+        self.assertEqual(script["steps"][1]["inputs"], ["1", "Salary", "3000", "job"])
+
+
+if __name__ == "__main__":
+    unittest.main()
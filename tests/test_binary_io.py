@@ -0,0 +1,90 @@
+import os
+import shutil
+import unittest
+
+from smartbudget.file_io_module_3 import binary_io, json_io
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import RecordBase
+
+
+class TestBinaryIO(unittest.TestCase):
+
+    TEST_DIR = "files"
+    BIN_FILE = "records.sbr"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+
+        self.records = [
+            Income("Salary", 3000, "Job"),
+            Expense("Rent", 1200, "Housing"),
+            Expense("Café", 4.25, "Food"),
+            Expense("Rent", 1200, "Housing"),
+            RecordBase("Misc", 7),
+        ]
+
+    def tearDown(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    # ----------------------------
+    # save / load round trip
+    # ----------------------------
+    def test_round_trip(self):
+        written = binary_io.save_to_binary(self.records, self.BIN_FILE)
+        self.assertEqual(written, 5)
+
+        loaded = binary_io.load_from_binary(self.BIN_FILE)
+        self.assertEqual([r.to_dict() for r in loaded], [r.to_dict() for r in self.records])
+        self.assertEqual([type(r) for r in loaded], [type(r) for r in self.records])
+
+    def test_timestamps_round_trip(self):
+        self.records[1].timestamp = "2025-03-01T08:15:00"
+        self.records[4].timestamp = "1969-12-31T23:59:59.500000"
+        binary_io.save_to_binary(self.records, self.BIN_FILE)
+
+        loaded = binary_io.load_from_binary(self.BIN_FILE)
+        self.assertEqual([r.to_dict() for r in loaded], [r.to_dict() for r in self.records])
+        self.assertIsNone(loaded[0].timestamp)
+
+    def test_strings_stored_once(self):
+        binary_io.save_to_binary(self.records, self.BIN_FILE)
+        with open(os.path.join(self.TEST_DIR, self.BIN_FILE), "rb") as f:
+            data = f.read()
+        self.assertEqual(data.count(b"housing"), 1)
+        self.assertEqual(data.count(b"Rent"), 1)
+
+    def test_empty_snapshot(self):
+        binary_io.save_to_binary([], self.BIN_FILE)
+        self.assertEqual(binary_io.load_from_binary(self.BIN_FILE), [])
+        self.assertEqual(binary_io.binary_totals(self.BIN_FILE), (0, 0))
+
+    def test_rejects_other_files(self):
+        with open(os.path.join(self.TEST_DIR, "bad.sbr"), "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            binary_io.binary_totals("bad.sbr")
+
+    # ----------------------------
+    # mmap totals
+    # ----------------------------
+    def test_binary_totals(self):
+        binary_io.save_to_binary(self.records, self.BIN_FILE)
+        self.assertEqual(binary_io.binary_totals(self.BIN_FILE), (3000, 2404.25))
+
+    # ----------------------------
+    # conversion
+    # ----------------------------
+    def test_json_binary_conversion(self):
+        json_io.save_to_json(self.records[:3], "records.json")
+        json_io.append_to_json(self.records[3:], "records.json")
+
+        self.assertEqual(binary_io.json_to_binary("records.json", self.BIN_FILE), 5)
+        self.assertEqual(binary_io.binary_to_json(self.BIN_FILE, "copy.json"), 5)
+
+        original = [r.to_dict() for r in json_io.load_from_json("records.json")]
+        copied = [r.to_dict() for r in json_io.load_from_json("copy.json")]
+        self.assertEqual(original, copied)
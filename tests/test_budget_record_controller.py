@@ -3,6 +3,8 @@ from unittest.mock import patch, MagicMock
 
 from smartbudget.core_module_2.budget_record_controller import BudgetRecordController
 from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.file_io_module_3.storage import StorageBackend
+from smartbudget.file_io_module_3.aggregate_store import empty_totals
 
 
 class TestBudgetRecordController(unittest.TestCase):
@@ -12,13 +14,15 @@ class TestBudgetRecordController(unittest.TestCase):
         print("\n[BudgetRecordController] setUpClass")
 
     def setUp(self):
-        self.controller = BudgetRecordController()
+        self.storage = MagicMock(spec=StorageBackend)
+        self.storage.load.return_value = []
+        self.storage.totals.return_value = empty_totals()
+        self.controller = BudgetRecordController(self.storage)
 
     # ----------------------------------------------------------
     # add_income — normal path
     # ----------------------------------------------------------
-    @patch("smartbudget.core_module_2.budget_record_controller.append_to_json")
-    def test_add_income(self, mock_append):
+    def test_add_income(self):
         with patch("builtins.input", side_effect=["Salary", "3000", "Work"]):
             self.controller.add_income()
 
@@ -29,13 +33,12 @@ class TestBudgetRecordController(unittest.TestCase):
         self.assertEqual(inc.amount, 3000)
         self.assertEqual(inc.source, "work")
 
-        mock_append.assert_called_once()
+        self.storage.append.assert_called_once()
 
     # ----------------------------------------------------------
     # add_expense — normal path
     # ----------------------------------------------------------
-    @patch("smartbudget.core_module_2.budget_record_controller.append_to_json")
-    def test_add_expense(self, mock_append):
+    def test_add_expense(self):
         with patch("builtins.input", side_effect=["Taxi", "15", "Transport"]):
             self.controller.add_expense()
 
@@ -46,7 +49,7 @@ class TestBudgetRecordController(unittest.TestCase):
         self.assertEqual(exp.amount, 15)
         self.assertEqual(exp.category, "transport")
 
-        mock_append.assert_called_once()
+        self.storage.append.assert_called_once()
 
     # ----------------------------------------------------------
     # add_income — invalid numeric input (cover SmartBudgetError branch)
@@ -68,11 +71,10 @@ class TestBudgetRecordController(unittest.TestCase):
         self.assertEqual(len(self.controller.expenses), 0)
 
     # ----------------------------------------------------------
-    # append_to_json fails — cover inner try/except
+    # storage append fails — cover inner try/except
     # ----------------------------------------------------------
-    @patch("smartbudget.core_module_2.budget_record_controller.append_to_json")
-    def test_add_income_save_error(self, mock_append):
-        mock_append.side_effect = Exception("disk write fail")
+    def test_add_income_save_error(self):
+        self.storage.append.side_effect = Exception("disk write fail")
 
         with patch("builtins.input", side_effect=["Salary", "1000", "Work"]):
             self.controller.add_income()
@@ -80,9 +82,8 @@ class TestBudgetRecordController(unittest.TestCase):
         # Should record income, but print failure message
         self.assertEqual(len(self.controller.incomes), 1)
 
-    @patch("smartbudget.core_module_2.budget_record_controller.append_to_json")
-    def test_add_expense_save_error(self, mock_append):
-        mock_append.side_effect = Exception("disk write fail")
+    def test_add_expense_save_error(self):
+        self.storage.append.side_effect = Exception("disk write fail")
 
         with patch("builtins.input", side_effect=["Taxi", "9", "Transport"]):
             self.controller.add_expense()
@@ -96,6 +97,15 @@ class TestBudgetRecordController(unittest.TestCase):
     def test_show_summary(self, mock_print):
         self.controller.show_summary()
         self.assertTrue(mock_print.called)
+        self.storage.totals.assert_called_once()
+
+    @patch("builtins.print")
+    def test_details_come_from_storage(self, mock_print):
+        from smartbudget.entity.income import Income
+        self.storage.load.return_value = [Income("Salary", 3000, "Job")]
+        self.controller.show_income_details()
+        out = "\n".join(str(c.args[-1]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("Salary", out)
 
     @patch("builtins.print")
     def test_show_income_details(self, mock_print):
@@ -107,6 +117,14 @@ class TestBudgetRecordController(unittest.TestCase):
         self.controller.show_expense_details()
         self.assertTrue(mock_print.called)
 
+    @patch("smartbudget.core_module_2.budget_record_controller.monthly_totals",
+           return_value=[{"period": "2025-03", "income": 10.0, "expenses": 4.0, "balance": 6.0}])
+    @patch("builtins.print")
+    def test_show_monthly_trends(self, mock_print, mock_report):
+        self.controller.show_monthly_trends()
+        out = "\n".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("2025-03", out)
+
     @patch("smartbudget.core_module_2.budget_record_controller.plot_expense_by_category")
     @patch("builtins.print")
     def test_show_expense_plot(self, mock_print, mock_plot):
@@ -0,0 +1,121 @@
+"""
+Test suite for DateIndex.
+
+Verifies range queries, month views and balance-as-of answered from the
+sorted timestamp index, and that undated records are kept aside.
+"""
+
+import os
+import time
+import unittest
+from datetime import date, datetime
+
+from smartbudget.analysis_module_1.date_index import DateIndex, month_bounds
+from smartbudget.analysis_module_1.session import AnalysisSession
+from smartbudget.file_io_module_3.aggregate_store import period_key
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+class TestDateIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            Expense("Rent", 1200, "Housing", "2025-03-01"),
+            Income("Salary", 3000, "Job", "2025-02-28T09:00:00"),
+            Expense("Lunch", 15, "Food", "2025-03-14T12:30:00"),
+            Expense("Dinner", 40, "Food", "2025-03-31T20:00:00"),
+            Income("Gift", 100, "Family", "2025-04-02"),
+            Expense("Old", 5, "Misc"),
+        ]
+        self.index = DateIndex(self.records)
+
+    # ----------------------------
+    # construction
+    # ----------------------------
+    def test_sorted_and_undated(self):
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual([r.name for r in self.index.undated], ["Old"])
+        self.assertEqual(self.index.first_date(), datetime(2025, 2, 28, 9))
+        self.assertEqual(self.index.last_date(), datetime(2025, 4, 2))
+
+    def test_month_bounds(self):
+        self.assertEqual(month_bounds(2025, 12), (datetime(2025, 12, 1), datetime(2026, 1, 1)))
+
+    # ----------------------------
+    # range queries
+    # ----------------------------
+    def test_expenses_in_march(self):
+        march = self.index.month(2025, 3)
+        self.assertEqual([r.name for r in march], ["Rent", "Lunch", "Dinner"])
+        self.assertEqual(
+            [r.name for r in self.index.expenses_between("2025-03-10", "2025-04-01")],
+            ["Lunch", "Dinner"],
+        )
+        self.assertEqual([r.name for r in self.index.incomes_between(end=date(2025, 3, 1))], ["Salary"])
+
+    def test_open_and_empty_ranges(self):
+        self.assertEqual(len(self.index.between()), 5)
+        self.assertEqual(self.index.between("2025-05-01", "2025-01-01"), [])
+        self.assertEqual(self.index.totals_between("2030-01-01"), (0.0, 0.0))
+
+    def test_totals_between(self):
+        self.assertEqual(self.index.totals_between(*month_bounds(2025, 3)), (0.0, 1255.0))
+        self.assertEqual(self.index.totals_between(), (3100.0, 1255.0))
+
+    def test_balance_as_of(self):
+        self.assertEqual(self.index.balance_as_of("2025-02-01"), 0.0)
+        # a bare date includes the whole day
+        self.assertEqual(self.index.balance_as_of("2025-03-14"), 3000 - 1215)
+        self.assertEqual(self.index.balance_as_of(datetime(2025, 3, 14, 12)), 3000 - 1200)
+        self.assertEqual(self.index.balance_as_of(date(2025, 12, 31)), 3100 - 1255)
+
+    # ----------------------------
+    # session integration
+    # ----------------------------
+    def test_session_date_index_is_memoized(self):
+        session = AnalysisSession.from_records(self.records)
+        index = session.date_index()
+        self.assertIs(session.date_index(), index)
+        self.assertEqual(len(index), 5)
+        self.assertEqual(len(index.undated), 1)
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset to pin the local zone")
+class TestMixedTimezones(unittest.TestCase):
+    """Aware and naive stamps land in the same local timeline and month."""
+
+    def setUp(self):
+        self._saved_tz = os.environ.get("TZ")
+        os.environ["TZ"] = "PST8"    # fixed UTC-8, no DST
+        time.tzset()
+        self.records = [
+            Expense("Dinner", 40, "Food", "2025-03-31T20:00:00"),
+            # 03:30 UTC on April 1st is 19:30 local on March 31st
+            Expense("Taxi", 25, "Transport", "2025-04-01T03:30:00+00:00"),
+            # 09:00 UTC on April 1st is 01:00 local, still April
+            Income("Refund", 10, "Shop", "2025-04-01T09:00:00+00:00"),
+        ]
+        self.index = DateIndex(self.records)
+
+    def tearDown(self):
+        if self._saved_tz is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = self._saved_tz
+        time.tzset()
+
+    def test_order_across_month_boundary(self):
+        self.assertEqual([r.name for r in self.index.between()], ["Taxi", "Dinner", "Refund"])
+        self.assertEqual(self.index.first_date(), datetime(2025, 3, 31, 19, 30))
+
+    def test_month_placement(self):
+        self.assertEqual([r.name for r in self.index.month(2025, 3)], ["Taxi", "Dinner"])
+        self.assertEqual([r.name for r in self.index.month(2025, 4)], ["Refund"])
+        self.assertEqual([period_key(r.to_dict()) for r in self.records],
+                         ["2025-03", "2025-03", "2025-04"])
+
+    def test_trusted_rows_with_offset_are_local(self):
+        row = {"type": "Expense", "name": "Taxi", "amount": 25, "category": "Transport",
+               "timestamp": "2025-04-01T03:30:00+00:00"}
+        self.assertEqual(Expense.from_trusted_dict(row).timestamp, datetime(2025, 3, 31, 19, 30))
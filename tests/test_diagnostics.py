@@ -0,0 +1,89 @@
+import logging
+import unittest
+from unittest.mock import MagicMock
+
+from smartbudget import stats
+from smartbudget.analysis_module_1.diagnostics import (
+    INVALID_AMOUNT,
+    MISSING_AMOUNT,
+    SAMPLE_SIZE,
+    UNSUPPORTED_TYPE,
+    ValidationReport,
+    check_amount,
+)
+from smartbudget.entity.income import Income
+
+
+class TestValidationReport(unittest.TestCase):
+
+    def tearDown(self):
+        stats.disable()
+        stats.reset()
+
+    def test_counts_and_capped_sample(self):
+        report = ValidationReport("records.json")
+        for i in range(12):
+            report.add(UNSUPPORTED_TYPE, i)
+        report.add(INVALID_AMOUNT, "x")
+
+        self.assertEqual(report.counts, {UNSUPPORTED_TYPE: 12, INVALID_AMOUNT: 1})
+        self.assertEqual(report.total, 13)
+        self.assertEqual(len(report.samples), SAMPLE_SIZE)
+        text = str(report)
+        self.assertIn("13 invalid record(s) in records.json", text)
+        self.assertIn("unsupported_type=12", text)
+
+    def test_long_sample_truncated(self):
+        report = ValidationReport()
+        report.add(UNSUPPORTED_TYPE, "y" * 500)
+        self.assertLess(len(str(report)), 200)
+
+    def test_clean_report_emits_nothing(self):
+        logger = MagicMock()
+        report = ValidationReport()
+        self.assertFalse(report)
+        self.assertFalse(report.emit(logger, "[test]"))
+        logger.warning.assert_not_called()
+
+    def test_emit_single_lazy_call(self):
+        logger = MagicMock()
+        report = ValidationReport()
+        report.add(UNSUPPORTED_TYPE, object())
+        report.add(UNSUPPORTED_TYPE, object())
+
+        self.assertTrue(report.emit(logger, "[test]", "error"))
+        logger.error.assert_called_once_with("%s %s", "[test]", report)
+
+    def test_emit_skips_formatting_when_disabled(self):
+        logger = logging.getLogger("smartbudget.test_diagnostics")
+        logger.setLevel(logging.ERROR)
+        formatted = []
+
+        class Bad:
+            def __repr__(self):
+                formatted.append(self)
+                return "Bad()"
+
+        report = ValidationReport()
+        report.add(UNSUPPORTED_TYPE, Bad())
+
+        report.emit(logger, "[test]")
+        self.assertEqual(formatted, [])
+
+    def test_emit_counts_into_stats(self):
+        stats.enable(report_at_exit=False)
+        report = ValidationReport()
+        report.add(MISSING_AMOUNT, object())
+        report.emit(MagicMock(), "[test]")
+        self.assertEqual(stats.report()["counters"], {"validate.missing_amount": 1})
+
+    def test_check_amount(self):
+        report = ValidationReport()
+        self.assertTrue(check_amount(Income("A", 10, "job"), report))
+        self.assertFalse(check_amount(object(), report))
+        self.assertFalse(check_amount(type("Obj", (), {"amount": "x"})(), report))
+        self.assertEqual(report.counts, {MISSING_AMOUNT: 1, INVALID_AMOUNT: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
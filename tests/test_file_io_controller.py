@@ -1,7 +1,12 @@
+import os
+import shutil
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from smartbudget.core_module_2.file_io_data_controller import FileIoDataStorageController
 from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget.entity.income import Income
+from smartbudget.file_io_module_3 import json_io
+from smartbudget.file_io_module_3.storage import JsonStorage, StorageBackend
 
 
 def collect_print_output(mock_print):
@@ -17,25 +22,30 @@ def collect_print_output(mock_print):
 class TestFileIoDataStorageController(unittest.TestCase):
 
     def setUp(self):
-        self.controller = FileIoDataStorageController()
+        self.storage = MagicMock(spec=StorageBackend)
+        self.storage.filename = "records.json"
+        self.storage.load.return_value = []
+        self.controller = FileIoDataStorageController(self.storage)
 
     # --------------------------------------------------------
     # clear_data
     # --------------------------------------------------------
-    @patch("smartbudget.core_module_2.file_io_data_controller.clear_json")
-    def test_clear_data_yes(self, mock_clear):
+    def test_clear_data_yes(self):
         with patch("builtins.input", return_value="y"):
             self.controller.clear_data()
-        mock_clear.assert_called_once()
+        self.storage.clear.assert_called_once()
 
     def test_clear_data_no(self):
         with patch("builtins.input", return_value="n"):
             self.controller.clear_data()
+        self.storage.clear.assert_not_called()
 
-    @patch("smartbudget.core_module_2.file_io_data_controller.clear_json", side_effect=Exception("ERR"))
     @patch("builtins.input", return_value="y")
-    def test_clear_data_error(self, mock_input, mock_clear):
+    @patch("builtins.print")
+    def test_clear_data_error(self, mock_print, mock_input):
+        self.storage.clear.side_effect = Exception("ERR")
         self.controller.clear_data()
+        self.assertIn("Failed to clear", collect_print_output(mock_print))
 
     # --------------------------------------------------------
     # save_data
@@ -63,28 +73,16 @@ class TestFileIoDataStorageController(unittest.TestCase):
         self.assertIn("Save cancelled", out)
 
     @patch("smartbudget.core_module_2.file_io_data_controller.file_exists", return_value=True)
-    @patch("smartbudget.core_module_2.file_io_data_controller.load_from_json", return_value=[{"x": 1}])
-    @patch("smartbudget.core_module_2.file_io_data_controller.save_to_json")
     @patch("builtins.input", side_effect=["backup.json", "y"])
-    def test_save_data_overwrite_yes(self, mock_input, mock_save, mock_load, mock_exists):
+    def test_save_data_overwrite_yes(self, mock_input, mock_exists):
         self.controller.save_data()
-        mock_save.assert_called_once()
+        self.storage.backup.assert_called_once_with("backup.json")
 
     @patch("smartbudget.core_module_2.file_io_data_controller.file_exists", return_value=False)
-    @patch("smartbudget.core_module_2.file_io_data_controller.load_from_json", side_effect=Exception("LOAD ERR"))
     @patch("builtins.input", return_value="backup.json")
     @patch("builtins.print")
-    def test_save_data_load_error(self, mock_print, mock_input, mock_load, mock_exists):
-        self.controller.save_data()
-        out = collect_print_output(mock_print)
-        self.assertIn("Failed to read", out)
-
-    @patch("smartbudget.core_module_2.file_io_data_controller.file_exists", return_value=False)
-    @patch("smartbudget.core_module_2.file_io_data_controller.load_from_json", return_value=[{"x": 1}])
-    @patch("smartbudget.core_module_2.file_io_data_controller.save_to_json", side_effect=Exception("SAVE ERR"))
-    @patch("builtins.input", return_value="backup.json")
-    @patch("builtins.print")
-    def test_save_data_save_error(self, mock_print, mock_input, mock_save, mock_load, mock_exists):
+    def test_save_data_save_error(self, mock_print, mock_input, mock_exists):
+        self.storage.backup.side_effect = Exception("SAVE ERR")
         self.controller.save_data()
         out = collect_print_output(mock_print)
         self.assertIn("Failed to save backup file", out)
@@ -159,6 +157,31 @@ class TestFileIoDataStorageController(unittest.TestCase):
         out = collect_print_output(mock_print)
         self.assertIn("Failed to list files", out)
 
+    @patch("builtins.print")
+    def test_show_files_hides_backup_companions(self, mock_print):
+        if os.path.exists("files"):
+            shutil.rmtree("files")
+        self.addCleanup(shutil.rmtree, "files", True)
+        self.addCleanup(json_io.clear_record_cache)
+        json_io.save_to_json([Income("Salary", 100, "job")])
+        json_io.append_to_json([Income("Bonus", 50, "job")])
+        json_io.load_totals()
+
+        controller = FileIoDataStorageController(JsonStorage())
+        with patch("builtins.input", return_value="backup.json"):
+            controller.save_data()
+        self.assertTrue(os.path.exists(os.path.join("files", "backup.jsonl")))
+        self.assertTrue(os.path.exists(os.path.join("files", "backup.totals.json")))
+
+        mock_print.reset_mock()
+        controller.show_files()
+        names = [c.args[1] for c in mock_print.call_args_list if c.args and c.args[0] == " -"]
+        self.assertEqual(names, ["backup.json"])
+
+        with patch("builtins.input", return_value="backup.jsonl"):
+            controller.delete_backup_file()
+        self.assertTrue(os.path.exists(os.path.join("files", "backup.jsonl")))
+
     # --------------------------------------------------------
     # delete_backup_file
     # --------------------------------------------------------
@@ -169,6 +192,12 @@ class TestFileIoDataStorageController(unittest.TestCase):
         out = collect_print_output(mock_print)
         self.assertIn("Delete error", out)
 
+    @patch("builtins.print")
+    def test_sqlite_ledger_is_a_system_file(self, mock_print):
+        with patch("builtins.input", return_value="records.db"):
+            self.controller.delete_backup_file()
+        self.assertIn("Cannot delete system file", collect_print_output(mock_print))
+
     @patch("builtins.print")
     def test_delete_backup_system_file(self, mock_print):
         with patch("builtins.input", return_value="records.json"):
@@ -199,3 +228,100 @@ class TestFileIoDataStorageController(unittest.TestCase):
         self.controller.delete_backup_file()
         out = collect_print_output(mock_print)
         self.assertIn("File deletion failed", out)
+
+    # --------------------------------------------------------
+    # backup_incremental / restore_point
+    # --------------------------------------------------------
+    @patch("builtins.print")
+    def test_backup_incremental_delta(self, mock_print):
+        self.storage.backup_incremental.return_value = {"id": 3, "kind": "delta", "count": 2, "total": 9}
+        self.controller.backup_incremental()
+        self.assertIn("Backup #3: 2 new records", collect_print_output(mock_print))
+
+    @patch("builtins.print")
+    def test_backup_incremental_error(self, mock_print):
+        self.storage.backup_incremental.side_effect = OSError("disk full")
+        self.controller.backup_incremental()
+        self.assertIn("Backup error", collect_print_output(mock_print))
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.list_backups", return_value=[])
+    @patch("builtins.print")
+    def test_restore_point_no_backups(self, mock_print, mock_list):
+        self.controller.restore_point()
+        self.assertIn("No incremental backups", collect_print_output(mock_print))
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.list_backups")
+    @patch("smartbudget.core_module_2.file_io_data_controller.restore_records", return_value=["r1", "r2"])
+    @patch("builtins.input", side_effect=["2", "", "y"])
+    @patch("builtins.print")
+    def test_restore_point_into_current(self, mock_print, mock_input, mock_restore, mock_list):
+        mock_list.return_value = [{"id": 2, "created": "2025-03-01T10:00:00", "kind": "full", "total": 2}]
+        self.controller.restore_point()
+        mock_restore.assert_called_once_with("records.json", "2")
+        self.storage.save.assert_called_once_with(["r1", "r2"])
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.list_backups")
+    @patch("smartbudget.core_module_2.file_io_data_controller.restore_records")
+    @patch("builtins.input", side_effect=["", "", "n"])
+    @patch("builtins.print")
+    def test_restore_point_cancelled(self, mock_print, mock_input, mock_restore, mock_list):
+        mock_list.return_value = [{"id": 1, "created": "2025-03-01T10:00:00", "kind": "full", "total": 0}]
+        self.controller.restore_point()
+        mock_restore.assert_not_called()
+        self.storage.save.assert_not_called()
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.file_exists", return_value=False)
+    @patch("smartbudget.core_module_2.file_io_data_controller.list_backups")
+    @patch("smartbudget.core_module_2.file_io_data_controller.restore_backup", return_value=5)
+    @patch("builtins.input", side_effect=["2025-03-01", "old.json"])
+    @patch("builtins.print")
+    def test_restore_point_into_file(self, mock_print, mock_input, mock_restore, mock_list, mock_exists):
+        mock_list.return_value = [{"id": 1, "created": "2025-03-01T10:00:00", "kind": "full", "total": 5}]
+        self.controller.restore_point()
+        mock_restore.assert_called_once_with("records.json", "2025-03-01", "old.json")
+        self.assertIn("Restored 5 records into old.json", collect_print_output(mock_print))
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.list_backups")
+    @patch("smartbudget.core_module_2.file_io_data_controller.restore_backup")
+    @patch("builtins.input", side_effect=["", "records.chain.0001.jsonl"])
+    @patch("builtins.print")
+    def test_restore_point_refuses_chain_file(self, mock_print, mock_input, mock_restore, mock_list):
+        mock_list.return_value = [{"id": 1, "created": "2025-03-01T10:00:00", "kind": "full", "total": 5}]
+        self.controller.restore_point()
+        mock_restore.assert_not_called()
+        self.assertIn("Cannot restore into system file", collect_print_output(mock_print))
+
+    # --------------------------------------------------------
+    # report_backups / show_ledger_report
+    # --------------------------------------------------------
+    @patch("smartbudget.core_module_2.file_io_data_controller.aggregate_ledgers")
+    @patch("builtins.print")
+    def test_show_ledger_report(self, mock_print, mock_aggregate):
+        totals = {"count": 1, "income": 10.0, "expenses": 4.0,
+                  "by_category": {"food": 4.0}, "by_source": {"job": 10.0}}
+        mock_aggregate.return_value = {"ledgers": {"a.json": totals}, "combined": totals}
+
+        self.assertTrue(self.controller.show_ledger_report(["a.json"]))
+        out = collect_print_output(mock_print)
+        self.assertIn("a.json", out)
+        self.assertIn("TOTAL", out)
+        self.assertIn("food", out)
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.aggregate_ledgers",
+           side_effect=SmartBudgetError("Ledger file(s) not found: x.json"))
+    @patch("builtins.print")
+    def test_show_ledger_report_error(self, mock_print, mock_aggregate):
+        self.assertFalse(self.controller.show_ledger_report(["x.json"]))
+        self.assertIn("Report error", collect_print_output(mock_print))
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.FileIoDataStorageController.show_ledger_report")
+    @patch("builtins.input", return_value=" a.json, b.json ,")
+    def test_report_backups_parses_names(self, mock_input, mock_show):
+        self.controller.report_backups()
+        mock_show.assert_called_once_with(["a.json", "b.json"])
+
+    @patch("smartbudget.core_module_2.file_io_data_controller.FileIoDataStorageController.show_ledger_report")
+    @patch("builtins.input", return_value="")
+    def test_report_backups_defaults_to_all(self, mock_input, mock_show):
+        self.controller.report_backups()
+        mock_show.assert_called_once_with(None)
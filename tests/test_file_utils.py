@@ -83,4 +83,29 @@ class TestFileUtils(unittest.TestCase):
         fu.ensure_files_dir()
         mock_makedirs.assert_called_once()
 
+    # ------------------------------
+    # atomic_write()
+    # ------------------------------
+    def test_atomic_write_replaces_file(self):
+        path = os.path.join(self.TEST_DIR, "a.json")
+        with fu.atomic_write(path) as f:
+            f.write("new")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "new")
+        self.assertFalse(os.path.exists(path + ".tmp"))
+
+    def test_atomic_write_interrupted_keeps_old_file(self):
+        """写入中断（如 Ctrl-C）时旧文件保持不变"""
+        path = os.path.join(self.TEST_DIR, "a.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("old")
+
+        with self.assertRaises(KeyboardInterrupt):
+            with fu.atomic_write(path) as f:
+                f.write("half-writ")
+                raise KeyboardInterrupt
+
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "old")
+        self.assertFalse(os.path.exists(path + ".tmp"))
 
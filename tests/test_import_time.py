@@ -0,0 +1,47 @@
+"""
+Import-time regression tests.
+
+The package and the CLI entry point must start without importing heavy
+optional dependencies; matplotlib is only loaded when a chart is drawn and
+NumPy only when a RecordTable is used. Each check runs in a fresh
+interpreter so modules imported by other tests do not interfere.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("matplotlib", "numpy")
+
+
+def _loaded_after(statement: str):
+    """Run `statement` in a clean interpreter; return which heavy modules it loaded."""
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_package_import_is_light(self):
+        self.assertEqual(_loaded_after("import smartbudget"), [])
+
+    def test_entity_import_is_light(self):
+        self.assertEqual(_loaded_after("from smartbudget import Income, Expense"), [])
+
+    def test_cli_import_is_light(self):
+        self.assertEqual(_loaded_after("import main"), [])
+
+    def test_plotting_module_loads_matplotlib(self):
+        loaded = _loaded_after("import smartbudget.analysis_module_1.plotting")
+        self.assertIn("matplotlib", loaded)
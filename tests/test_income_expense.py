@@ -1,5 +1,6 @@
 import unittest
 import logging
+from datetime import date, datetime, timedelta, timezone
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import Expense
 from smartbudget.entity.base_record import SmartBudgetError
@@ -103,6 +104,54 @@ class TestIncomeExpense(unittest.TestCase):
         with self.assertRaises(SmartBudgetError):
             self.expense.category = 999  # 非字符串
 
+    # ------------------------------------------------------
+    # from_trusted_dict — 跳过校验的快速构造
+    # ------------------------------------------------------
+    def test_from_trusted_dict_round_trip(self):
+        inc = Income.from_trusted_dict(self.income.to_dict())
+        exp = Expense.from_trusted_dict(self.expense.to_dict())
+
+        self.assertIsInstance(inc, Income)
+        self.assertEqual(inc.to_dict(), self.income.to_dict())
+        self.assertEqual(exp.to_dict(), self.expense.to_dict())
+        self.assertIn("Expense Record", exp.describe())
+
+    def test_from_trusted_dict_legacy_negative_expense(self):
+        exp = Expense.from_trusted_dict(
+            {"type": "Expense", "name": "Old", "amount": -12, "category": "food"}
+        )
+        self.assertEqual(exp.amount, 12.0)
+
+    # ------------------------------------------------------
+    # timestamp — 可选时间戳
+    # ------------------------------------------------------
+    def test_timestamp_round_trip(self):
+        inc = Income("Salary", 3000, "Job", "2025-03-14T09:30:00")
+        self.assertEqual(inc.timestamp, datetime(2025, 3, 14, 9, 30))
+        self.assertEqual(inc.to_dict()["timestamp"], "2025-03-14T09:30:00")
+        self.assertIn("2025-03-14 09:30", inc.describe())
+
+        exp = Expense.from_trusted_dict(Expense("Rent", 1200, "Housing", date(2025, 3, 1)).to_dict())
+        self.assertEqual(exp.timestamp, datetime(2025, 3, 1))
+
+    def test_timestamp_is_optional(self):
+        self.assertIsNone(self.income.timestamp)
+        self.assertNotIn("timestamp", self.income.to_dict())
+        self.assertIsNone(Income.from_trusted_dict(self.income.to_dict()).timestamp)
+
+    def test_aware_timestamp_normalized_to_local(self):
+        stamp = datetime(2025, 3, 14, 9, 0, tzinfo=timezone(timedelta(hours=-7)))
+        local = stamp.astimezone().replace(tzinfo=None)
+        exp = Expense("Taxi", 9, "Transport", stamp)
+        self.assertEqual(exp.timestamp, local)
+        self.assertIsNone(exp.timestamp.tzinfo)
+
+    def test_invalid_timestamp(self):
+        with self.assertRaises(SmartBudgetError):
+            Income("Salary", 3000, "Job", "not a date")
+        with self.assertRaises(SmartBudgetError):
+            self.expense.timestamp = 12345
+
     def tearDown(self):
         logger.debug("[TestIncomeExpense] tearDown")
         self.income = None
@@ -16,7 +16,6 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from smartbudget.analysis_module_1.insights import (
-    _validate_record_types,
     _split_records,
     _load_split,
     income_details,
@@ -28,6 +27,7 @@ from smartbudget.entity.income import Income
 
 from smartbudget.entity.expense import Expense
 from smartbudget.entity.base_record import RecordBase
+from smartbudget.analysis_module_1.diagnostics import ValidationReport
 
 
 TEST_DIR = "files"
@@ -46,15 +46,6 @@ class TestAnalysisModule(unittest.TestCase):
         if os.path.exists(TEST_DIR):
             shutil.rmtree(TEST_DIR)
 
-    # ==================================================
-    # Test _validate_record_types
-    # ==================================================
-    @patch("smartbudget.analysis_module_1.insights.logger.warning")
-    def test_validate_record_types_warns_on_invalid(self, mock_warn):
-        data = [Income("A", 100, "job"), RecordBase("X", 10)]
-        _validate_record_types(data)
-        mock_warn.assert_called_once()
-
     # ==================================================
     # Test _split_records
     # ==================================================
@@ -76,6 +67,41 @@ class TestAnalysisModule(unittest.TestCase):
         self.assertEqual(len(incomes), 1)
         self.assertEqual(len(expenses), 0)
 
+    @patch("smartbudget.analysis_module_1.insights.logger.warning")
+    def test_split_records_fills_callers_report(self, mock_warn):
+        report = ValidationReport()
+        incomes, _ = _split_records([Income("A", 100, "job"), RecordBase("X", 10)], report)
+        self.assertEqual(len(incomes), 1)
+        self.assertEqual(report.counts, {"unsupported_type": 1})
+        mock_warn.assert_not_called()  # the caller emits the report
+
+    @patch("smartbudget.analysis_module_1.insights.logger.warning")
+    @patch("smartbudget.analysis_module_1.insights.load_from_json")
+    def test_load_split_reports_bad_amounts_once(self, mock_load, mock_warn):
+        missing = Income.__new__(Income)
+        invalid = Expense.__new__(Expense)
+        invalid._amount = "x"
+        mock_load.return_value = [missing, invalid, Income("A", 100, "job")]
+
+        incomes, expenses = _load_split()
+        # Bad amounts are reported but the records are kept
+        self.assertEqual((len(incomes), len(expenses)), (2, 1))
+        mock_warn.assert_called_once()
+        self.assertEqual(mock_warn.call_args[0][-1].counts,
+                         {"missing_amount": 1, "invalid_amount": 1})
+
+    @patch("smartbudget.analysis_module_1.insights.logger.warning")
+    @patch("smartbudget.analysis_module_1.insights.load_from_json")
+    def test_load_split_reports_once(self, mock_load, mock_warn):
+        mock_load.return_value = [RecordBase("X", 1)] * 50 + [Income("A", 100, "job")]
+
+        incomes, expenses = _load_split()
+        self.assertEqual(len(incomes), 1)
+        mock_warn.assert_called_once()
+        report = mock_warn.call_args[0][-1]
+        self.assertEqual(report.counts, {"unsupported_type": 50})
+        self.assertEqual(len(report.samples), 5)
+
     # ==================================================
     # Test _load_split success
     # ==================================================
@@ -150,6 +176,13 @@ class TestAnalysisModule(unittest.TestCase):
         output = expense_details()
         self.assertEqual(output, [])
 
+    def test_details_from_iterable(self):
+        stream = iter([Income("A", 100, "job"), Expense("B", 20, "food"), RecordBase("X", 1)])
+        self.assertEqual(len(expense_details(stream)), 1)
+
+        stream = iter([Income("A", 100, "job"), Expense("B", 20, "food")])
+        self.assertIn("Income Record", income_details(stream)[0])
+
     # ==================================================
     # plot_expense_by_category()
     # ==================================================
@@ -0,0 +1,172 @@
+import os
+import json
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.file_io_module_3 import journal_io, json_io
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+class TestJournalIO(unittest.TestCase):
+
+    TEST_DIR = "files"
+    TEST_FILE = "records.json"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+
+    def tearDown(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    # ----------------------------
+    # journal naming
+    # ----------------------------
+    def test_journal_name(self):
+        self.assertEqual(journal_io.journal_name("records.json"), "records.jsonl")
+        self.assertEqual(journal_io.journal_name("backup"), "backup.jsonl")
+
+    # ----------------------------
+    # append / read
+    # ----------------------------
+    def test_append_and_read(self):
+        rows = [Income("A", 1, "x").to_dict(), Expense("B", 2, "y").to_dict()]
+        written = journal_io.append_to_journal(rows, self.TEST_FILE)
+
+        self.assertGreater(written, 0)
+        self.assertEqual(journal_io.journal_size(self.TEST_FILE), written)
+        self.assertEqual(journal_io.read_journal(self.TEST_FILE), rows)
+
+    def test_append_nothing(self):
+        self.assertEqual(journal_io.append_to_journal([], self.TEST_FILE), 0)
+        self.assertFalse(os.path.exists(journal_io.journal_path(self.TEST_FILE)))
+
+    def test_append_is_one_write_with_fsync(self):
+        rows = [Income("A", 1, "x").to_dict()] * 3
+        with patch("smartbudget.file_io_module_3.journal_io.os.fsync") as mock_fsync:
+            journal_io.append_to_journal(rows, self.TEST_FILE)
+        mock_fsync.assert_called_once()
+
+    def test_torn_last_line_is_ignored(self):
+        journal_io.append_to_journal([Income("A", 1, "x").to_dict()], self.TEST_FILE)
+        with open(journal_io.journal_path(self.TEST_FILE), "a", encoding="utf-8") as f:
+            f.write('{"type": "Inc')
+
+        self.assertEqual(len(journal_io.read_journal(self.TEST_FILE)), 1)
+
+    def test_append_after_torn_line_truncates_it(self):
+        journal_io.append_to_journal([Income("A", 1, "x").to_dict()], self.TEST_FILE)
+        with open(journal_io.journal_path(self.TEST_FILE), "a", encoding="utf-8") as f:
+            f.write('{"type": "Inc')
+
+        journal_io.append_to_journal([Income("B", 2, "x").to_dict()], self.TEST_FILE)
+        self.assertEqual([r["name"] for r in journal_io.read_journal(self.TEST_FILE)], ["A", "B"])
+
+    def test_append_after_torn_only_line(self):
+        with open(journal_io.journal_path(self.TEST_FILE), "w", encoding="utf-8") as f:
+            f.write('{"type": "Inc')
+        self.assertEqual(journal_io.truncate_torn_tail(self.TEST_FILE), 13)
+        self.assertEqual(journal_io.journal_size(self.TEST_FILE), 0)
+        self.assertEqual(journal_io.truncate_torn_tail(self.TEST_FILE), 0)
+
+    def test_corrupt_middle_line_raises(self):
+        with open(journal_io.journal_path(self.TEST_FILE), "w", encoding="utf-8") as f:
+            f.write('not json\n{"type": "Income"}\n')
+
+        with self.assertRaises(json.JSONDecodeError):
+            journal_io.read_journal(self.TEST_FILE)
+
+    def test_read_missing_journal(self):
+        self.assertEqual(journal_io.read_journal(self.TEST_FILE), [])
+        self.assertFalse(journal_io.clear_journal(self.TEST_FILE))
+
+    # ----------------------------
+    # compaction
+    # ----------------------------
+    def test_compact_folds_into_existing_array(self):
+        # A pre-journal records.json is read and extended in place
+        path = os.path.join(self.TEST_DIR, self.TEST_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"type": "Income", "name": "Old", "amount": 5, "source": "s"}], f)
+
+        json_io.append_to_json([Expense("New", 3, "food")], self.TEST_FILE)
+        moved = journal_io.compact_journal(self.TEST_FILE)
+
+        self.assertEqual(moved, 1)
+        self.assertFalse(os.path.exists(journal_io.journal_path(self.TEST_FILE)))
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual([d["name"] for d in data], ["Old", "New"])
+
+    def test_compact_empty_journal(self):
+        self.assertEqual(journal_io.compact_journal(self.TEST_FILE), 0)
+
+    def test_should_compact_threshold(self):
+        json_io.save_to_json([Income("A", 1, "x")], self.TEST_FILE)
+        journal_io.append_to_journal([Income("B", 2, "x").to_dict()] * 10, self.TEST_FILE)
+        self.assertFalse(journal_io.should_compact(self.TEST_FILE))
+
+        with patch.object(journal_io, "COMPACT_MIN_BYTES", 1):
+            self.assertTrue(journal_io.should_compact(self.TEST_FILE))
+
+    def test_append_to_json_compacts_when_journal_outgrows_snapshot(self):
+        with patch.object(journal_io, "COMPACT_MIN_BYTES", 1):
+            json_io.append_to_json([Income("A", 1, "x")], self.TEST_FILE)
+
+        self.assertEqual(journal_io.journal_size(self.TEST_FILE), 0)
+        self.assertEqual(len(json_io.load_from_json(self.TEST_FILE)), 1)
+
+    # ----------------------------
+    # crash safety (write-ahead marker)
+    # ----------------------------
+    def _snapshot_names(self):
+        with open(os.path.join(self.TEST_DIR, self.TEST_FILE), encoding="utf-8") as f:
+            return [row["name"] for row in json.load(f)]
+
+    def test_interrupted_snapshot_write_keeps_old_ledger(self):
+        json_io.save_to_json([Income("Old", 1, "x")], self.TEST_FILE)
+        json_io.append_to_json([Income("Journal", 2, "x")], self.TEST_FILE)
+
+        with patch("smartbudget.file_io_module_3.journal_io.json.dump", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                json_io.save_to_json([Income("New", 3, "x")], self.TEST_FILE)
+
+        self.assertEqual(self._snapshot_names(), ["Old"])
+        self.assertEqual([r.name for r in json_io.load_from_json(self.TEST_FILE)], ["Old", "Journal"])
+        self.assertFalse(os.path.exists(os.path.join(self.TEST_DIR, self.TEST_FILE + ".tmp")))
+
+    def test_replace_interrupted_after_marker_is_completed(self):
+        json_io.save_to_json([Income("Old", 1, "x")], self.TEST_FILE)
+        json_io.append_to_json([Income("Journal", 2, "x")], self.TEST_FILE)
+
+        # Crash right after the marker is durable, before the rename
+        with patch.object(journal_io, "_finish_replace", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                json_io.save_to_json([Income("New", 3, "x")], self.TEST_FILE)
+        self.assertTrue(os.path.exists(journal_io.wal_path(self.TEST_FILE)))
+
+        self.assertEqual([r.name for r in json_io.load_from_json(self.TEST_FILE)], ["New"])
+        self.assertFalse(os.path.exists(journal_io.wal_path(self.TEST_FILE)))
+        self.assertEqual(journal_io.journal_size(self.TEST_FILE), 0)
+
+    def test_recover_discards_unmarked_temp_file(self):
+        json_io.save_to_json([Income("Old", 1, "x")], self.TEST_FILE)
+        tmp = os.path.join(self.TEST_DIR, self.TEST_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("[{\"type\": \"Inc")
+
+        self.assertFalse(journal_io.recover_ledger(self.TEST_FILE))
+        self.assertFalse(os.path.exists(tmp))
+        self.assertEqual(self._snapshot_names(), ["Old"])
+
+    def test_clear_json_is_crash_safe(self):
+        json_io.save_to_json([Income("Old", 1, "x")], self.TEST_FILE)
+        with patch.object(journal_io, "_finish_replace", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                json_io.clear_json(self.TEST_FILE)
+        self.assertEqual(json_io.load_from_json(self.TEST_FILE), [])
+
@@ -1,7 +1,10 @@
 import os
 import json
 import shutil
+import io
+import types
 import unittest
+from unittest.mock import patch
 from smartbudget.file_io_module_3 import json_io
 from smartbudget.entity.income import Income
 from smartbudget.entity.expense import Expense
@@ -89,6 +92,81 @@ class TestJsonIO(unittest.TestCase):
         self.assertEqual(records[0].name, "Salary")
         self.assertEqual(records[1].amount, 50)   # Expense should convert to positive via abs()
 
+    def test_load_from_json_trusted(self):
+        records = [Income("Salary", 3000, "Work"), Expense("Food", 50, "Daily")]
+        json_io.save_to_json(records, self.TEST_FILE)
+        json_io.append_to_json([Expense("Bus", 3, "Transit")], self.TEST_FILE)
+
+        validated = json_io.load_from_json(self.TEST_FILE)
+        trusted = json_io.load_from_json(self.TEST_FILE, validate=False)
+
+        self.assertEqual([type(r) for r in trusted], [Income, Expense, Expense])
+        self.assertEqual([r.to_dict() for r in trusted], [r.to_dict() for r in validated])
+
+    def test_load_from_json_keeps_timestamps(self):
+        json_io.save_to_json([Income("Salary", 3000, "Work", "2025-03-01T09:00:00")], self.TEST_FILE)
+        json_io.append_to_json([Expense("Bus", 3, "Transit", "2025-03-02"), Expense("Old", 1, "x")], self.TEST_FILE)
+
+        for validate in (True, False):
+            records = json_io.load_from_json(self.TEST_FILE, validate=validate)
+            self.assertEqual(
+                [r.to_dict().get("timestamp") for r in records],
+                ["2025-03-01T09:00:00", "2025-03-02T00:00:00", None],
+            )
+
+    # ----------------------------
+    # parsed-records cache
+    # ----------------------------
+    def test_unchanged_ledger_is_not_reparsed(self):
+        json_io.save_to_json([Income("Salary", 3000, "Work")], self.TEST_FILE)
+        first = json_io.load_from_json(self.TEST_FILE)
+
+        with patch("smartbudget.file_io_module_3.json_io.json.load") as mock_load:
+            second = json_io.load_from_json(self.TEST_FILE)
+        mock_load.assert_not_called()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first[0], second[0])
+        second.clear()
+        self.assertEqual(len(json_io.load_from_json(self.TEST_FILE)), 1)
+
+    def test_writes_invalidate_cache(self):
+        json_io.save_to_json([Income("Salary", 3000, "Work")], self.TEST_FILE)
+        json_io.load_from_json(self.TEST_FILE)
+
+        json_io.append_to_json([Expense("Bus", 3, "Transit")], self.TEST_FILE)
+        self.assertEqual(len(json_io.load_from_json(self.TEST_FILE)), 2)
+
+        json_io.save_to_json([Income("Bonus", 10, "Work")], self.TEST_FILE)
+        self.assertEqual([r.name for r in json_io.load_from_json(self.TEST_FILE)], ["Bonus"])
+
+        json_io.clear_json(self.TEST_FILE)
+        self.assertEqual(json_io.load_from_json(self.TEST_FILE), [])
+
+    def test_external_change_is_detected(self):
+        json_io.save_to_json([Income("Salary", 3000, "Work")], self.TEST_FILE)
+        json_io.load_from_json(self.TEST_FILE)
+
+        path = os.path.join(self.TEST_DIR, self.TEST_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"type": "Income", "name": "Edited by hand", "amount": 1, "source": "x"}], f)
+
+        self.assertEqual(json_io.load_from_json(self.TEST_FILE)[0].name, "Edited by hand")
+
+    def test_cache_is_lru_bounded(self):
+        json_io.clear_record_cache()
+        with patch.object(json_io, "RECORD_CACHE_SIZE", 2):
+            for name in ("a.json", "b.json", "c.json"):
+                json_io.save_to_json([Income(name, 1, "x")], name)
+                json_io.load_from_json(name)
+            json_io.load_from_json("b.json")
+
+            cached = [os.path.basename(path) for path, _ in json_io._record_cache]
+            self.assertEqual(cached, ["c.json", "b.json"])
+
+        json_io.clear_record_cache()
+        self.assertEqual(len(json_io._record_cache), 0)
+
     # ----------------------------
     # append_to_json()
     # ----------------------------
@@ -97,18 +175,49 @@ class TestJsonIO(unittest.TestCase):
 
         json_io.append_to_json([Expense("B", 20, "Food")], self.TEST_FILE)
 
+        # The snapshot is untouched; the new record lives in the journal
         path = os.path.join(self.TEST_DIR, self.TEST_FILE)
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
+        self.assertEqual(len(data), 1)
 
-        self.assertEqual(len(data), 2)
-        self.assertEqual(data[1]["type"], "Expense")
+        records = json_io.load_from_json(self.TEST_FILE)
+        self.assertEqual(len(records), 2)
+        self.assertIsInstance(records[1], Expense)
+
+    def test_append_to_json_creates_snapshot(self):
+        json_io.append_to_json([Income("A", 100, "X")], self.TEST_FILE)
+
+        path = os.path.join(self.TEST_DIR, self.TEST_FILE)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(len(json_io.load_from_json(self.TEST_FILE)), 1)
+
+    def test_append_after_crash_mid_append(self):
+        from smartbudget.file_io_module_3.journal_io import journal_path
+
+        json_io.append_to_json([Income("A", 100, "X")], self.TEST_FILE)
+        with open(journal_path(self.TEST_FILE), "a", encoding="utf-8") as f:
+            f.write('{"type": "Expense", "na')
+        json_io.append_to_json([Expense("B", 20, "Food")], self.TEST_FILE)
+
+        records = json_io.load_from_json(self.TEST_FILE)
+        self.assertEqual([r.name for r in records], ["A", "B"])
+        self.assertEqual(json_io.load_totals(self.TEST_FILE)["count"], 2)
+
+    def test_save_to_json_drops_journal(self):
+        json_io.append_to_json([Income("A", 100, "X")], self.TEST_FILE)
+        json_io.save_to_json([Expense("B", 20, "Food")], self.TEST_FILE)
+
+        records = json_io.load_from_json(self.TEST_FILE)
+        self.assertEqual(len(records), 1)
+        self.assertIsInstance(records[0], Expense)
 
     # ----------------------------
     # clear_json()
     # ----------------------------
     def test_clear_json(self):
         json_io.save_to_json([Income("X", 100, "Y")], self.TEST_FILE)
+        json_io.append_to_json([Income("Z", 5, "Y")], self.TEST_FILE)
 
         result = json_io.clear_json(self.TEST_FILE)
 
@@ -119,4 +228,36 @@ class TestJsonIO(unittest.TestCase):
             data = json.load(f)
 
         self.assertEqual(data, [])
+        self.assertEqual(json_io.load_from_json(self.TEST_FILE), [])
+
+    # ----------------------------
+    # iter_records() streaming
+    # ----------------------------
+    def test_iter_records_is_lazy_generator(self):
+        json_io.save_to_json([Income("A", 1, "X"), Expense("B", 2, "Y")], self.TEST_FILE)
+        json_io.append_to_json([Expense("C", 3, "Y")], self.TEST_FILE)
+
+        stream = json_io.iter_records(self.TEST_FILE)
+        self.assertIsInstance(stream, types.GeneratorType)
+        self.assertEqual([r.name for r in stream], ["A", "B", "C"])
+
+    def test_iter_records_missing_file(self):
+        self.assertEqual(list(json_io.iter_records("nothing.json")), [])
+        self.assertFalse(os.path.exists(os.path.join(self.TEST_DIR, "nothing.json")))
+
+    def test_iter_json_array_across_chunk_boundaries(self):
+        items = [{"type": "Income", "name": f"N{i}", "amount": i + 1.5, "source": "s"}
+                 for i in range(50)] + [12345, "tail"]
+        text = json.dumps(items, indent=4)
+
+        # Tiny chunks force items and scalars to be split mid-token
+        for size in (1, 3, 7, 64):
+            streamed = list(json_io._iter_json_array(io.StringIO(text), chunk_size=size))
+            self.assertEqual(streamed, items)
 
+    def test_iter_json_array_rejects_bad_input(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(json_io._iter_json_array(io.StringIO('{"a": 1}')))
+        with self.assertRaises(json.JSONDecodeError):
+            list(json_io._iter_json_array(io.StringIO('[{"a": 1},')))
+        self.assertEqual(list(json_io._iter_json_array(io.StringIO(" [ ] "))), [])
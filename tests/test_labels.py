@@ -0,0 +1,60 @@
+import unittest
+
+from smartbudget.entity.labels import LabelRegistry, CATEGORIES, SOURCES
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.analysis_module_1.insights import _group_totals
+
+
+class TestLabelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = LabelRegistry("category")
+
+    def test_register_normalizes_and_dedupes(self):
+        first = self.registry.register("Food")
+        self.assertEqual(self.registry.register(" food "), first)
+        self.assertEqual(self.registry.register("FOOD"), first)
+        self.assertEqual(self.registry.label(first), "food")
+        self.assertEqual(len(self.registry), 1)
+
+    def test_ids_are_compact_and_ordered(self):
+        ids = [self.registry.register(c) for c in ("rent", "food", "rent", "travel")]
+        self.assertEqual(ids, [0, 1, 0, 2])
+        self.assertEqual(self.registry.labels(), ["rent", "food", "travel"])
+
+    def test_id_of_does_not_register(self):
+        self.assertIsNone(self.registry.id_of("rent"))
+        self.assertNotIn("rent", self.registry)
+
+        self.registry.register("Rent")
+        self.assertEqual(self.registry.id_of(" RENT"), 0)
+        self.assertIn("rent", self.registry)
+        self.assertIn("category", repr(self.registry))
+
+    def test_labels_are_shared_objects(self):
+        a = Expense("A", 1, "Groceries")
+        b = Expense.from_trusted_dict({"name": "B", "amount": 2, "category": "groceries"})
+        self.assertIs(a.category, b.category)
+        self.assertEqual(a.category_id, b.category_id)
+        self.assertEqual(a.category_id, CATEGORIES.id_of("groceries"))
+
+
+class TestRecordLabelIds(unittest.TestCase):
+
+    def test_setters_update_ids(self):
+        exp = Expense("Taxi", 10, "Transport")
+        exp.category = "Travel"
+        self.assertEqual(exp.category, "travel")
+        self.assertEqual(exp.category_id, CATEGORIES.id_of("travel"))
+
+        inc = Income("Pay", 10, "Job")
+        inc.source = "Bonus"
+        self.assertEqual(inc.source_id, SOURCES.id_of("bonus"))
+
+    def test_group_totals_by_id(self):
+        records = [Expense("A", 5, "Food"), Expense("B", 7, "rent"), Expense("C", 3, "food ")]
+        self.assertEqual(_group_totals(records, "category"), {"food": 8, "rent": 7})
+
+        incomes = [Income("A", 5, "Job"), Income("B", 2, "job")]
+        self.assertEqual(_group_totals(incomes, "source"), {"job": 7})
@@ -0,0 +1,77 @@
+"""
+Test suite for map-reduce reports across ledger files.
+"""
+
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.analysis_module_1 import multi_ledger
+from smartbudget.file_io_module_3 import json_io, aggregate_store
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import SmartBudgetError
+from smartbudget import __main__ as cli
+
+
+TEST_DIR = "files"
+
+
+class TestMultiLedger(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+        os.makedirs(TEST_DIR, exist_ok=True)
+
+        json_io.save_to_json([Income("Salary", 3000, "Job"), Expense("Rent", 1200, "Housing")], "home.json")
+        json_io.save_to_json([Income("Grant", 500, "City"), Expense("Paper", 40, "Office")], "dept.json")
+        json_io.append_to_json([Expense("Toner", 60, "Office")], "dept.json")
+        json_io.save_to_json([Income("Main", 1, "x")], "records.json")
+        json_io.load_totals("home.json")   # one ledger with a totals store
+
+    def tearDown(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+
+    def test_ledger_files(self):
+        self.assertEqual(multi_ledger.ledger_files(), ["dept.json", "home.json"])
+        self.assertIn("records.json", multi_ledger.ledger_files(include_primary=True))
+
+    def test_aggregate_ledgers_serial_and_parallel(self):
+        for workers in (1, 2):
+            report = multi_ledger.aggregate_ledgers(workers=workers)
+            combined = report["combined"]
+
+            self.assertEqual(sorted(report["ledgers"]), ["dept.json", "home.json"])
+            self.assertEqual(combined["count"], 5)
+            self.assertEqual(combined["income"], 3500)
+            self.assertEqual(combined["expenses"], 1300)
+            self.assertEqual(combined["by_category"], {"housing": 1200, "office": 100})
+            self.assertEqual(multi_ledger.balance(combined), 2200)
+
+    def test_map_step_does_not_write_stores(self):
+        multi_ledger.aggregate_ledgers(["dept.json"], workers=1)
+        self.assertFalse(os.path.exists(aggregate_store.totals_path("dept.json")))
+
+    def test_map_step_reuses_fresh_store(self):
+        with patch("smartbudget.analysis_module_1.multi_ledger.iter_raw_records") as mock_scan:
+            totals = multi_ledger.ledger_totals("home.json")
+        mock_scan.assert_not_called()
+        self.assertEqual(totals["income"], 3000)
+
+    def test_missing_ledger(self):
+        with self.assertRaises(SmartBudgetError):
+            multi_ledger.aggregate_ledgers(["home.json", "nope.json"])
+
+    def test_empty_selection(self):
+        report = multi_ledger.aggregate_ledgers([])
+        self.assertEqual(report["combined"], aggregate_store.empty_totals())
+
+    @patch("builtins.print")
+    def test_cli_report(self, mock_print):
+        self.assertEqual(cli.main(["report", "--workers", "1"]), 0)
+        out = "\n".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("home.json", out)
+        self.assertEqual(cli.main(["report", "nope.json"]), 1)
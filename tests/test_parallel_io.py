@@ -0,0 +1,181 @@
+import os
+import json
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.file_io_module_3 import parallel_io, json_io, aggregate_store
+from smartbudget.file_io_module_3.journal_io import journal_path, append_to_journal
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import RecordBase, SmartBudgetError
+
+
+class TestParallelIO(unittest.TestCase):
+
+    TEST_DIR = "files"
+    TEST_FILE = "records.json"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+
+        json_io.save_to_json([Income("Salary", 3000, "Job"), Expense("Rent", 1200, "Housing")], self.TEST_FILE)
+        self.rows = [
+            Expense(f"Item {i}", i + 1, "Food" if i % 2 else "Travel", f"2025-0{i % 9 + 1}-01").to_dict()
+            for i in range(200)
+        ]
+        append_to_journal(self.rows, self.TEST_FILE)
+        self.journal = journal_path(self.TEST_FILE)
+
+    def tearDown(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    # ----------------------------
+    # sharding
+    # ----------------------------
+    def test_shard_ranges_cover_file_on_line_boundaries(self):
+        ranges = parallel_io.shard_ranges(self.journal, 7, min_shard_bytes=1)
+        self.assertEqual(len(ranges), 7)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.journal))
+
+        with open(self.journal, "rb") as f:
+            data = f.read()
+        for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, next_start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_small_files_use_one_shard(self):
+        self.assertEqual(len(parallel_io.shard_ranges(self.journal, 8)), 1)
+        self.assertEqual(parallel_io.shard_ranges("missing.jsonl", 4), [])
+
+    def write_snapshot(self, count):
+        json_io.save_to_json([Income(f"Pay {i}", i + 1, "Job", "2025-01-01") for i in range(count)],
+                             self.TEST_FILE)
+        return os.path.join(self.TEST_DIR, self.TEST_FILE)
+
+    def test_snapshot_ranges_split_on_items(self):
+        path = self.write_snapshot(50)
+        ranges = parallel_io.snapshot_ranges(path, 4, min_shard_bytes=1)
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(ranges[-1][1], os.path.getsize(path))
+
+        rows = []
+        for i, (start, end) in enumerate(ranges):
+            rows.extend(parallel_io._snapshot_shard_rows(path, start, end, i == len(ranges) - 1))
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(rows, json.load(f))
+
+    def test_single_line_snapshot_is_one_range(self):
+        path = os.path.join(self.TEST_DIR, "flat.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([r for r in self.rows], f)
+        self.assertEqual(len(parallel_io.snapshot_ranges(path, 4, min_shard_bytes=1)), 1)
+
+    def test_misleading_layout_falls_back_to_whole_snapshot(self):
+        path = os.path.join(self.TEST_DIR, self.TEST_FILE)
+        os.remove(self.journal)
+        # Nested objects on lines of their own, at the item indent
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('[\n    {"type": "Income", "name": "A", "amount": 5, "source": "job", "meta":\n'
+                    '    {"note": "x"}},\n    {"type": "Expense", "name": "B", "amount": 2, '
+                    '"category": "food"}\n]')
+        with patch.object(parallel_io, "MIN_SHARD_BYTES", 1):
+            loaded = parallel_io.load_parallel(self.TEST_FILE, workers=3)
+        self.assertEqual([r.name for r in loaded], ["A", "B"])
+
+    # ----------------------------
+    # loading
+    # ----------------------------
+    def test_workers_return_rows(self):
+        rows = parallel_io._load_shard(self.journal, 0, os.path.getsize(self.journal), True, True)
+        self.assertEqual(rows, self.rows)
+
+    def test_split_snapshot_matches_serial(self):
+        self.write_snapshot(300)
+        append_to_journal(self.rows, self.TEST_FILE)
+        with patch.object(parallel_io, "MIN_SHARD_BYTES", 1):
+            loaded = parallel_io.load_parallel(self.TEST_FILE, workers=4)
+            totals = parallel_io.totals_parallel(self.TEST_FILE, workers=4)
+        serial = json_io.load_from_json(self.TEST_FILE)
+
+        self.assertEqual([r.to_dict() for r in loaded], [r.to_dict() for r in serial])
+        self.assertEqual(totals["count"], 500)
+
+    def test_load_parallel_matches_serial(self):
+        with patch.object(parallel_io, "MIN_SHARD_BYTES", 1):
+            self.assertEqual(len(parallel_io.shard_ranges(self.journal, 3)), 3)
+            loaded = parallel_io.load_parallel(self.TEST_FILE, workers=4)
+        serial = json_io.load_from_json(self.TEST_FILE)
+
+        self.assertEqual([r.to_dict() for r in loaded], [r.to_dict() for r in serial])
+        self.assertEqual(loaded[3].category, "food")
+
+    def test_load_from_json_workers(self):
+        records = json_io.load_from_json(self.TEST_FILE, workers=2)
+        self.assertEqual(len(records), 202)
+        self.assertEqual(len(json_io.load_from_json(self.TEST_FILE, as_table=True, workers=2)), 202)
+
+    def test_load_jsonl_parallel_validates(self):
+        with open(self.journal, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "Income", "name": "", "amount": 5, "source": "x"}) + "\n")
+
+        with self.assertRaises(SmartBudgetError):
+            parallel_io.load_jsonl_parallel(self.journal, workers=2)
+        self.assertEqual(len(parallel_io.load_jsonl_parallel(self.journal, workers=2, validate=False)), 201)
+
+    def test_torn_last_line_is_skipped(self):
+        with open(self.journal, "a", encoding="utf-8") as f:
+            f.write('{"type": "Income", "na')
+        self.assertEqual(len(parallel_io.load_jsonl_parallel(self.journal, workers=1)), 200)
+
+    def test_torn_line_then_append_loads_in_shards(self):
+        with open(self.journal, "a", encoding="utf-8") as f:
+            f.write('{"type": "Income", "na')
+        append_to_journal([Income("Late", 5, "job").to_dict()], self.TEST_FILE)
+
+        with patch.object(parallel_io, "MIN_SHARD_BYTES", 1):
+            loaded = parallel_io.load_jsonl_parallel(self.journal, workers=3)
+        self.assertEqual(len(loaded), 201)
+        self.assertEqual(loaded[-1].name, "Late")
+
+    def test_records_pickle_by_label(self):
+        import pickle
+        record = pickle.loads(pickle.dumps(Expense("Taxi", 9, "Transport", "2025-03-01")))
+        self.assertEqual(record.category, "transport")
+        self.assertEqual(record.timestamp.year, 2025)
+        self.assertIsInstance(pickle.loads(pickle.dumps(RecordBase("Misc", 7))), RecordBase)
+
+    # ----------------------------
+    # partial aggregates
+    # ----------------------------
+    def test_totals_parallel_matches_serial(self):
+        with patch.object(parallel_io, "MIN_SHARD_BYTES", 1):
+            totals = parallel_io.totals_parallel(self.TEST_FILE, workers=3)
+
+        serial = aggregate_store.aggregate_rows(json_io.iter_raw_records(self.TEST_FILE))
+        self.assertTrue(aggregate_store.totals_equal(totals, serial))
+        self.assertEqual(totals["count"], 202)
+
+    @patch("smartbudget.file_io_module_3.json_io._use_workers", return_value=True)
+    def test_load_totals_recovers_before_parallel_rebuild(self, _mock):
+        from smartbudget.file_io_module_3 import journal_io
+
+        good = os.path.join(self.TEST_DIR, self.TEST_FILE)
+        # Crash after the marker was written but before the rename
+        with open(good + ".tmp", "w", encoding="utf-8") as f:
+            json.dump([Income("New", 10, "job").to_dict()], f, indent=4)
+        with open(journal_io.wal_path(self.TEST_FILE), "w", encoding="utf-8") as f:
+            json.dump({"op": "replace_snapshot", "snapshot": self.TEST_FILE}, f)
+
+        totals = json_io.load_totals(self.TEST_FILE, workers=2)
+        self.assertEqual(totals["count"], 1)
+        self.assertEqual(totals["income"], 10)
+
+    def test_load_totals_rebuilds_in_parallel(self):
+        totals = json_io.load_totals(self.TEST_FILE, workers=2)
+        self.assertEqual(totals["income"], 3000)
+        self.assertTrue(json_io.verify_totals(self.TEST_FILE))
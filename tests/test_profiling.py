@@ -0,0 +1,124 @@
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from smartbudget import profiling, stats
+from smartbudget import __main__ as cli
+import smartbudget.core_module_2.app_menu_controller as app_menu
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix="smartbudget-profile-")
+        stats.reset()
+
+    def tearDown(self):
+        profiling.stop()
+        stats.disable()
+        stats.reset()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def trace_events(self, session):
+        with open(session.trace_path, encoding="utf-8") as f:
+            return json.load(f)["traceEvents"]
+
+    def spans(self, session, category):
+        return [e for e in self.trace_events(session) if e.get("cat") == category]
+
+    # ----------------------------
+    # inactive
+    # ----------------------------
+    def test_inactive_is_noop(self):
+        self.assertFalse(profiling.is_active())
+        self.assertIs(profiling.action("a"), profiling.action("b"))
+        with profiling.action("summary"):
+            pass
+        self.assertEqual(os.listdir(self.dir), [])
+
+    # ----------------------------
+    # trace events
+    # ----------------------------
+    def test_action_span_with_nested_timers(self):
+        session = profiling.start(self.dir)
+        with profiling.action("summary", choice="3"):
+            with stats.timer("json.parse"):
+                pass
+
+        menu = self.spans(session, "menu")
+        nested = self.spans(session, "stats")
+        self.assertEqual([e["name"] for e in menu], ["summary"])
+        self.assertEqual(menu[0]["args"], {"choice": "3"})
+        self.assertEqual([e["name"] for e in nested], ["json.parse"])
+        self.assertGreaterEqual(nested[0]["ts"], menu[0]["ts"])
+        self.assertLessEqual(nested[0]["ts"] + nested[0]["dur"], menu[0]["ts"] + menu[0]["dur"])
+
+    def test_trace_written_after_each_action(self):
+        session = profiling.start(self.dir)
+        with profiling.action("add_income"):
+            pass
+        self.assertEqual(len(self.spans(session, "menu")), 1)
+
+    def test_span_recorded_on_exception(self):
+        session = profiling.start(self.dir)
+        with self.assertRaises(RuntimeError):
+            with profiling.action("backup"):
+                raise RuntimeError("boom")
+        self.assertEqual([e["name"] for e in self.spans(session, "menu")], ["backup"])
+
+    def test_cprofile_file_per_action(self):
+        session = profiling.start(self.dir, cprofile=True)
+        with profiling.action("summary"):
+            sum(range(1000))
+        with profiling.action("summary"):
+            pass
+
+        files = sorted(f for f in os.listdir(self.dir) if f.endswith(".pstats"))
+        self.assertEqual(len(files), 2)
+        self.assertTrue(files[0].endswith("-001-summary.pstats"))
+        pstats.Stats(os.path.join(self.dir, files[0]))
+        self.assertTrue(os.path.exists(session.trace_path))
+
+    def test_stop_restores_stats(self):
+        profiling.start(self.dir)
+        self.assertTrue(stats.is_enabled())
+        profiling.stop()
+        self.assertFalse(stats.is_enabled())
+        self.assertFalse(profiling.is_active())
+
+    # ----------------------------
+    # menu integration
+    # ----------------------------
+    @patch("builtins.input", side_effect=["7", "42", "0"])
+    @patch("builtins.print")
+    @patch("smartbudget.core_module_2.app_menu_controller.FileIoDataStorageController.show_files")
+    def test_run_profiles_each_dispatch(self, mock_show, mock_print, mock_input):
+        session = profiling.start(self.dir)
+        app_menu.run()
+
+        names = [e["name"] for e in self.spans(session, "menu")]
+        self.assertEqual(names, ["list", "invalid", "exit"])
+        mock_show.assert_called_once()
+
+    def test_env_var(self):
+        with patch.dict(os.environ, {profiling.PROFILE_ENV_VAR: self.dir,
+                                     profiling.CPROFILE_ENV_VAR: "1"}):
+            self.assertTrue(profiling.configure_from_env())
+        self.assertTrue(profiling._session.cprofile)
+        with patch.dict(os.environ, {profiling.PROFILE_ENV_VAR: ""}):
+            profiling.stop()
+            self.assertFalse(profiling.configure_from_env())
+
+    @patch("smartbudget.__main__.run")
+    def test_cli_flag(self, mock_run):
+        self.assertEqual(cli.main(["--profile", self.dir, "--cprofile"]), 0)
+        self.assertTrue(profiling.is_active())
+        self.assertTrue(profiling._session.cprofile)
+
+
+if __name__ == "__main__":
+    unittest.main()
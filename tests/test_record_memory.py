@@ -0,0 +1,73 @@
+"""
+Memory benchmark for the slotted record classes.
+
+Allocates a batch of records under tracemalloc and compares the per-record
+footprint with an equivalent __dict__-based layout (how the entity classes
+stored their fields before __slots__ was introduced).
+"""
+
+import gc
+import logging
+import tracemalloc
+import unittest
+
+from smartbudget.entity.base_record import RecordBase
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+logger = logging.getLogger(__name__)
+
+BATCH = 20_000
+
+
+class _DictExpense:
+    """Reference layout: same three fields kept in a per-instance __dict__."""
+
+    def __init__(self, name, amount, category):
+        self._name = name
+        self._amount = float(amount)
+        self._category = category
+
+
+def _bytes_per_record(factory) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        batch = [factory(i) for i in range(BATCH)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del batch
+    return (after - before) / BATCH
+
+
+class TestRecordMemory(unittest.TestCase):
+
+    def test_records_have_no_instance_dict(self):
+        for record in (RecordBase("A", 1), Income("A", 1, "job"), Expense("A", 1, "food")):
+            self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_slotted_expense_is_smaller_than_dict_layout(self):
+        # Shared labels, as in a real ledger, so only per-record cost is measured
+        name, category = "Lunch", "food"
+
+        slotted = _bytes_per_record(lambda i: Expense.from_trusted_dict(
+            {"name": name, "amount": i + 1, "category": category}))
+        dict_based = _bytes_per_record(lambda i: _DictExpense(name, i + 1, category))
+
+        logger.info(f"[memory] slotted={slotted:.1f} B/record, dict={dict_based:.1f} B/record")
+        # ~30% smaller on CPython 3.10/3.11; newer versions shrink the dict layout too
+        self.assertLess(slotted, dict_based)
+
+    def test_api_unchanged(self):
+        exp = Expense("Taxi", 15, "Transport")
+        exp.category = "Travel"
+        exp.amount = 20
+        self.assertEqual(exp.to_dict(), {
+            "type": "Expense", "name": "Taxi", "amount": 20.0, "category": "travel",
+        })
+        self.assertIn("travel", exp.describe())
+
+        with self.assertRaises(AttributeError):
+            exp.note = "not a declared field"
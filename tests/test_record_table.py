@@ -0,0 +1,111 @@
+import os
+import shutil
+import unittest
+
+import numpy as np
+
+from smartbudget.entity.record_table import RecordTable, TYPE_INCOME, TYPE_EXPENSE
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import RecordBase
+from smartbudget.file_io_module_3 import json_io
+from smartbudget.analysis_module_1.session import AnalysisSession
+
+
+class TestRecordTable(unittest.TestCase):
+
+    TEST_DIR = "files"
+    TEST_FILE = "records.json"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+
+        self.records = [
+            Income("Salary", 3000, "Job"),
+            Expense("Rent", 1200, "Housing"),
+            Expense("Lunch", 15.5, "Food"),
+            Income("Gift", 200, "Family"),
+            Expense("Dinner", 30, "Food"),
+            RecordBase("Misc", 7),
+        ]
+
+    def tearDown(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    # ----------------------------
+    # construction
+    # ----------------------------
+    def test_columns(self):
+        table = RecordTable.from_records(self.records)
+
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table.amounts.dtype, np.float64)
+        self.assertEqual(list(table.types[:3]), [TYPE_INCOME, TYPE_EXPENSE, TYPE_EXPENSE])
+        # "food" is stored once and shared by both food rows
+        self.assertEqual(table.label_codes[2], table.label_codes[4])
+        self.assertEqual(table.labels.count("food"), 1)
+
+    def test_legacy_negative_expense(self):
+        table = RecordTable.from_rows([
+            {"type": "Expense", "name": "Old", "amount": -20, "category": "food"},
+        ])
+        self.assertEqual(table.total_expenses(), 20)
+
+    def test_row_and_to_records_round_trip(self):
+        table = RecordTable.from_records(self.records)
+
+        self.assertEqual(table.row(1), self.records[1].to_dict())
+        self.assertEqual([r.to_dict() for r in table.to_records()],
+                         [r.to_dict() for r in self.records])
+
+    def test_timestamps_column(self):
+        self.records[0].timestamp = "2025-03-01T09:00:00"
+        table = RecordTable.from_records(self.records)
+
+        self.assertEqual(table.timestamps.dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(int(np.isnat(table.timestamps).sum()), len(self.records) - 1)
+        self.assertEqual(table.row(0)["timestamp"], "2025-03-01T09:00:00")
+        self.assertEqual(table.to_records()[0].timestamp, self.records[0].timestamp)
+
+    # ----------------------------
+    # vectorized analytics
+    # ----------------------------
+    def test_matches_object_analytics(self):
+        table = RecordTable.from_records(self.records)
+        session = AnalysisSession.from_records(self.records)
+
+        self.assertEqual(table.total_income(), session.total_income())
+        self.assertEqual(table.total_expenses(), session.total_expenses())
+        self.assertEqual(table.budget_balance(), session.budget_balance())
+        self.assertEqual(table.expense_by_category(), session.expense_by_category())
+        self.assertEqual(table.income_by_source(), session.income_by_source())
+
+    def test_empty_table(self):
+        table = RecordTable.from_rows([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.budget_balance(), 0)
+        self.assertEqual(table.expense_by_category(), {})
+        self.assertIn("rows=0", repr(table))
+
+    # ----------------------------
+    # load_from_json(as_table=True)
+    # ----------------------------
+    def test_load_from_json_as_table(self):
+        json_io.save_to_json(self.records[:3], self.TEST_FILE)
+        json_io.append_to_json(self.records[3:5], self.TEST_FILE)
+
+        for validate in (True, False):
+            table = json_io.load_from_json(self.TEST_FILE, validate=validate, as_table=True)
+            self.assertIsInstance(table, RecordTable)
+            self.assertEqual(len(table), 5)
+            self.assertEqual(table.total_income(), 3200)
+            self.assertEqual(table.expense_by_category(), {"housing": 1200, "food": 45.5})
+
+    def test_lazy_package_export(self):
+        import smartbudget.entity as entity
+        self.assertIs(entity.RecordTable, RecordTable)
+        with self.assertRaises(AttributeError):
+            entity.NotAThing
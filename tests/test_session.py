@@ -0,0 +1,94 @@
+"""
+Test suite for AnalysisSession.
+
+Verifies that a session loads records.json exactly once and answers totals,
+balance, details and category aggregates from that single snapshot.
+"""
+
+import os
+import json
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.analysis_module_1.session import AnalysisSession
+from smartbudget.file_io_module_3 import json_io
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import RecordBase
+
+
+TEST_DIR = "files"
+TEST_FILE = "records.json"
+
+
+class TestAnalysisSession(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+        os.makedirs(TEST_DIR, exist_ok=True)
+
+        sample = [
+            {"type": "Income", "name": "Salary", "amount": 3000, "source": "job"},
+            {"type": "Income", "name": "Gift", "amount": 200, "source": "family"},
+            {"type": "Expense", "name": "Rent", "amount": 1200, "category": "housing"},
+            {"type": "Expense", "name": "Lunch", "amount": -15.5, "category": "food"},
+            {"type": "Expense", "name": "Dinner", "amount": 30, "category": "food"},
+        ]
+        with open(os.path.join(TEST_DIR, TEST_FILE), "w") as f:
+            json.dump(sample, f)
+
+    def tearDown(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+
+    # ==================================================
+    # Loading
+    # ==================================================
+    def test_load_reads_file_once(self):
+        with patch("smartbudget.analysis_module_1.insights.load_from_json",
+                   wraps=json_io.load_from_json) as mock_load:
+            session = AnalysisSession.load()
+            session.total_income()
+            session.total_expenses()
+            session.budget_balance()
+            session.expense_details()
+            session.expense_by_category()
+
+        mock_load.assert_called_once()
+
+    def test_from_records_skips_unsupported(self):
+        session = AnalysisSession.from_records([
+            Income("A", 100, "job"),
+            RecordBase("X", 5),
+            Expense("B", 40, "food"),
+        ])
+        self.assertEqual(len(session.incomes), 1)
+        self.assertEqual(len(session.expenses), 1)
+
+    # ==================================================
+    # Figures
+    # ==================================================
+    def test_totals_and_balance(self):
+        session = AnalysisSession.load()
+        self.assertEqual(session.total_income(), 3200)
+        self.assertEqual(session.total_expenses(), 1245.5)
+        self.assertEqual(session.budget_balance(), 1954.5)
+
+    def test_details(self):
+        session = AnalysisSession.load()
+        self.assertEqual(len(session.income_details()), 2)
+        self.assertEqual(len(session.expense_details()), 3)
+        self.assertIn("Expense Record", session.expense_details()[0])
+
+    def test_group_aggregates(self):
+        session = AnalysisSession.load()
+        self.assertEqual(session.expense_by_category(), {"housing": 1200, "food": 45.5})
+        self.assertEqual(session.income_by_source(), {"job": 3000, "family": 200})
+
+    def test_empty_session(self):
+        session = AnalysisSession([], [])
+        self.assertEqual(session.budget_balance(), 0)
+        self.assertEqual(session.expense_by_category(), {})
+        self.assertIn("incomes=0", repr(session))
@@ -0,0 +1,153 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+from smartbudget import stats
+from smartbudget import __main__ as cli
+from smartbudget.analysis_module_1 import summary
+from smartbudget.file_io_module_3 import json_io
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+class TestStats(unittest.TestCase):
+
+    TEST_DIR = "files"
+
+    def setUp(self):
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+        os.makedirs(self.TEST_DIR, exist_ok=True)
+        json_io.clear_record_cache()
+        stats.reset()
+        # Never leave the exit hook behind after a test
+        patcher = patch("smartbudget.stats.atexit.register")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        stats.disable()
+        stats.reset()
+        json_io.clear_record_cache()
+        if os.path.exists(self.TEST_DIR):
+            shutil.rmtree(self.TEST_DIR)
+
+    # ----------------------------
+    # disabled
+    # ----------------------------
+    def test_disabled_records_nothing(self):
+        self.assertIs(stats.timer("a"), stats.timer("b"))
+        with stats.timer("a"):
+            pass
+        stats.count("c")
+        self.assertEqual(stats.report(), {"timers": {}, "counters": {}})
+
+    def test_timed_passes_through(self):
+        @stats.timed("f")
+        def f(x):
+            return x * 2
+
+        self.assertEqual(f(4), 8)
+        self.assertEqual(f.__name__, "f")
+        self.assertEqual(stats.report()["timers"], {})
+
+    # ----------------------------
+    # enabled
+    # ----------------------------
+    def test_timers_and_counters(self):
+        stats.enable()
+        for _ in range(3):
+            with stats.timer("block"):
+                pass
+        stats.count("rows", 5)
+        stats.count("rows", 2)
+
+        data = stats.report()
+        self.assertEqual(data["timers"]["block"]["count"], 3)
+        self.assertEqual(data["counters"], {"rows": 7})
+        for key in ("total_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"):
+            self.assertGreaterEqual(data["timers"]["block"][key], 0)
+
+    def test_timer_records_on_exception(self):
+        stats.enable()
+        with self.assertRaises(ValueError):
+            with stats.timer("failing"):
+                raise ValueError("boom")
+        self.assertEqual(stats.report()["timers"]["failing"]["count"], 1)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(stats.percentile(values, 50), 50)
+        self.assertEqual(stats.percentile(values, 95), 95)
+        self.assertEqual(stats.percentile(values, 99), 99)
+        self.assertEqual(stats.percentile([7], 99), 7)
+        self.assertEqual(stats.percentile([], 50), 0)
+
+    def test_hot_paths_are_instrumented(self):
+        json_io.save_to_json([Income("Salary", 100, "job"), Expense("Food", 20, "meal")])
+        json_io.append_to_json([Expense("Bus", 3, "transport")])
+        stats.enable()
+
+        summary.budget_balance()
+        json_io.load_from_json()
+
+        data = stats.report()
+        for name in ("json.read", "json.parse", "records.construct",
+                     "validate.split", "summary.budget_balance", "analysis.load_split"):
+            self.assertIn(name, data["timers"])
+        self.assertEqual(data["counters"]["records.loaded"], 3)
+        self.assertEqual(data["counters"]["cache.hit"], 1)
+
+    def test_format_and_dump(self):
+        stats.enable()
+        with stats.timer("block"):
+            pass
+        stats.count("rows")
+
+        text = stats.format_report()
+        self.assertIn("block", text)
+        self.assertIn("rows", text)
+
+        path = os.path.join(tempfile.mkdtemp(), "stats.json")
+        try:
+            stats.dump(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["counters"], {"rows": 1})
+        finally:
+            shutil.rmtree(os.path.dirname(path))
+
+    def test_report_at_exit_goes_to_stderr(self):
+        stats.enable()
+        stats.count("rows")
+        err = io.StringIO()
+        with redirect_stderr(err):
+            stats._report_at_exit()
+        self.assertIn("SmartBudget Stats", err.getvalue())
+
+    # ----------------------------
+    # switches
+    # ----------------------------
+    def test_env_var(self):
+        with patch.dict(os.environ, {stats.STATS_ENV_VAR: "0"}):
+            self.assertFalse(stats.configure_from_env())
+        with patch.dict(os.environ, {stats.STATS_ENV_VAR: "1"}):
+            self.assertTrue(stats.configure_from_env())
+            self.assertIsNone(stats._dump_path)
+        with patch.dict(os.environ, {stats.STATS_ENV_VAR: "out.json"}):
+            stats.configure_from_env()
+            self.assertEqual(stats._dump_path, "out.json")
+
+    @patch("smartbudget.__main__.run")
+    def test_cli_flag(self, mock_run):
+        self.assertEqual(cli.main(["--stats"]), 0)
+        self.assertTrue(stats.is_enabled())
+        mock_run.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
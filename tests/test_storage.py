@@ -0,0 +1,158 @@
+"""
+Test suite for the pluggable storage backends.
+
+Every backend must behave the same through the StorageBackend interface;
+SQLite-specific checks cover its indexes and SUM-based totals.
+"""
+
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.file_io_module_3 import aggregate_store
+from smartbudget.file_io_module_3.storage import JsonStorage, StorageBackend, open_storage
+from smartbudget.file_io_module_3.sqlite_io import SqliteStorage
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+from smartbudget.entity.base_record import RecordBase, SmartBudgetError
+from smartbudget import __main__ as cli
+
+
+TEST_DIR = "files"
+
+
+def sample_records():
+    return [
+        Income("Salary", 3000, "Job", "2025-02-28T09:00:00"),
+        Expense("Rent", 1200, "Housing", "2025-03-01"),
+        Expense("Lunch", 15.5, "Food", "2025-03-14T12:30:00"),
+        Expense("Old", 5, "Food"),
+        RecordBase("Misc", 7),
+    ]
+
+
+class _BackendContract:
+    """Shared checks run against each backend."""
+
+    def make_storage(self) -> StorageBackend:
+        raise NotImplementedError
+
+    def setUp(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+        os.makedirs(TEST_DIR, exist_ok=True)
+        self.storage = self.make_storage()
+
+    def tearDown(self):
+        self.storage.close()
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+
+    def test_empty(self):
+        self.assertEqual(self.storage.load(), [])
+        self.assertEqual(self.storage.totals(), aggregate_store.empty_totals())
+
+    def test_save_load_round_trip(self):
+        self.storage.save(sample_records())
+        loaded = self.storage.load()
+        self.assertEqual([r.to_dict() for r in loaded], [r.to_dict() for r in sample_records()])
+        self.assertEqual([type(r) for r in loaded], [type(r) for r in sample_records()])
+
+    def test_append_and_clear(self):
+        self.storage.save(sample_records()[:2])
+        self.storage.append(sample_records()[2:])
+        self.assertEqual(len(self.storage.load(validate=False)), 5)
+
+        self.storage.clear()
+        self.assertEqual(self.storage.load(), [])
+
+    def test_totals_match_full_aggregate(self):
+        self.storage.save(sample_records())
+        expected = aggregate_store.aggregate_rows(r.to_dict() for r in sample_records())
+        self.assertTrue(aggregate_store.totals_equal(self.storage.totals(), expected))
+
+    def test_records_between(self):
+        self.storage.save(sample_records())
+        march = self.storage.records_between("2025-03-01", "2025-04-01")
+        self.assertEqual([r.name for r in march], ["Rent", "Lunch"])
+        self.assertEqual([r.name for r in self.storage.records_between(end="2025-03-01")], ["Salary"])
+
+    def test_backup_is_json_ledger(self):
+        self.storage.save(sample_records())
+        self.storage.backup("backup.json")
+        restored = JsonStorage("backup.json").load()
+        self.assertEqual([r.to_dict() for r in restored], [r.to_dict() for r in sample_records()])
+
+
+class TestJsonStorage(_BackendContract, unittest.TestCase):
+
+    def make_storage(self):
+        return JsonStorage("records.json")
+
+
+class TestSqliteStorage(_BackendContract, unittest.TestCase):
+
+    def make_storage(self):
+        return SqliteStorage("records.db")
+
+    def test_indexes_are_used(self):
+        conn = self.storage._connection()
+        plan = " ".join(str(row) for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT SUM(amount) FROM records WHERE type = 'Expense' AND label = 'food'"))
+        self.assertIn("idx_records_type_label", plan)
+
+        plan = " ".join(str(row) for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM records WHERE timestamp >= '2025-03-01'"))
+        self.assertIn("idx_records_timestamp", plan)
+
+    def test_failed_append_is_rolled_back(self):
+        self.storage.save(sample_records()[:1])
+        broken = RecordBase.from_trusted_dict({"name": None, "amount": 1})  # violates NOT NULL
+        with self.assertRaises(Exception):
+            self.storage.append([Income("Bonus", 10, "Job"), broken])
+        self.assertEqual(len(self.storage.load()), 1)
+
+    def test_data_survives_reopen(self):
+        self.storage.append(sample_records())
+        self.storage.close()
+        self.assertEqual(len(SqliteStorage("records.db").load()), 5)
+
+
+class TestOpenStorage(unittest.TestCase):
+
+    def tearDown(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+
+    def test_by_name_and_env(self):
+        self.assertIsInstance(open_storage("json"), JsonStorage)
+        self.assertIsInstance(open_storage("SQLite"), SqliteStorage)
+        with patch.dict(os.environ, {"SMARTBUDGET_STORAGE": "sqlite"}):
+            self.assertEqual(open_storage().filename, "records.db")
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(open_storage().filename, "records.json")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(SmartBudgetError):
+            open_storage("csv")
+
+    def test_filename_must_match_backend(self):
+        self.assertEqual(open_storage("sqlite", "house.sqlite3").filename, "house.sqlite3")
+        self.assertEqual(open_storage("json", "house.json").filename, "house.json")
+        with self.assertRaises(SmartBudgetError):
+            open_storage("sqlite", "house.json")
+        with self.assertRaises(SmartBudgetError):
+            open_storage("json", "house.db")
+
+    @patch("builtins.print")
+    def test_cli_import_into_sqlite(self, mock_print):
+        os.makedirs(TEST_DIR, exist_ok=True)
+        path = os.path.join(TEST_DIR, "in.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("type,name,amount,category,source\nexpense,Rent,1200,Housing,\n")
+
+        self.assertEqual(cli.main(["import", path, "--storage", "sqlite"]), 0)
+        storage = SqliteStorage()
+        self.assertEqual(storage.totals()["expenses"], 1200)
+        storage.close()
@@ -11,7 +11,11 @@ behavior across the SmartBudget package.
 import unittest
 import logging
 from unittest.mock import patch
-from smartbudget.analysis_module_1.summary import total_income, total_expenses, budget_balance
+from smartbudget.analysis_module_1.summary import (
+    total_income, total_expenses, budget_balance, _safe_sum
+)
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +50,27 @@ class TestSummary(unittest.TestCase):
         self.assertIsInstance(budget_balance(), (int, float))
         self.assertNotEqual(budget_balance(), None)
 
+    @patch("smartbudget.analysis_module_1.summary._load_split")
+    def test_streamed_records(self, mock_load):
+        logger.debug("[TestSummary] Running test_streamed_records")
+
+        def stream():
+            yield Income("Pay", 100, "job")
+            yield Expense("Food", 30, "food")
+            yield Income("Gift", 50, "family")
+
+        self.assertEqual(total_income(stream()), 150)
+        self.assertEqual(total_expenses(stream()), 30)
+        self.assertEqual(budget_balance(stream()), 120)
+        mock_load.assert_not_called()
+
+    @patch("smartbudget.analysis_module_1.summary.logger.error")
+    def test_unreadable_amounts_reported_once(self, mock_error):
+        bad = [type("Obj", (), {"amount": "n/a"})() for _ in range(20)]
+        self.assertEqual(_safe_sum(self.mock_income + bad), 150)
+        mock_error.assert_called_once()
+        self.assertEqual(mock_error.call_args[0][-1].counts, {"unreadable_amount": 20})
+
     def tearDown(self):
         logger.debug("[TestSummary] tearDown: clearing temporary containers")
         self.mock_income = None
@@ -0,0 +1,93 @@
+"""
+Test suite for monthly trend reports.
+
+Verifies that the (period x category) / (period x source) rollups are kept
+current by appends and that trend reports read them without rescanning.
+"""
+
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from smartbudget.analysis_module_1 import trends
+from smartbudget.file_io_module_3 import aggregate_store, json_io
+from smartbudget.entity.income import Income
+from smartbudget.entity.expense import Expense
+
+
+TEST_DIR = "files"
+TEST_FILE = "records.json"
+
+
+class TestTrends(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+        os.makedirs(TEST_DIR, exist_ok=True)
+
+        json_io.save_to_json([
+            Income("Salary", 3000, "Job", "2025-01-31"),
+            Expense("Rent", 1200, "Housing", "2025-01-01"),
+            Income("Salary", 3100, "Job", "2025-02-28"),
+            Expense("Rent", 1200, "Housing", "2025-02-01"),
+            Expense("Lunch", 20, "Food", "2025-02-14T12:00:00"),
+            Expense("Old", 5, "Food"),
+        ], TEST_FILE)
+
+    def tearDown(self):
+        if os.path.exists(TEST_DIR):
+            shutil.rmtree(TEST_DIR)
+
+    # ----------------------------
+    # rollup cube
+    # ----------------------------
+    def test_period_key(self):
+        self.assertEqual(aggregate_store.period_key({"timestamp": "2025-03-14T09:00:00"}), "2025-03")
+        self.assertEqual(aggregate_store.period_key({}), aggregate_store.UNDATED_PERIOD)
+
+    def test_rollups_in_totals(self):
+        totals = json_io.load_totals(TEST_FILE)
+        self.assertEqual(totals["by_period_category"]["2025-02"], {"housing": 1200, "food": 20})
+        self.assertEqual(totals["by_period_source"]["2025-01"], {"job": 3000})
+        self.assertEqual(totals["by_period_category"]["undated"], {"food": 5})
+
+    def test_append_updates_rollups_incrementally(self):
+        json_io.load_totals(TEST_FILE)
+        json_io.append_to_json([Expense("Dinner", 30, "Food", "2025-02-20")], TEST_FILE)
+
+        with patch("smartbudget.file_io_module_3.json_io.iter_raw_records") as mock_scan:
+            self.assertEqual(trends.category_trend("Food", TEST_FILE), {"2025-02": 50})
+        mock_scan.assert_not_called()
+        self.assertTrue(json_io.verify_totals(TEST_FILE))
+
+    def test_merge_totals_combines_rollups(self):
+        merged = aggregate_store.merge_totals(json_io.load_totals(TEST_FILE), json_io.load_totals(TEST_FILE))
+        self.assertEqual(merged["by_period_category"]["2025-02"]["food"], 40)
+
+    # ----------------------------
+    # reports
+    # ----------------------------
+    def test_monthly_totals(self):
+        report = trends.monthly_totals(TEST_FILE)
+        self.assertEqual(report, [
+            {"period": "2025-01", "income": 3000, "expenses": 1200, "balance": 1800},
+            {"period": "2025-02", "income": 3100, "expenses": 1220, "balance": 1880},
+        ])
+
+        with_undated = trends.monthly_totals(TEST_FILE, include_undated=True)
+        self.assertEqual(with_undated[-1]["period"], "undated")
+        self.assertEqual(trends.monthly_totals(TEST_FILE, start="2025-02")[0]["period"], "2025-02")
+        self.assertEqual(trends.monthly_totals(TEST_FILE, end="2024-12"), [])
+
+    def test_category_and_source_trends(self):
+        self.assertEqual(trends.category_trend(" HOUSING ", TEST_FILE), {"2025-01": 1200, "2025-02": 1200})
+        self.assertEqual(trends.source_trend("job", TEST_FILE, end="2025-01"), {"2025-01": 3000})
+        self.assertEqual(trends.category_trend("travel", TEST_FILE), {})
+
+    def test_period_breakdown(self):
+        breakdown = trends.period_breakdown("2025-02", TEST_FILE)
+        self.assertEqual(breakdown["by_category"], {"housing": 1200, "food": 20})
+        self.assertEqual(breakdown["by_source"], {"job": 3100})
+        self.assertEqual(trends.period_breakdown("1999-01", TEST_FILE)["by_source"], {})